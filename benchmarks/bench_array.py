@@ -0,0 +1,73 @@
+"""
+Benchmark for ``Array.parse`` on large numeric lists. Compares the current implementation, that
+only creates a new list if an element changes while parsing, with the previous one, that always
+built a second list.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_array.py
+"""
+
+# -- STL Imports --
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+# -- Package Imports --
+from parasite import p
+from parasite.array import Array
+from parasite.errors import ValidationError
+
+SIZE = 100_000
+NUMBER = 20
+
+
+def parse_legacy(schema: Array, obj: Any) -> list[Any]:
+    """Previous implementation of ``Array.parse`` (without length checks)."""
+    if not isinstance(obj, list):
+        raise ValidationError(f"object has to be a list, but is {obj!r}")
+
+    cache = []
+
+    for i, element in enumerate(obj):
+        try:
+            cache.append(schema._m_element.parse(element))  # type: ignore
+
+        except ValidationError as exc:
+            raise ValidationError(f"element at index {i} is invalid: {exc}") from exc
+
+    return cache
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    """Returns the peak of newly allocated memory (in bytes) during one call."""
+    tracemalloc.start()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+
+    func()
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - current
+
+
+def main() -> None:
+    schema = p.array(p.number())
+    compiled = schema.compile("codegen")
+    data = [float(i) for i in range(SIZE)]
+
+    print(f"Array(Number).parse with {SIZE} elements, {NUMBER} iterations")
+    print(f"{'':<10}{'time/parse':>14}{'peak bytes/parse':>20}")
+
+    for name, func in [
+        ("legacy", lambda: parse_legacy(schema, data)),
+        ("current", lambda: schema.parse(data)),
+        ("codegen", lambda: compiled.parse(data)),
+    ]:
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{name:<10}{seconds * 1e3:>12.2f}ms{peak_memory(func):>20}")
+
+
+if __name__ == "__main__":
+    main()
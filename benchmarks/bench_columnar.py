@@ -0,0 +1,57 @@
+"""
+Benchmark for ``Array.parse_columnar`` on a table of records. Compares row-wise parsing with
+``Array.parse`` against column-wise parsing.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_columnar.py
+"""
+
+# -- STL Imports --
+import copy
+import timeit
+
+# -- Package Imports --
+from parasite import p
+
+ROWS = 100_000
+NUMBER = 3
+
+
+def main() -> None:
+    schema = p.array(
+        p.obj(
+            {
+                "id": p.number().integer().gte(0),
+                "price": p.number().gt(0).lt(1e6),
+                "quantity": p.number().integer().gte(1).lte(1000),
+                "name": p.string().min(1).max(64),
+                "sku": p.string().starts_with("SKU-"),
+            }
+        )
+    )
+    rows = [
+        {
+            "id": i,
+            "price": i + 0.99,
+            "quantity": i % 1000 + 1,
+            "name": f"item {i}",
+            "sku": f"SKU-{i}",
+        }
+        for i in range(ROWS)
+    ]
+
+    assert schema.parse(copy.deepcopy(rows)) == schema.parse_columnar(copy.deepcopy(rows))
+
+    print(f"Array(Object) with {ROWS} rows and 5 columns, {NUMBER} iterations")
+
+    for name, func in [
+        ("parse", lambda: schema.parse(rows)),
+        ("parse_columnar", lambda: schema.parse_columnar(rows)),
+    ]:
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=3)) / NUMBER
+        print(f"{name:<16}{seconds * 1e3:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
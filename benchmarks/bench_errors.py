@@ -0,0 +1,69 @@
+"""
+Benchmark for failed parses. Compares the lazy ``ValidationError``, that only formats its message
+when it is accessed, with eager formatting (as before), which is simulated by formatting the
+message in the constructor. Failed parses are common inside ``Variant`` (every failing branch
+raises) and the ``*_safe`` methods, that mostly discard the error.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_errors.py
+"""
+
+# -- STL Imports --
+import contextlib
+import timeit
+from typing import Any, Callable, Iterator
+
+# -- Package Imports --
+from parasite import p
+from parasite.errors import ValidationError
+
+NUMBER = 5_000
+
+
+@contextlib.contextmanager
+def eager() -> Iterator[None]:
+    """Formats the message of every ``ValidationError`` as soon as it is created."""
+    init = ValidationError.__init__
+
+    def eager_init(self: ValidationError, *args: Any, **kwargs: Any) -> None:
+        init(self, *args, **kwargs)
+        _ = self.message
+
+    ValidationError.__init__ = eager_init  # type: ignore
+    try:
+        yield
+
+    finally:
+        ValidationError.__init__ = init  # type: ignore
+
+
+def main() -> None:
+    record = p.obj({"id": p.number().integer(), "name": p.string().min(1)})
+    variant = p.variant([p.number().integer(), p.string().uuid(), record, p.null()])
+    compiled = variant.compile("codegen")
+    rows = p.array(record)
+    number = p.number().integer().gte(0)
+    data = {"id": "1", "name": "x" * 100}
+    table = [{"id": i, "name": "x"} for i in range(10)] + [{"id": 1.5, "name": "x"}]
+
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("variant", lambda: variant.parse_safe(data)),
+        ("variant/codegen", lambda: compiled.parse_safe(data)),
+        ("array/safe", lambda: rows.parse_safe(table)),
+        ("number/safe", lambda: number.parse_safe(-1)),
+    ]
+
+    print(f"failed parses, {NUMBER} iterations")
+    print(f"{'':<18}{'eager':>12}{'lazy':>12}{'speedup':>10}")
+
+    for name, func in cases:
+        with eager():
+            before = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+
+        after = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{name:<18}{before * 1e6:>10.2f}us{after * 1e6:>10.2f}us{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark for the validators of string formats. Compares the regexes of :mod:`parasite._const`
+with the validators, that :func:`parasite.string.String` uses for each format (see
+:mod:`parasite._formats`).
+
+Also compares a ``Variant`` of one string per format with a single string, that matches all formats
+at once (see :func:`parasite.string.String.one_of_formats`), for values of the last format.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_formats.py
+"""
+
+# -- STL Imports --
+import timeit
+from typing import Any, Callable
+
+# -- Package Imports --
+from parasite import _const, _formats, p
+
+NUMBER = 100_000
+
+FORMATS: list[tuple[str, Callable[[str], Any], Callable[[str], Any], list[str]]] = [
+    ("ipv4", _const.RE_IPV4.match, _formats.ipv4, ["192.168.100.200", "10.0.0.1"]),
+    ("ipv4/invalid", _const.RE_IPV4.match, _formats.ipv4, ["192.168.100.256", "hello"]),
+    (
+        "ipv6",
+        _const.RE_IPV6.match,
+        _const.RE_IPV6.match,
+        ["2001:db8::8a2e:370:7334", "fe80::1ff:fe23:4567:890a"],
+    ),
+    ("uuid", _const.RE_UUID.match, _const.RE_UUID.match, ["123e4567-e89b-42d3-a456-426614174000"]),
+    ("ulid", _const.RE_ULID.match, _const.RE_ULID.match, ["01ARZ3NDEKTSV4RRFFQ69G5FAV"]),
+]
+
+ONE_OF = ["uuid", "ulid", "cuid2"]
+ONE_OF_VALUES = ["abc1", "k5z7qh2n0v"]
+
+
+def _time(check: Callable[[str], Any], values: list[str]) -> float:
+    runs = timeit.repeat(lambda: [check(value) for value in values], number=NUMBER, repeat=5)
+    return min(runs) / NUMBER / len(values)
+
+
+def main() -> None:
+    print(f"validation of string formats, {NUMBER} iterations")
+    print(f"{'':<14}{'regex':>12}{'selected':>12}{'speedup':>10}")
+
+    for name, regex, selected, values in FORMATS:
+        before, after = _time(regex, values), _time(selected, values)
+        print(f"{name:<14}{before * 1e9:>10.0f}ns{after * 1e9:>10.0f}ns{before / after:>9.2f}x")
+
+    print(f"\none of {ONE_OF}, {NUMBER} iterations")
+    print(f"{'':<14}{'variant':>12}{'one_of':>12}{'speedup':>10}")
+
+    variant = p.variant([getattr(p.string(), name)() for name in ONE_OF])
+    one_of = p.string().one_of_formats(ONE_OF)
+
+    for backend in ["interpreted", "closure", "codegen"]:
+        if backend == "interpreted":
+            before, after = _time(variant.parse, ONE_OF_VALUES), _time(one_of.parse, ONE_OF_VALUES)
+        else:
+            before = _time(variant.compile(backend).parse, ONE_OF_VALUES)
+            after = _time(one_of.compile(backend).parse, ONE_OF_VALUES)
+
+        print(f"{backend:<14}{before * 1e9:>10.0f}ns{after * 1e9:>10.0f}ns{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
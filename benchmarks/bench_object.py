@@ -0,0 +1,71 @@
+"""
+Benchmark for the hot path of ``Object.parse``. Compares the current sentinel based protocol
+between objects and their children (``_find_and_parse_raw``) with the previous ``Option`` based
+one, that allocated a ``Some``, a lambda and a one-element dictionary per key.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_object.py
+"""
+
+# -- STL Imports --
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+# -- Package Imports --
+from parasite import p
+from parasite.errors import ValidationError
+from parasite.object import Object
+
+KEYS = 20
+NUMBER = 20_000
+
+
+def parse_legacy(schema: Object, obj: Any) -> dict[Any, Any]:
+    """Previous implementation of ``Object.parse`` (without strict and strip handling)."""
+    if not isinstance(obj, dict):
+        raise ValidationError(f"object has to be a dictionary, but is {obj!r}")
+
+    for key, item in schema._m_items.items():
+        item._find_and_parse(obj, key).map(lambda x, k=key: obj.update({k: x}))
+
+    return obj
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    """Returns the peak of temporarily allocated memory (in bytes) during one call."""
+    func()
+    tracemalloc.start()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+
+    func()
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - current
+
+
+def main() -> None:
+    schema = p.obj({f"key{i}": p.any() for i in range(KEYS)})
+    data = {f"key{i}": i for i in range(KEYS)}
+
+    def legacy() -> Any:
+        return parse_legacy(schema, dict(data))
+
+    def current() -> Any:
+        return schema.parse(dict(data))
+
+    assert legacy() == current()
+
+    print(f"Object.parse with {KEYS} keys, {NUMBER} iterations")
+    print(f"{'':<10}{'time/parse':>14}{'peak bytes/parse':>20}")
+
+    for name, func in [("legacy", legacy), ("current", current)]:
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{name:<10}{seconds * 1e6:>12.2f}us{peak_memory(func):>20}")
+
+
+if __name__ == "__main__":
+    main()
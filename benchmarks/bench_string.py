@@ -0,0 +1,111 @@
+"""
+Benchmark for strings. Compares the cost of the email format (parsing with ``p.string().email()``
+minus parsing with ``p.string()``) with a single match of :data:`parasite._const.RE_EMAIL`, which
+is the most that validating an email should cost. A ratio well above 1 (e.g. the regex running
+twice, or output on every value) is a regression.
+
+Also times strings with a growing number of constraints, where an unconstrained ``p.string()``
+should cost little more than an ``isinstance`` check, as only the active constraints run, and
+repeated values with and without caching the format validation (see
+:func:`parasite.string.String.cached`), and oversized values, that should be rejected by their
+length, before any regex runs (see :func:`parasite.string.String.format_limit`).
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_string.py
+"""
+
+# -- STL Imports --
+import timeit
+from functools import partial
+from typing import Any, Callable
+
+# -- Package Imports --
+from parasite import _const, _formats, p
+
+NUMBER = 50_000
+
+VALUES: dict[str, list[str]] = {
+    "valid": ["john.doe@example.com", "jane+news@mail.example.org"],
+    "invalid": ["John.Doe@example.com", "john.doe@example..com", "x" * 1_000 + "@example.com"],
+}
+
+SCHEMAS: dict[str, Any] = {
+    "plain": p.string(),
+    "min": p.string().min(1),
+    "trim": p.string().trim(),
+    "all": p.string().min(1).max(64).starts_with("john").contains("@").email().to_lower(),
+}
+
+OVERSIZED: dict[str, str] = {
+    "uuid": "1" * 1_000_000,
+    "ipv6": "1:" * 500_000,
+    "url": "https://" + "a" * 1_000_000 + " ",
+    "cuid2": "a" * 1_000_000 + "!",
+}
+
+
+def _time(func: Callable[[str], Any], values: list[str]) -> float:
+    runs = timeit.repeat(lambda: [func(value) for value in values], number=NUMBER, repeat=5)
+    return min(runs) / NUMBER / len(values)
+
+
+def main() -> None:
+    parsers: dict[str, tuple[Callable[[str], Any], Callable[[str], Any]]] = {
+        "interpreted": (p.string().parse_safe, p.string().email().parse_safe),
+        "closure": (
+            p.string().compile("closure").parse_safe,
+            p.string().email().compile("closure").parse_safe,
+        ),
+        "codegen": (
+            p.string().compile("codegen").parse_safe,
+            p.string().email().compile("codegen").parse_safe,
+        ),
+    }
+
+    print(f"email validation, {NUMBER} iterations")
+    print(f"{'':<22}{'regex':>12}{'format':>12}{'ratio':>10}")
+
+    for kind, values in VALUES.items():
+        regex = _time(_const.RE_EMAIL.match, values)
+
+        for backend, (plain, email) in parsers.items():
+            timing = _time(email, values) - _time(plain, values)
+            name = f"{kind}/{backend}"
+            print(f"{name:<22}{regex * 1e9:>10.0f}ns{timing * 1e9:>10.0f}ns{timing / regex:>9.2f}x")
+
+    print(f"\nconstraints, {NUMBER} iterations")
+    print(f"{'':<22}" + "".join(f"{backend:>14}" for backend in parsers))
+
+    values = VALUES["valid"][:1]
+    for name, schema in SCHEMAS.items():
+        timings = [_time(schema.parse_safe, values)]
+        for backend in ["closure", "codegen"]:
+            timings.append(_time(schema.compile(backend).parse_safe, values))
+
+        print(f"{name:<22}" + "".join(f"{timing * 1e9:>12.0f}ns" for timing in timings))
+
+    print(f"\nrepeated values, {NUMBER} iterations")
+    print(f"{'':<22}{'uncached':>12}{'cached':>12}")
+
+    values = VALUES["valid"] + VALUES["invalid"]
+    for name, schema in [("email", p.string().email()), ("url", p.string().url())]:
+        timings = [_time(schema.parse_safe, values), _time(schema.cached().parse_safe, values)]
+        print(f"{name:<22}" + "".join(f"{timing * 1e9:>10.0f}ns" for timing in timings))
+
+    print("\noversized values (1 MB), 20 iterations")
+    print(f"{'':<22}{'regex':>12}{'schema':>12}")
+
+    for name, value in OVERSIZED.items():
+        schema = getattr(p.string(), name)()
+        if name == "cuid2":
+            schema.format_limit(32)
+
+        timings = [
+            min(timeit.repeat(partial(check, value), number=20)) / 20
+            for check in (_formats.PATTERNS[name].match, schema.parse_safe)
+        ]
+        print(f"{name:<22}" + "".join(f"{timing * 1e6:>10.1f}us" for timing in timings))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark for discriminated unions. Compares a ``Variant`` of many event objects, that tries every
+object in order, with the same ``Variant`` looking up the object by its ``"type"`` key (see
+:func:`parasite.variant.Variant.discriminator`), and with an adaptive ``Variant``, that tries the
+most frequent object first (see :func:`parasite.variant.Variant.adaptive`). The last event type is
+the worst case for the ordered variant, as every other object fails first.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_variant.py
+"""
+
+# -- STL Imports --
+import timeit
+from functools import partial
+from typing import Any, Callable
+
+# -- Package Imports --
+from parasite import p
+from parasite.variant import ADAPT_INTERVAL, Variant
+
+EVENTS = 40
+NUMBER = 2_000
+
+
+def events() -> Variant:
+    """Creates a variant with one object per event type."""
+    return p.variant(
+        [
+            p.obj({"type": p.string().literal(f"event{i}"), "id": p.number().integer()})
+            for i in range(EVENTS)
+        ]
+    )
+
+
+def main() -> None:
+    data = {"type": f"event{EVENTS - 1}", "id": 1}
+
+    print(f"last of {EVENTS} event types, {NUMBER} iterations")
+    print(f"{'':<14}{'ordered':>12}{'tagged':>12}{'adaptive':>12}")
+
+    for backend in ["interpreted", "closure", "codegen"]:
+        timings = []
+        adaptive = events().adaptive()
+
+        # let the adaptive variant learn the order of the traffic
+        for _ in range(ADAPT_INTERVAL):
+            adaptive.parse(data)
+
+        for variant in [events(), events().discriminator("type"), adaptive]:
+            parse: Callable[[Any], Any] = variant.parse
+            if backend != "interpreted":
+                parse = variant.compile(backend).parse
+
+            timings.append(min(timeit.repeat(partial(parse, data), number=NUMBER, repeat=5)))
+
+        print(f"{backend:<14}" + "".join(f"{timing / NUMBER * 1e6:>10.2f}us" for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
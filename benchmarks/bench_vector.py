@@ -0,0 +1,80 @@
+"""
+Benchmark for the vectorized validation of number arrays. Compares value by value parsing against
+validation with ``numpy`` (see ``parasite._vector``), for a list and a ``numpy`` array of bytes, and
+zero-copy validation of an ``array.array`` against converting it to a list first.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_vector.py
+"""
+
+# -- STL Imports --
+import array
+import timeit
+import tracemalloc
+from functools import partial
+
+# -- Library Imports --
+import numpy as np
+
+# -- Package Imports --
+from parasite import _vector, p
+
+SIZE = 1_000_000
+NUMBER = 3
+
+
+def main() -> None:
+    schema = p.array(p.number().integer().min(0).max(255))
+    values = [i % 256 for i in range(SIZE)]
+    ndarray = np.array(values, dtype=np.uint8)
+
+    print(f"Array(Number().integer().min(0).max(255)) with {SIZE} values, {NUMBER} iterations")
+
+    for name, parse in [
+        ("parse", schema.parse),
+        ("closure", schema.compile("closure").parse),
+        ("codegen", schema.compile("codegen").parse),
+    ]:
+        results = []
+
+        for value in (values, ndarray):
+            results.append(min(timeit.repeat(partial(parse, value), number=NUMBER, repeat=3)))
+
+        # disable numpy to measure the pure python path
+        np_, _vector.np = _vector.np, None
+
+        try:
+            results.append(min(timeit.repeat(partial(parse, values), number=NUMBER, repeat=3)))
+
+        finally:
+            _vector.np = np_
+
+        list_ms, array_ms, python_ms = (seconds / NUMBER * 1e3 for seconds in results)
+        print(
+            f"{name:<10}python {python_ms:>8.1f}ms   list {list_ms:>8.1f}ms   "
+            f"ndarray {array_ms:>8.1f}ms"
+        )
+
+
+    buffer = array.array("d", (i / 2 for i in range(SIZE)))
+    floats = p.array(p.number().gte(0)).compile("codegen")
+
+    print(f"\nArray(Number().gte(0)) with array.array('d') of {SIZE} values")
+
+    for name, func in [
+        ("list(...)", lambda: floats.parse(list(buffer))),
+        ("buffer", lambda: floats.parse(buffer)),
+    ]:
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=3)) / NUMBER
+
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{name:<10}{seconds * 1e3:>8.1f}ms   peak {peak / 2**20:>8.1f}MiB")
+
+
+if __name__ == "__main__":
+    main()
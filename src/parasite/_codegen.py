@@ -0,0 +1,346 @@
+# -- Future Imports -- (Use with caution, may not work as expected in all cases)
+from __future__ import annotations
+
+# -- STL Imports --
+import hashlib
+import itertools
+import linecache
+import math
+import re
+from types import CodeType
+from typing import TYPE_CHECKING, Any, Callable
+
+# -- Package Imports --
+from parasite import _const, _formats, _vector
+from parasite.errors import ValidationError
+
+if TYPE_CHECKING:
+    from parasite.type import ParasiteType
+
+INDENT = "    "
+"""Indentation used in the generated source."""
+
+
+class _CodeGen:
+    """
+    Builder for the python source of a compiled schema. Every schema node emits a module level
+    function (see :func:`parasite.type.ParasiteType._codegen`), that only contains straight-line
+    checks with all flags, bounds and regexes inlined as constants.
+
+    The generated source is self-contained, as long as :attr:`portable` is ``True``. In this case
+    every constant is defined by a python expression inside the source, and the source can be
+    executed (or cached) without access to the schema it was generated from.
+    """
+
+    def __init__(self) -> None:
+        self._m_consts: list[str] = []  # Module level constant definitions.
+        self._m_const_names: dict[str, str] = {}  # Expression -> name of the constant.
+        self._m_functions: list[str] = []  # Module level function definitions.
+        self._m_objects: dict[str, Any] = {}  # Runtime objects, that are not expressible.
+        self._m_counter = itertools.count()
+
+        # Whether values are stored copy-on-write into the dictionary of the current object.
+        self.copy_on_write = False
+
+    @property
+    def portable(self) -> bool:
+        """
+        Returns:
+            bool: whether the generated source is self-contained
+        """
+        return not self._m_objects
+
+    def name(self, prefix: str) -> str:
+        """
+        Creates a new unique name for the generated source.
+
+        Args:
+            prefix (str): prefix of the name
+
+        Returns:
+            str: unique name
+        """
+        return f"_{prefix}{next(self._m_counter)}"
+
+    def const(self, expr: str) -> str:
+        """
+        Defines a module level constant from a python expression. Constants with the same
+        expression are only defined once.
+
+        Args:
+            expr (str): python expression of the constant
+
+        Returns:
+            str: name of the constant
+        """
+        if (name := self._m_const_names.get(expr)) is None:
+            name = self._m_const_names[expr] = self.name("k")
+            self._m_consts.append(f"{name} = {expr}")
+
+        return name
+
+    def object(self, value: Any) -> str:
+        """
+        Makes a runtime object available to the generated source. Using this makes the generated
+        source non-portable.
+
+        Args:
+            value (Any): runtime object
+
+        Returns:
+            str: name of the object in the generated source
+        """
+        name = self.name("o")
+        self._m_objects[name] = value
+        return name
+
+    def literal(self, value: Any) -> str:
+        """
+        Converts a value into a python expression. Falls back to :func:`object` if the value has no
+        literal representation.
+
+        Args:
+            value (Any): value to convert
+
+        Returns:
+            str: python expression of the value
+        """
+        if value is None or type(value) in (bool, int, str, bytes):
+            return repr(value)
+
+        if type(value) is float:
+            return repr(value) if math.isfinite(value) else self.const(f"float({str(value)!r})")
+
+        if type(value) is tuple:
+            return "(" + "".join(f"{self.literal(item)}, " for item in value) + ")"
+
+        return self.object(value)
+
+    def pattern(self, value: re.Pattern) -> str:
+        """
+        Defines a compiled regex pattern as a module level constant.
+
+        Args:
+            value (re.Pattern): compiled regex pattern
+
+        Returns:
+            str: name of the constant
+        """
+        return self.const(f"re.compile({value.pattern!r}, {int(value.flags)})")
+
+    @staticmethod
+    def error(
+        code: str, *parts: str | tuple[str, str], value: str = "None", path: str | None = None
+    ) -> str:
+        """
+        Builds the python expression of a :class:`parasite.errors.ValidationError`, whose message
+        is formatted lazily. Static parts of the message are passed as strings, dynamic parts as a
+        tuple of a variable name and a conversion (``"r"``, ``"s"``).
+
+        Args:
+            code (str): kind of the failure
+            *parts (str | tuple[str, str]): parts of the message
+            value (str): expression of the offending value. Default: "None"
+            path (str | None): expression of the path to the offending value. Default: None
+
+        Returns:
+            str: python expression of the error
+
+        Example usage::
+
+            >>> _CodeGen.error("invalid_type", "object has to be None, but is ", ("obj", "r"))
+            "ValidationError('object has to be None, but is {!r}', obj, code='invalid_type', ..."
+        """
+        params = [part[0] for part in parts if not isinstance(part, str)]
+
+        # without parameters, the message is used as is and must not be escaped
+        msg = "".join(
+            (part.replace("{", "{{").replace("}", "}}") if params else part)
+            if isinstance(part, str) else f"{{!{part[1]}}}"
+            for part in parts
+        )
+        args = "".join(f", {param}" for param in params)
+        kwargs = f", path={path}" if path is not None else ""
+
+        return f"ValidationError({msg!r}{args}, code={code!r}, value={value}{kwargs})"
+
+    @staticmethod
+    def indent(lines: list[str], level: int = 1) -> list[str]:
+        """
+        Indents the lines of source.
+
+        Args:
+            lines (list[str]): lines to indent
+            level (int): levels of indentation. Default: 1
+
+        Returns:
+            list[str]: indented lines
+        """
+        return [INDENT * level + line for line in lines]
+
+    def store(self, key: str, value: str) -> list[str]:
+        """
+        Emits the source, that writes a parsed value back into the dictionary ``obj`` of the
+        current object. If :attr:`copy_on_write` is set, ``obj`` is only copied (once) and written
+        to, if the parsed value is not the original value. This expects the original dictionary to
+        be stored in ``src``, and the original value in ``value``.
+
+        Args:
+            key (str): python expression of the key
+            value (str): python expression of the parsed value
+
+        Returns:
+            list[str]: lines of source
+        """
+        if not self.copy_on_write:
+            return [f"obj[{key}] = {value}"]
+
+        return [
+            f"parsed = {value}",
+            "if parsed is not value:",
+            "    if obj is src:",
+            "        obj = dict(obj)",
+            f"    obj[{key}] = parsed",
+        ]
+
+    def function(self, prefix: str, body: list[str], args: str = "obj") -> str:
+        """
+        Defines a module level function.
+
+        Args:
+            prefix (str): prefix of the function name
+            body (list[str]): lines of the function body
+            args (str): arguments of the function. Default: "obj"
+
+        Returns:
+            str: name of the function
+        """
+        name = self.name(prefix)
+        self._m_functions.append("\n".join([f"def {name}({args}):", *self.indent(body)]))
+        return name
+
+    def source(self) -> str:
+        """
+        Returns:
+            str: the generated python source
+        """
+        return "\n".join([*self._m_consts, "", "", "\n\n\n".join(self._m_functions), ""])
+
+    def namespace(self) -> dict[str, Any]:
+        """
+        Returns:
+            dict[str, Any]: the global namespace the generated source has to be executed in
+        """
+        # pylint: disable=import-outside-toplevel
+        from parasite.type import _NotFound
+
+        return {
+            "ValidationError": ValidationError,
+            "_NotFound": _NotFound,
+            "_const": _const,
+            "_formats": _formats,
+            "_vector": _vector,
+            "math": math,
+            "re": re,
+            **self._m_objects,
+        }
+
+
+def emit_find(
+    gen: _CodeGen,
+    parse: str,
+    key: Any,
+    optional: bool,
+    nullable: bool,
+) -> list[str]:
+    """
+    Emits the default find-and-parse source for a child of an object, that handles the ``optional``
+    and ``nullable`` flags the same way as the :func:`_find_and_parse` implementations do. The
+    source works on the parent dictionary ``obj`` and writes the parsed value back into it.
+
+    Args:
+        gen (_CodeGen): code generator
+        parse (str): name of the generated parsing function of the child
+        key (Any): key of the child
+        optional (bool): whether the key is allowed to be missing
+        nullable (bool): whether the value is allowed to be ``None``
+
+    Returns:
+        list[str]: lines of source
+    """
+    expr = gen.literal(key)
+    lines = [
+        f"value = obj.get({expr}, _NotFound)",
+        "if value is not _NotFound:",
+        "    if value is not None:",
+        *gen.indent(gen.store(expr, f"{parse}(value)"), 2),
+    ]
+
+    # if value is None, it is already in place if the value is nullable
+    if not nullable:
+        msg = f"key {key!r} is not nullable, but is None"
+        lines += ["    else:", f"        raise {gen.error('not_nullable', msg)}"]
+
+    # if key is not found, skip it if optional, else raise an error
+    if not optional:
+        msg = f"key {key!r} not found, but is required"
+        lines += ["else:", f"    raise {gen.error('missing_key', msg)}"]
+
+    return lines
+
+
+def generate(schema: ParasiteType) -> tuple[str, str, _CodeGen]:
+    """
+    Generates the python source for a schema.
+
+    Args:
+        schema (ParasiteType): schema to generate the source for
+
+    Returns:
+        tuple[str, str, _CodeGen]: the source, the name of the entry function and the code
+            generator
+    """
+    gen = _CodeGen()
+    entry = schema._codegen(gen)
+    return gen.source(), entry, gen
+
+
+def build(source: str) -> CodeType:
+    """
+    Compiles generated source into a code object. The filename of the code object is derived from
+    the source, so that equal sources always produce equal code objects.
+
+    Args:
+        source (str): generated python source
+
+    Returns:
+        CodeType: the compiled code object
+    """
+    filename = f"<parasite-codegen-{hashlib.sha256(source.encode()).hexdigest()[:16]}>"
+    return compile(source, filename, "exec")
+
+
+def load(
+    code: CodeType,
+    source: str,
+    entry: str,
+    namespace: dict[str, Any],
+) -> Callable[[Any], Any]:
+    """
+    Executes compiled generated source and returns its entry function.
+
+    Args:
+        code (CodeType): code object created by :func:`build`
+        source (str): generated python source the code object was compiled from
+        entry (str): name of the entry function
+        namespace (dict[str, Any]): global namespace to execute the code object in
+
+    Returns:
+        Callable[[Any], Any]: the entry function
+    """
+    # register the source, so that tracebacks can show the generated lines
+    filename = code.co_filename
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+
+    exec(code, namespace)  # pylint: disable=exec-used
+    return namespace[entry]
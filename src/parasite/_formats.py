@@ -0,0 +1,239 @@
+# -- Future Imports -- (Use with caution, may not work as expected in all cases)
+from __future__ import annotations
+
+# -- STL Imports --
+import functools
+import re
+import socket
+from re import Pattern
+from typing import Any, Callable
+
+# -- Package Imports --
+from parasite import _const
+
+MAX_EMAIL = 254
+"""Maximum length of an email address (see RFC 5321, section 4.5.3.1)."""
+
+MAX_EMAIL_LOCAL = 64
+"""Maximum length of the local part (before the ``@``) of an email address (see RFC 5321)."""
+
+MAX_URL = 8192
+"""Default maximum length of URLs, which are unbounded by their regex."""
+
+PATTERNS: dict[str, Pattern] = {
+    "email": _const.RE_EMAIL,
+    "url": _const.RE_URL,
+    "uuid": _const.RE_UUID,
+    "cuid": _const.RE_CUID,
+    "cuid2": _const.RE_CUID2,
+    "ulid": _const.RE_ULID,
+    "ipv4": _const.RE_IPV4,
+    "ipv6": _const.RE_IPV6,
+}
+"""Regex pattern of every format, by the name of the format."""
+
+LENGTHS: dict[str, tuple[int, int | None]] = {
+    "email": (5, None),
+    "url": (5, None),
+    "uuid": (36, 36),
+    "cuid": (9, None),
+    "cuid2": (1, None),
+    "ulid": (26, 26),
+    "ipv4": (7, 15),
+    "ipv6": (3, 53),
+}
+"""
+Minimum and maximum length of the values, that the regex of every format matches (``None`` if
+unbounded), as derived from the regexes of :data:`PATTERNS`.
+"""
+
+LIMITS: dict[str, int] = {"email": MAX_EMAIL, "url": MAX_URL}
+"""Default maximum length of the values of formats, that are unbounded by their regex."""
+
+PROBES_IPV4 = [
+    "1.2.3.4",
+    "255.255.255.255",
+    "01.2.3.4",
+    "1.2.3.04",
+    "1.2.3",
+    "1.2.3.4.5",
+    "1..2.3",
+    "256.1.1.1",
+    "0x1.2.3.4",
+    "1.2.3.4 ",
+    " 1.2.3.4",
+    "1.2.3.4\n",
+    "١.2.3.4",
+    "1.2.3.4\x00",
+]
+"""Values, on which the fast IPv4 validator has to agree with the regex, to be used."""
+
+
+def _ipv4(value: str) -> bool:
+    """
+    Validates an IPv4 address with the parser of the platform. Values, that the parser rejects, are
+    matched with :data:`parasite._const.RE_IPV4`, so that only the common case is fast.
+
+    Args:
+        value (str): value to validate
+
+    Returns:
+        bool: whether the value is an IPv4 address
+    """
+    try:
+        socket.inet_pton(socket.AF_INET, value)
+        return True
+
+    except (OSError, ValueError):
+        return _const.RE_IPV4.match(value) is not None
+
+
+def email(value: str) -> bool:
+    """
+    Validates an email address. The length limits of RFC 5321 are checked in constant time, before
+    :data:`parasite._const.RE_EMAIL` is matched once.
+
+    Args:
+        value (str): value to validate
+
+    Returns:
+        bool: whether the value is an email address
+    """
+    # the local part ends at the first "@", which the regex requires anyway (checking the
+    # characters up front costs more than the regex spends on rejecting them)
+    if len(value) > MAX_EMAIL or value.find("@", 0, MAX_EMAIL_LOCAL + 1) < 0:
+        return False
+
+    return _const.RE_EMAIL.match(value) is not None
+
+
+def bounds(names: tuple[str, ...], limit: int | None = None) -> tuple[int, int | None]:
+    """
+    Resolves the range of lengths, that values of any of the formats can have, so that values
+    outside of it are rejected, before any regex runs.
+
+    Args:
+        names (tuple[str, ...]): names of the formats (see :data:`PATTERNS`)
+        limit (int | None): maximum length of the values of unbounded formats, overrides
+            :data:`LIMITS`. Default: None
+
+    Returns:
+        tuple[int, int | None]: the minimum and maximum length, ``None`` if unbounded
+    """
+    lower: list[int] = []
+    upper: list[int | None] = []
+
+    for name in names:
+        ll, ul = LENGTHS[name]
+        lower.append(ll)
+
+        # "$" also matches before a newline at the end of the value
+        if ul is not None:
+            upper.append(ul + 1)
+        else:
+            upper.append(limit if limit is not None else LIMITS.get(name))
+
+    if not names:
+        return 0, limit
+
+    return min(lower), None if None in upper else max(upper)  # type: ignore
+
+
+@functools.cache
+def classifier(names: tuple[str, ...]) -> Callable[[str], str | None]:
+    """
+    Merges the regexes of several formats into a single alternation with one named group per
+    format, so that a value is matched once, instead of once per format. Formats, that match the
+    same value, are preferred in the order of ``names``.
+
+    Args:
+        names (tuple[str, ...]): names of the formats (see :data:`PATTERNS`)
+
+    Returns:
+        Callable[[str], str | None]: classifier, that returns the name of the format the value
+        matches, or ``None`` if it matches none of them
+    """
+    # every pattern is anchored by "^" and "$", which are shared by the alternation
+    alternatives = "|".join(f"(?P<{name}>{PATTERNS[name].pattern[1:-1]})" for name in names)
+    match = re.compile(f"^(?:{alternatives})$").match
+    others = [(name, PATTERNS[name].match) for name in names if name != "email"]
+
+    def classify(value: str) -> str | None:
+        if (result := match(value)) is None:
+            return None
+
+        # the named group of a format is closed after all groups of its own regex
+        if (name := result.lastgroup) != "email" or email(value):
+            return name
+
+        # the regex of email misses its length limits, so the other formats are tried one by one
+        return next((other for other, match_other in others if match_other(value)), None)
+
+    return classify
+
+
+def memoize(validator: Callable[[str], Any], maxsize: int) -> Callable[[str], bool]:
+    """
+    Memoizes a validator in a thread-safe cache, that evicts the least recently used result first
+    (see :func:`functools.lru_cache`). Only whether the value is valid is cached, e.g. no regex
+    match objects.
+
+    Args:
+        validator (Callable[[str], Any]): validator, whose result is truthy for valid values
+        maxsize (int): maximum number of cached results
+
+    Returns:
+        Callable[[str], bool]: the memoized validator, with ``cache_info()`` and ``cache_clear()``
+    """
+
+    @functools.lru_cache(maxsize=maxsize)
+    def validate(value: str) -> bool:
+        return bool(validator(value))
+
+    return validate
+
+
+def _regex(pattern: Pattern) -> Callable[[str], bool]:
+    """
+    Args:
+        pattern (Pattern): compiled regex pattern
+
+    Returns:
+        Callable[[str], bool]: validator, that matches the value with the pattern
+    """
+    match = pattern.match
+    return lambda value: match(value) is not None
+
+
+def _select(
+    fast: Callable[[str], bool], pattern: Pattern, probes: list[str]
+) -> Callable[[str], bool]:
+    """
+    Selects the fast validator of a format, if the platform provides a parser, that agrees with the
+    regex of the format on every probe. Else the regex is used.
+
+    Args:
+        fast (Callable[[str], bool]): fast validator
+        pattern (Pattern): compiled regex pattern of the format
+        probes (list[str]): values to compare the validators on
+
+    Returns:
+        Callable[[str], bool]: the selected validator
+    """
+    if not hasattr(socket, "inet_pton"):
+        return _regex(pattern)
+
+    try:
+        if all(fast(probe) == (pattern.match(probe) is not None) for probe in probes):
+            return fast
+
+    except Exception:  # pylint: disable=broad-exception-caught
+        pass
+
+    return _regex(pattern)
+
+
+# the other formats (e.g. UUID, ULID, IPv6) are matched faster by their regex, than by any
+# validator written in python
+ipv4 = _select(_ipv4, _const.RE_IPV4, PROBES_IPV4)
+"""Validator for IPv4 addresses. Equivalent to matching :data:`parasite._const.RE_IPV4`."""
@@ -0,0 +1,273 @@
+# -- Future Imports -- (Use with caution, may not work as expected in all cases)
+from __future__ import annotations
+
+# -- STL Imports --
+import array
+import itertools
+import operator
+from typing import Any, Callable
+
+# -- Library Imports --
+try:
+    import numpy as np
+
+except ImportError:  # pragma: no cover
+    np = None  # pylint: disable=invalid-name
+
+THRESHOLD = 1024
+"""Minimum length of a list, for which the vectorized validation is used."""
+
+EXACT = 2**53
+"""Largest magnitude up to which every integer can be represented exactly as a ``float64``."""
+
+_FAILS: dict[str, Callable[[Any, Any], Any]] = {
+    ">=": operator.ge,
+    ">": operator.gt,
+    "<=": operator.le,
+    "<": operator.lt,
+}
+"""Comparison functions of the failing comparisons of number bounds."""
+
+BUFFERS = (array.array, memoryview, bytes, bytearray)
+"""Buffer types, that are validated without copying."""
+
+INTEGERS = frozenset("bBhHiIlLqQnN")
+"""Native struct formats of integer buffers. Lower case formats are signed."""
+
+FLOATS = frozenset("fd")
+"""Native struct formats of floating point buffers."""
+
+
+def applicable(values: Any) -> bool:
+    """
+    Cheap check, whether a sequence is worth validating with :func:`first_invalid`.
+
+    Args:
+        values (Any): sequence to check
+
+    Returns:
+        bool: ``True`` for buffers (see :data:`BUFFERS`), and for ``numpy`` arrays and lists with at
+        least :data:`THRESHOLD` elements, if ``numpy`` is installed
+    """
+    if isinstance(values, BUFFERS):
+        return True
+
+    if np is None:
+        return False
+
+    return isinstance(values, np.ndarray) or (
+        isinstance(values, list) and len(values) >= THRESHOLD
+    )
+
+
+def accepts(cls: type) -> bool:
+    """
+    Args:
+        cls (type): exact type of a value
+
+    Returns:
+        bool: whether values of the type are sequences, that are only handled by
+        :func:`first_invalid` (buffers and ``numpy`` arrays, see :func:`applicable`)
+    """
+    return issubclass(cls, BUFFERS) or (np is not None and issubclass(cls, np.ndarray))
+
+
+def first_invalid(
+    values: Any,
+    integer: bool,
+    bounds: tuple[tuple[str, int | float], ...],
+) -> int | None:
+    """
+    Validates a sequence of numbers at once with ``numpy``. Checks the type of the values, the
+    integrality (if ``integer`` is set) and the bounds. Supports lists of plain ``int`` and
+    ``float`` values (with at least :data:`THRESHOLD` elements), and one-dimensional ``numpy``
+    arrays of integers or floats. One-dimensional buffers (see :data:`BUFFERS`) of native integers
+    or floats are supported without ``numpy`` as well, and are never copied.
+
+    Note:
+        ``nan`` passes every bound, the same way it does in :func:`parasite.number.Number.parse`.
+
+    Args:
+        values (Any): sequence of numbers to validate
+        integer (bool): whether the values have to be integers
+        bounds (tuple[tuple[str, int | float], ...]): failing comparison (one of ``">="``, ``">"``,
+            ``"<="``, ``"<"``) and limit of each bound
+
+    Returns:
+        int | None: index of the first value out of bounds, ``len(values)`` if every value is valid,
+        or ``None`` if the values cannot be validated at once (e.g. ``numpy`` is not installed, or
+        the values have to be validated one by one)
+    """
+    if isinstance(values, BUFFERS):
+        return _first_invalid_buffer(memoryview(values), integer, bounds)
+
+    if np is None:
+        return None
+
+    if isinstance(values, np.ndarray):
+        if values.ndim != 1 or values.dtype.kind not in ("iu" if integer else "iuf"):
+            return None
+
+        vector = values
+
+    elif isinstance(values, list) and len(values) >= THRESHOLD:
+        types = set(map(type, values))
+
+        try:
+            if types == {int}:
+                vector = np.array(values, dtype=np.int64)
+
+            elif not integer and types <= {int, float}:
+                vector = np.array(values, dtype=np.float64)
+
+                # integers are rounded in float arrays, so only compare them if they are exact
+                if int in types and np.nanmax(np.abs(vector), initial=0) >= EXACT:
+                    return None
+
+            else:
+                return None
+
+        # integers, that do not fit into int64
+        except OverflowError:
+            return None
+
+    else:
+        return None
+
+    return _first_invalid_array(vector, bounds)
+
+
+def _first_invalid_buffer(
+    view: memoryview,
+    integer: bool,
+    bounds: tuple[tuple[str, int | float], ...],
+) -> int | None:
+    """
+    Validates a buffer of numbers at once, without copying it (see :func:`first_invalid`).
+
+    Args:
+        view (memoryview): view of the buffer
+        integer (bool): whether the values have to be integers
+        bounds (tuple[tuple[str, int | float], ...]): failing comparisons and limits of the bounds
+
+    Returns:
+        int | None: index of the first invalid value, ``len(view)`` if every value is valid, or
+        ``None`` if the format of the buffer is not supported
+    """
+    fmt = view.format.removeprefix("@")
+
+    if view.ndim != 1 or fmt not in INTEGERS | FLOATS:
+        return None
+
+    if fmt in FLOATS:
+        # the type is checked once for the whole buffer, so the first value is the invalid one
+        if integer:
+            return 0
+
+    # every value of the integer type is within the bounds, e.g. bytes for ``min(0).max(255)``
+    elif _within(bounds, *_range(fmt, view.itemsize)):
+        return len(view)
+
+    if np is not None and (index := _first_invalid_array(np.asarray(view), bounds)) is not None:
+        return index
+
+    # nan passes every bound, but breaks min/max, so only use them for integers
+    if fmt in INTEGERS and (not view or _within(bounds, min(view), max(view))):
+        return len(view)
+
+    fails = (any(_FAILS[op](value, limit) for op, limit in bounds) for value in view)
+    return next(itertools.compress(itertools.count(), fails), len(view))
+
+
+def _first_invalid_array(vector: Any, bounds: tuple[tuple[str, int | float], ...]) -> int | None:
+    """
+    Validates the bounds of a one-dimensional ``numpy`` array at once (see :func:`first_invalid`).
+
+    Args:
+        vector (Any): array of integers or floats
+        bounds (tuple[tuple[str, int | float], ...]): failing comparisons and limits of the bounds
+
+    Returns:
+        int | None: index of the first invalid value, ``len(vector)`` if every value is valid, or
+        ``None`` if the values cannot be compared exactly
+    """
+    if vector.dtype.kind in "iu":
+        # int64 values are compared as float64 against float limits, so only compare them if they
+        # are exact
+        if any(type(limit) is not int for _, limit in bounds) and vector.size and (
+            max(abs(int(vector.min())), abs(int(vector.max()))) >= EXACT
+        ):
+            return None
+
+    # float64 values are compared against int limits as float64, so the limit has to be exact
+    elif any(type(limit) is int and abs(limit) >= EXACT for _, limit in bounds):
+        return None
+
+    invalid = None
+
+    for op, limit in bounds:
+        # compare in float64, like python does, and not in the (smaller) type of the array
+        if type(limit) is float or vector.dtype.kind == "f":
+            limit = np.float64(limit)
+
+        fails = _FAILS[op](vector, limit)
+        invalid = fails if invalid is None else invalid | fails
+
+    if invalid is None or not invalid.any():
+        return len(vector)
+
+    return int(np.argmax(invalid))
+
+
+def _range(fmt: str, size: int) -> tuple[int, int]:
+    """
+    Args:
+        fmt (str): native struct format of an integer type
+        size (int): size of the type in bytes
+
+    Returns:
+        tuple[int, int]: smallest and largest value of the integer type
+    """
+    if fmt.islower():
+        return -(1 << (8 * size - 1)), (1 << (8 * size - 1)) - 1
+
+    return 0, (1 << (8 * size)) - 1
+
+
+def _within(bounds: tuple[tuple[str, int | float], ...], smallest: Any, largest: Any) -> bool:
+    """
+    Args:
+        bounds (tuple[tuple[str, int | float], ...]): failing comparisons and limits of the bounds
+        smallest (Any): smallest value
+        largest (Any): largest value
+
+    Returns:
+        bool: whether every value between ``smallest`` and ``largest`` is within the bounds
+    """
+    return not any(
+        _FAILS[op](smallest, limit) or _FAILS[op](largest, limit) for op, limit in bounds
+    )
+
+
+def item(values: Any, index: int) -> Any:
+    """
+    Returns an element of a sequence, validated with :func:`first_invalid`, as a python scalar.
+    Elements of buffers already are python scalars. Elements of multi-dimensional sequences are
+    returned as nested lists.
+
+    Args:
+        values (Any): sequence of numbers
+        index (int): index of the element
+
+    Returns:
+        Any: the element
+    """
+    # multi-dimensional memoryviews cannot be indexed
+    if isinstance(values, memoryview) and values.ndim != 1:
+        return values.tolist()[index]
+
+    value = values[index]
+    if np is not None and isinstance(value, np.ndarray):
+        return value.tolist()
+
+    return value.item() if np is not None and isinstance(value, np.generic) else value
@@ -3,14 +3,12 @@ from __future__ import annotations
 
 # -- STL Imports --
 from dataclasses import dataclass
-from typing import Any, TypeVar
-
-# -- Library Imports --
-from rusttypes.option import Nil, Some, Option
+from typing import Any, Callable, TypeVar
 
 # -- Package Imports --
+from parasite._codegen import _CodeGen
 from parasite.errors import ValidationError
-from parasite.type import ParasiteType, _NotFound
+from parasite.type import ParasiteType, _Failure, _NotFound
 
 K = TypeVar("K")
 """Template type for the key in a dictionary."""
@@ -113,17 +111,62 @@ class Any_(ParasiteType[Any]):
         self._f_optional = False
         return self
 
-    def parse(self, obj: Any) -> Any:
+    def parse(self, obj: Any, collect_errors: bool = False, max_errors: int | None = None) -> Any:
+        if collect_errors:
+            return self._parse_collect(obj, max_errors)
+
+        # can never fail, as it accepts any value
+        return obj
+
+    def _check(self, obj: Any) -> Any:
         # can never fail, as it accepts any value
         return obj
 
-    def _find_and_parse(self, parent: dict[K, Any], key: K) -> Option[Any]:
-        # if key is found, just package ``parse(..)`` it into a Some
+    def _find_and_parse_raw(self, parent: dict[K, Any], key: K) -> Any:
+        return self._unwrap(Any_._check_find(self, parent, key))
+
+    def _check_find(self, parent: dict[K, Any], key: K) -> Any:
+        # if key is found, just ``_check(..)`` it
         if (value := parent.get(key, _NotFound)) is not _NotFound:
-            return Some(self.parse(value))
+            return self._check(value)
+
+        # if key is not found, return _NotFound if optional, else fail
+        if self._f_optional:
+            return _NotFound
+
+        msg = "key {!r} not found, but is required"
+        return _Failure(ValidationError(msg, key, code="missing_key"))
+
+    def _compile(self) -> Callable[[Any], Any]:
+        def parse(obj: Any) -> Any:
+            # can never fail, as it accepts any value
+            return obj
+
+        return parse
+
+    def _compile_find(self) -> Callable[[dict[Any, Any], Any], Any]:
+        # if the value is optional, a missing key simply results in ``_NotFound``
+        if self._f_optional:
+            return lambda parent, key: parent.get(key, _NotFound)
+
+        def find(parent: dict[Any, Any], key: Any) -> Any:
+            if (value := parent.get(key, _NotFound)) is not _NotFound:
+                return value
+
+            raise ValidationError("key {!r} not found, but is required", key, code="missing_key")
+
+        return find
+
+    def _codegen(self, gen: _CodeGen) -> str:
+        # can never fail, as it accepts any value
+        return gen.function("any", ["return obj"])
 
-        # if key is not found, return Nil if optional, else raise an error
+    def _codegen_find(self, gen: _CodeGen, key: Any) -> list[str]:
+        # the value is kept as is, so only a missing key has to be handled
         if self._f_optional:
-            return Nil
+            return []
 
-        raise ValidationError(f"key {key!r} not found, but is required")
+        return [
+            f"if {gen.literal(key)} not in obj:",
+            f"    raise {gen.error('missing_key', f'key {key!r} not found, but is required')}",
+        ]
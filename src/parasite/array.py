@@ -2,19 +2,32 @@
 from __future__ import annotations
 
 # -- STL Imports --
+import operator
 from dataclasses import dataclass
-from typing import Any, TypeVar
-
-# -- Library Imports --
-from rusttypes.option import Nil, Option, Some
+from typing import Any, Callable, TypeVar
 
 # -- Package Imports --
+from parasite import _vector
+from parasite._codegen import _CodeGen, emit_find
 from parasite.errors import ValidationError
-from parasite.type import ParasiteType, _NotFound
+from parasite.object import Object
+from parasite.type import ParasiteType, _Collector, _Failure, _Invalid, _NotFound
 
 K = TypeVar("K")
 """Template type for the key in a dictionary."""
 
+MSG_TYPE = "object has to be a list, but is {!r}"
+"""Message for values, that are not a list."""
+
+MSG_TOO_SHORT = "list has to have at least {} elements, but has {}"
+"""Message for lists with less elements than the lower limit."""
+
+MSG_TOO_LONG = "list has to have at most {} elements, but has {}"
+"""Message for lists with more elements than the upper limit."""
+
+MSG_ELEMENT = "element at index {} is invalid: {}"
+"""Message for lists with an invalid element, wrapping the error of the element."""
+
 
 @dataclass
 class Array(ParasiteType[list[Any]]):
@@ -37,6 +50,18 @@ class Array(ParasiteType[list[Any]]):
         type is specified, the list will skip parsing the elements, and therefore accept any type of
         object or value.
 
+    Note:
+        The passed list is never modified. If every element parses to the identical object (e.g.
+        numbers, booleans or strings without transformations), the passed list itself is returned.
+        Else a new list is created, starting from the first element that changed.
+
+    Note:
+        If the element type is a :class:`parasite.number.Number`, one-dimensional buffers of
+        native integers or floats (``array.array``, ``memoryview``, ``bytes`` and ``bytearray``)
+        and ``numpy`` arrays are accepted as well. Those are validated as a whole without being
+        copied (the type of the elements is checked once through the format of the buffer), and
+        the buffer itself is returned.
+
     Inheritance:
         .. inheritance-diagram:: parasite.array.Array
             :parts: 1
@@ -387,53 +412,398 @@ class Array(ParasiteType[list[Any]]):
         self._m_element = element
         return self
 
-    def parse(self, obj: Any) -> list[Any]:
+    def _check_list(self, obj: Any) -> Any:
+        """
+        Checks the type and the length of the list, without parsing its elements.
+
+        Args:
+            obj (Any): value to check
+
+        Returns:
+            Any: the checked list, or ``_Failure`` if the value is not a list, or has an invalid
+            length
+        """
         if not isinstance(obj, list):
-            raise ValidationError(f"object has to be a list, but is {obj!r}")
+            return _Failure(ValidationError(MSG_TYPE, obj, code="invalid_type", value=obj))
 
         if self._m_ll is not None and len(obj) < self._m_ll:
-            raise ValidationError(
-                f"list has to have at least {self._m_ll} elements, but has {len(obj)}"
-            )
+            msg, ll = MSG_TOO_SHORT, self._m_ll
+            return _Failure(ValidationError(msg, ll, len(obj), code="too_short", value=obj))
 
         if self._m_ul is not None and len(obj) > self._m_ul:
-            raise ValidationError(
-                f"list has to have at most {self._m_ul} elements, but has {len(obj)}"
-            )
+            msg, ul = MSG_TOO_LONG, self._m_ul
+            return _Failure(ValidationError(msg, ul, len(obj), code="too_long", value=obj))
+
+        return obj
+
+    @staticmethod
+    def _parse_vector(
+        obj: Any,
+        index: int | None,
+        parse: Callable[[Any], Any],
+        ll: int | None,
+        ul: int | None,
+    ) -> Any:
+        """
+        Finishes parsing a sequence, that was validated as a whole by the element type (see
+        :func:`parasite.type.ParasiteType._vectorize`). Checks the length of the sequence, and
+        parses the elements from the first invalid one on, to raise the same error as the value by
+        value path. Sequences, that could not be validated as a whole (e.g. ``numpy`` arrays of
+        another dtype), are parsed element by element.
+
+        Throws:
+            ValidationError: if the sequence has an invalid length, or an invalid element
+
+        Args:
+            obj (Any): validated sequence
+            index (int | None): index of the first invalid element, the length of the sequence, or
+                ``None`` if the sequence was not validated as a whole
+            parse (Callable[[Any], Any]): parsing function of the element type
+            ll (int | None): lower limit of the length
+            ul (int | None): upper limit of the length
+
+        Returns:
+            Any: the sequence itself
+        """
+        if ll is not None and len(obj) < ll:
+            raise ValidationError(MSG_TOO_SHORT, ll, len(obj), code="too_short", value=obj)
+
+        if ul is not None and len(obj) > ul:
+            raise ValidationError(MSG_TOO_LONG, ul, len(obj), code="too_long", value=obj)
+
+        # the elements before the index are valid, every following one is parsed until one fails
+        for i in range(index or 0, len(obj)):
+            try:
+                parse(_vector.item(obj, i))
+
+            except ValidationError as exc:
+                raise exc.nested(MSG_ELEMENT, i) from exc
+
+        return obj
+
+    def parse_columnar(self, obj: Any) -> list[dict[Any, Any]]:
+        """
+        Parses a list of records (dictionaries) column by column. The records are transposed into
+        one column per key of the element schema, and every column is validated at once by the
+        schema of its key (e.g. the bounds of a :class:`parasite.number.Number` are only compared
+        against the smallest and the largest value of the column). Behaves exactly like
+        :func:`parse`, but is a lot faster for large tables of records with the same keys.
+
+        Note:
+            Only available if the element schema is a :class:`parasite.object.Object`.
+
+        Note:
+            In contrast to :func:`parse`, no record is modified if any record is invalid.
+
+        Throws:
+            TypeError: if the element schema is not a :class:`parasite.object.Object`
+            ValidationError: if the value could not be parsed or was invalid; the message contains
+                the index of the first invalid record
+
+        Args:
+            obj (Any): list of records to parse
+
+        Returns:
+            list[dict[Any, Any]]: parsed records
+
+        Example usage:
+            Lets assume we have the following schema::
+
+                from parasite import p
+
+                schema = p.array(p.obj({ "id": p.number().integer().gte(0), "name": p.string() }))
+
+            The resulting schema will parse the following objects::
+
+                >>> schema.parse_columnar([{ "id": 1, "name": "John" }, { "id": 2, "name": "Max" }])
+                [{ "id": 1, "name": "John" }, { "id": 2, "name": "Max" }]
+
+                >>> schema.parse_columnar([{ "id": 1, "name": "John" }, { "id": -1, "name": "" }])
+                ValidationError: element at index 1 is invalid: object has to be >='0', but is -1
+        """
+        if not isinstance(element := self._m_element, Object):
+            raise TypeError(f"columnar parsing requires an object element, but is {element!r}")
+
+        rows = self._unwrap(self._check_list(obj))
+        parsed: list[dict[Any, Any]] = []
+
+        try:
+            element._parse_columns(rows, parsed)
+
+        # the length of the parsed rows is the index of the row, that failed to parse
+        except ValidationError as exc:
+            raise exc.nested(MSG_ELEMENT, len(parsed)) from exc
+
+        # only return a new list, if any of the rows changed while parsing
+        return rows if all(map(operator.is_, parsed, rows)) else parsed
+
+    def parse(
+        self,
+        obj: Any,
+        collect_errors: bool = False,
+        max_errors: int | None = None,
+    ) -> list[Any]:
+        if collect_errors:
+            return self._parse_collect(obj, max_errors)
+
+        return self._unwrap(Array._check(self, obj))
+
+    def _check(self, obj: Any) -> Any:
+        # buffers, large lists and numpy arrays may be validated at once by the element type, and
+        # buffers and numpy arrays, that cannot, are validated element by element
+        if (
+            self._m_element is not None
+            and _vector.applicable(obj)
+            and (vectorized := self._m_element._vectorize()) is not None
+            and ((index := vectorized(obj)) is not None or not isinstance(obj, list))
+        ):
+            # the elements are only parsed on failure or as fallback, so raising does not matter
+            try:
+                return self._parse_vector(obj, index, self._m_element.parse, self._m_ll, self._m_ul)
+
+            except ValidationError as exc:
+                return _Failure(exc)
+
+        if type(obj := self._check_list(obj)) is _Failure:
+            return obj
 
         if self._m_element is not None:
-            # create a cache to not overwrite the original list on error
-            cache = []
+            # a new list is only created from the first element, that changed while parsing, to not
+            # overwrite the original list on error
+            cache: list[Any] | None = None
 
             # parse each element individually
             for i, element in enumerate(obj):
-                try:
-                    # may throw a ValidationError exception
-                    cache.append(self._m_element.parse(element))
+                # wrap the failure of the element, if parsing fails
+                if type(value := self._m_element._check(element)) is _Failure:
+                    value.error = value.error.nested(MSG_ELEMENT, i)
+                    return value
 
-                # handle ValidationError exceptions, if parsing fails
-                except ValidationError as exc:
-                    raise ValidationError(f"element at index {i} is invalid: {exc}") from exc
+                if cache is not None:
+                    cache.append(value)
+
+                elif value is not element:
+                    cache = obj[:i]
+                    cache.append(value)
 
-            # if the parsing was successful, overwrite the original list
-            obj = cache
+            # if the parsing was successful and any element changed, overwrite the original list
+            if cache is not None:
+                obj = cache
 
         return obj
 
-    def _find_and_parse(self, parent: dict[K, Any], key: K) -> Option[list[Any] | None]:
+    def _accepts(self, cls: type) -> bool:
+        # buffers and numpy arrays are only accepted, if the element type validates them at once
+        return issubclass(cls, list) or (
+            self._m_element is not None
+            and _vector.accepts(cls)
+            and self._m_element._vectorize() is not None
+        )
+
+    def _find_and_parse_raw(self, parent: dict[K, Any], key: K) -> Any:
+        return self._unwrap(Array._check_find(self, parent, key))
+
+    def _check_find(self, parent: dict[K, Any], key: K) -> Any:
         if (value := parent.get(key, _NotFound)) is not _NotFound:
-            # if key is found, just package ``parse(..)`` it into a Some
+            # if key is found, just ``_check(..)`` it
             if value is not None:
-                return Some(self.parse(value))
+                return self._check(value)
 
             # if value is None, check if the value is nullable
             if self._f_nullable:
-                return Some(None)
+                return None
 
-            raise ValidationError(f"key {key!r} is not nullable, but is None")
+            msg = "key {!r} is not nullable, but is None"
+            return _Failure(ValidationError(msg, key, code="not_nullable"))
 
-        # if key is not found, return Nil if optional, else raise an error
+        # if key is not found, return _NotFound if optional, else fail
         if self._f_optional:
-            return Nil
+            return _NotFound
+
+        msg = "key {!r} not found, but is required"
+        return _Failure(ValidationError(msg, key, code="missing_key"))
+
+    def _collect(self, obj: Any, path: tuple[Any, ...], collector: _Collector) -> Any:
+        # buffers, large lists and numpy arrays may be validated at once by the element type, so
+        # only the elements from the first invalid one on have to be collected (or all of them, if
+        # a buffer or numpy array cannot be validated at once)
+        if (
+            self._m_element is not None
+            and _vector.applicable(obj)
+            and (vectorized := self._m_element._vectorize()) is not None
+            and ((index := vectorized(obj)) is not None or not isinstance(obj, list))
+        ):
+            self._collect_length(obj, path, collector)
 
-        raise ValidationError(f"key {key!r} not found, but is required")
+            for i in range(index or 0, len(obj)):
+                self._m_element._collect(_vector.item(obj, i), (*path, i), collector)
+
+            return obj
+
+        if not isinstance(obj, list):
+            collector.add(path, self, "invalid_type", obj, MSG_TYPE.format(obj))
+            return _Invalid
+
+        # an invalid length is reported, but the elements are still parsed
+        self._collect_length(obj, path, collector)
+
+        if self._m_element is None:
+            return obj
+
+        # a new list is only created from the first element, that changed while parsing
+        cache: list[Any] | None = None
+
+        for i, element in enumerate(obj):
+            value = self._m_element._collect(element, (*path, i), collector)
+
+            if cache is not None:
+                cache.append(value)
+
+            elif value is not element and value is not _Invalid:
+                cache = obj[:i]
+                cache.append(value)
+
+        return obj if cache is None else cache
+
+    def _collect_length(self, obj: Any, path: tuple[Any, ...], collector: _Collector) -> None:
+        """
+        Records an invalid length of the list in the collector (see :func:`_collect`).
+
+        Args:
+            obj (Any): list or buffer to check
+            path (tuple[Any, ...]): path of the list
+            collector (_Collector): collector of the failures
+        """
+        if self._m_ll is not None and len(obj) < self._m_ll:
+            msg = MSG_TOO_SHORT.format(self._m_ll, len(obj))
+            collector.add(path, self, "too_short", obj, msg)
+
+        elif self._m_ul is not None and len(obj) > self._m_ul:
+            msg = MSG_TOO_LONG.format(self._m_ul, len(obj))
+            collector.add(path, self, "too_long", obj, msg)
+
+    def _collect_find(
+        self,
+        parent: dict[Any, Any],
+        key: Any,
+        path: tuple[Any, ...],
+        collector: _Collector,
+    ) -> Any:
+        # if key is found, collect the errors of the elements
+        if (value := parent.get(key, _NotFound)) is not _NotFound and value is not None:
+            return self._collect(value, (*path, key), collector)
+
+        return super()._collect_find(parent, key, path, collector)
+
+    def _compile(self) -> Callable[[Any], list[Any]]:
+        element = self._m_element._compile() if self._m_element is not None else None
+        vectorized = self._m_element._vectorize() if self._m_element is not None else None
+        ll, ul = self._m_ll, self._m_ul
+
+        def parse(obj: Any) -> list[Any]:
+            # buffers, large lists and numpy arrays may be validated at once by the element type
+            if (
+                vectorized is not None
+                and _vector.applicable(obj)
+                and ((index := vectorized(obj)) is not None or not isinstance(obj, list))
+            ):
+                return Array._parse_vector(obj, index, element, ll, ul)
+
+            if not isinstance(obj, list):
+                raise ValidationError(MSG_TYPE, obj, code="invalid_type", value=obj)
+
+            if ll is not None and len(obj) < ll:
+                raise ValidationError(MSG_TOO_SHORT, ll, len(obj), code="too_short", value=obj)
+
+            if ul is not None and len(obj) > ul:
+                raise ValidationError(MSG_TOO_LONG, ul, len(obj), code="too_long", value=obj)
+
+            if element is None:
+                return obj
+
+            # a new list is only created from the first element, that changed while parsing
+            cache: list[Any] | None = None
+
+            for i, item in enumerate(obj):
+                try:
+                    value = element(item)
+
+                except ValidationError as exc:
+                    raise exc.nested(MSG_ELEMENT, i) from exc
+
+                if cache is not None:
+                    cache.append(value)
+
+                elif value is not item:
+                    cache = obj[:i]
+                    cache.append(value)
+
+            return obj if cache is None else cache
+
+        return parse
+
+    def _compile_find(self) -> Callable[[dict[Any, Any], Any], Any]:
+        return self._make_find(self._compile(), self._f_optional, self._f_nullable)
+
+    def _codegen(self, gen: _CodeGen) -> str:
+        error_type = gen.error(
+            "invalid_type", "object has to be a list, but is ", ("obj", "r"), value="obj"
+        )
+        lines: list[str] = []
+        length: list[str] = []
+
+        if self._m_ll is not None:
+            msg = f"list has to have at least {self._m_ll} elements, but has "
+            error = gen.error("too_short", msg, ("len(obj)", "s"), value="obj")
+            length += [f"if len(obj) < {self._m_ll!r}:", f"    raise {error}"]
+
+        if self._m_ul is not None:
+            msg = f"list has to have at most {self._m_ul} elements, but has "
+            error = gen.error("too_long", msg, ("len(obj)", "s"), value="obj")
+            length += [f"if len(obj) > {self._m_ul!r}:", f"    raise {error}"]
+
+        element = self._m_element._codegen(gen) if self._m_element is not None else None
+
+        # buffers, large lists and numpy arrays may be validated at once by the element type
+        if (
+            self._m_element is not None
+            and (vectorized := self._m_element._codegen_vector(gen, "obj")) is not None
+        ):
+            lines += [
+                "if _vector.applicable(obj):",
+                f"    index = {vectorized}",
+                "    if index is not None or not isinstance(obj, list):",
+                *gen.indent(length, 2),
+                "        for index in range(index or 0, len(obj)):",
+                "            try:",
+                f"                {element}(_vector.item(obj, index))",
+                "            except ValidationError as exc:",
+                f"                raise exc.nested({MSG_ELEMENT!r}, index) from exc",
+                "        return obj",
+            ]
+
+        lines += ["if not isinstance(obj, list):", f"    raise {error_type}"]
+        lines += length
+
+        if element is not None:
+            lines += [
+                # a new list is only created from the first element, that changed while parsing
+                "cache = None",
+                "for i, item in enumerate(obj):",
+                "    try:",
+                f"        value = {element}(item)",
+                "    except ValidationError as exc:",
+                f"        raise exc.nested({MSG_ELEMENT!r}, i) from exc",
+                "    if cache is not None:",
+                "        cache.append(value)",
+                "    elif value is not item:",
+                "        cache = obj[:i]",
+                "        cache.append(value)",
+                "if cache is not None:",
+                "    obj = cache",
+            ]
+
+        return gen.function("array", [*lines, "return obj"])
+
+    def _codegen_find(self, gen: _CodeGen, key: Any) -> list[str]:
+        return emit_find(gen, self._codegen(gen), key, self._f_optional, self._f_nullable)
@@ -2,21 +2,88 @@
 from __future__ import annotations
 
 # -- STL Imports --
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import math
 import re
-from typing import Any, TypeVar
-
-# -- Library Imports --
-from rusttypes.option import Nil, Option, Some
+from re import Pattern
+from typing import Any, Callable, TypeVar
 
 # -- Package Imports --
+from parasite._codegen import _CodeGen, emit_find
 from parasite.errors import ValidationError
-from parasite.type import ParasiteType, _NotFound
+from parasite.type import ParasiteType, _Failure, _NotFound
 
 K = TypeVar("K")
 """Template type for the key in a dictionary."""
 
+MSG_REGEX = (
+    "object has to be regex (true: {!r}, false: {!r}) accepted boolean value, but is {!r}"
+)
+"""Message template for strings, that match neither of the leaniant regexes."""
+
+MSG_NUMBER = "object has to be 1 or 0, but is {!r}"
+"""Message template for numbers, that are neither 1 nor 0."""
+
+MSG_TYPE = "object has to be a boolean, but is {!r}"
+"""Message template for values, that are not a boolean."""
+
+MSG_LITERAL = "object has to be {}, but is {}"
+"""Message template for values, that do not match the literal."""
+
+RE_TOKENS = re.compile(r"\^\(((?:\w+\|)*\w+)\)\$|\^(\w+)\$")
+"""Regex for leaniant patterns, that only match a fixed set of words (e.g. ``^(true|1|yes|y)$``)."""
+
+LEANIANT = (r"^(true|1|yes|y)$", r"^(false|0|no|n)$")
+"""Default leaniant patterns for the true and false value."""
+
+
+def _tokens(pattern: str) -> list[str]:
+    """
+    Extracts the words, that a leaniant pattern matches literally. Patterns, that are not a plain
+    alternation of words, return no words and are only matched as regex.
+
+    Args:
+        pattern (str): leaniant pattern
+
+    Returns:
+        list[str]: the words, that the pattern matches
+
+    Example usage::
+
+        >>> _tokens(r"^(true|1|yes|y)$")
+        ['true', '1', 'yes', 'y']
+        >>> _tokens(r"^t.*$")
+        []
+    """
+    if (match := RE_TOKENS.fullmatch(pattern)) is None:
+        return []
+
+    return (match[1] or match[2]).split("|")
+
+
+def _compile_leaniant(
+    patterns: tuple[str, str],
+) -> tuple[tuple[str, str], Pattern, Pattern, dict[str, bool]]:
+    """
+    Compiles the leaniant patterns, and collects the words they match literally (see
+    :func:`_tokens`), so that common values are converted without any regex.
+
+    Args:
+        patterns (tuple[str, str]): leaniant patterns for the true and false value
+
+    Returns:
+        tuple[tuple[str, str], Pattern, Pattern, dict[str, bool]]: the patterns, the compiled true
+        and false patterns, and the converted value of every word
+    """
+    re_true, re_false = (re.compile(pattern) for pattern in patterns)
+
+    # the true pattern is matched first, so it takes precedence over the false words
+    words = dict.fromkeys(_tokens(patterns[1]), False)
+    words = {word: value for word, value in words.items() if not re_true.match(word)}
+    words.update(dict.fromkeys(_tokens(patterns[0]), True))
+
+    return patterns, re_true, re_false, words
+
 
 @dataclass
 class Boolean(ParasiteType[bool]):
@@ -46,12 +113,15 @@ class Boolean(ParasiteType[bool]):
     _f_nullable: bool = False  # Whether the value can be None.
     _f_leaniant: bool = False  # Whether the value is leaniant.
 
-    _m_leaniant: tuple[str, str] = (
-        r"^(true|1|yes|y)$",
-        r"^(false|0|no|n)$",
-    )  # The regular expressions for the true and false value.
+    _m_leaniant: tuple[str, str] = LEANIANT  # The regular expressions for the true and false value.
     _m_literal: bool | None = None  # The literal value of the boolean.
 
+    # Compiled leaniant patterns and their words (see :func:`_compile_leaniant`), rebuilt whenever
+    # the patterns change.
+    _c_leaniant: tuple[tuple[str, str], Pattern, Pattern, dict[str, bool]] = field(
+        default=_compile_leaniant(LEANIANT), compare=False, repr=False
+    )
+
     def __init__(self) -> None:
         pass
 
@@ -226,25 +296,42 @@ class Boolean(ParasiteType[bool]):
 
         return self
 
-    def parse(self, obj: Any) -> bool:
+    def _refresh(self) -> None:
+        # the patterns are only compiled again, if they were replaced
+        if self._c_leaniant[0] != self._m_leaniant:
+            self._c_leaniant = _compile_leaniant(self._m_leaniant)
+
+    def parse(self, obj: Any, collect_errors: bool = False, max_errors: int | None = None) -> bool:
+        if collect_errors:
+            return self._parse_collect(obj, max_errors)
+
+        return self._unwrap(Boolean._check(self, obj))
+
+    def _check(self, obj: Any) -> Any:
         # if obj is already a boolean, return it
         if isinstance(obj, bool):
             pass
 
         # if obj is a string and leaniant mode is active, try to convert it to a boolean
         elif isinstance(obj, str) and self._f_leaniant:
+            _, re_true, re_false, words = self._c_leaniant
+
             # if obj is a string, try to convert it to a boolean
-            if re.match(self._m_leaniant[0], obj.lower()):
+            if (value := words.get(lower := obj.lower())) is not None:
+                obj = value
+
+            elif re_true.match(lower):
                 obj = True
 
-            elif re.match(self._m_leaniant[1], obj.lower()):
+            elif re_false.match(lower):
                 obj = False
 
             else:
-                # raise an error if the value could not be matched to any regex
-                raise ValidationError(
-                    f"object has to be regex (true: {self._m_leaniant[0]!r}, false: "
-                    f"{self._m_leaniant[1]!r}) accepted boolean value, but is {obj!r}"
+                # fail if the value could not be matched to any regex
+                return _Failure(
+                    ValidationError(
+                        MSG_REGEX, *self._m_leaniant, obj, code="invalid_value", value=obj
+                    )
                 )
 
         # if obj is a number, try to convert it to a boolean
@@ -260,32 +347,168 @@ class Boolean(ParasiteType[bool]):
                 obj = False
 
             else:
-                raise ValidationError(f"object has to be 1 or 0, but is {obj!r}")
+                return _Failure(ValidationError(MSG_NUMBER, obj, code="invalid_value", value=obj))
 
         else:
-            # raise an error if the value could not be parsed
-            raise ValidationError(f"object has to be a boolean, but is {obj!r}")
+            # fail if the value could not be parsed
+            return _Failure(ValidationError(MSG_TYPE, obj, code="invalid_type", value=obj))
 
         # if literal is set, check if obj is the literal value
         if self._m_literal is not None and obj != self._m_literal:
-            raise ValidationError(f"object has to be {self._m_literal}, but is {obj}")
+            msg = MSG_LITERAL
+            return _Failure(
+                ValidationError(msg, self._m_literal, obj, code="invalid_literal", value=obj)
+            )
 
         return obj
 
-    def _find_and_parse(self, parent: dict[K, Any], key: K) -> Option[bool | None]:
+    def _accepts(self, cls: type) -> bool:
+        # strings and numbers are only converted in leaniant mode
+        return issubclass(cls, bool) or (self._f_leaniant and issubclass(cls, (str, int, float)))
+
+    def _tag(self) -> Any:
+        # in leaniant mode, other values are converted to the literal as well
+        if self._m_literal is None or self._f_leaniant:
+            return _NotFound
+
+        return self._m_literal
+
+    def _find_and_parse_raw(self, parent: dict[K, Any], key: K) -> Any:
+        return self._unwrap(Boolean._check_find(self, parent, key))
+
+    def _check_find(self, parent: dict[K, Any], key: K) -> Any:
         if (value := parent.get(key, _NotFound)) is not _NotFound:
-            # if key is found, just package ``parse(..)`` it into a Some
+            # if key is found, just ``_check(..)`` it
             if value is not None:
-                return Some(self.parse(value))
+                return self._check(value)
 
             # if value is None, check if the value is nullable
             if self._f_nullable:
-                return Some(None)
+                return None
 
-            raise ValidationError(f"key {key!r} is not nullable, but is None")
+            msg = "key {!r} is not nullable, but is None"
+            return _Failure(ValidationError(msg, key, code="not_nullable"))
 
-        # if key is not found, return Nil if optional, else raise an error
+        # if key is not found, return _NotFound if optional, else fail
         if self._f_optional:
-            return Nil
+            return _NotFound
+
+        msg = "key {!r} not found, but is required"
+        return _Failure(ValidationError(msg, key, code="missing_key"))
+
+    def _compile(self) -> Callable[[Any], bool]:
+        leaniant = self._f_leaniant
+        literal = self._m_literal
+        patterns, re_true, re_false, words = self._c_leaniant
+
+        def parse(obj: Any) -> bool:
+            # if obj is already a boolean, return it
+            if isinstance(obj, bool):
+                pass
+
+            # if obj is a string and leaniant mode is active, try to convert it to a boolean
+            elif leaniant and isinstance(obj, str):
+                lower = obj.lower()
+
+                if (value := words.get(lower)) is not None:
+                    obj = value
+
+                elif re_true.match(lower):
+                    obj = True
+
+                elif re_false.match(lower):
+                    obj = False
+
+                else:
+                    raise ValidationError(
+                        MSG_REGEX, *patterns, obj, code="invalid_value", value=obj
+                    )
+
+            # if obj is a number and leaniant mode is active, try to convert it to a boolean
+            elif leaniant and isinstance(obj, int | float):
+                if math.isnan(obj):
+                    obj = False
+
+                elif int(obj) == 1:
+                    obj = True
+
+                elif int(obj) == 0:
+                    obj = False
+
+                else:
+                    raise ValidationError(MSG_NUMBER, obj, code="invalid_value", value=obj)
+
+            else:
+                raise ValidationError(MSG_TYPE, obj, code="invalid_type", value=obj)
+
+            # if literal is set, check if obj is the literal value
+            if literal is not None and obj != literal:
+                raise ValidationError(
+                    MSG_LITERAL, literal, obj, code="invalid_literal", value=obj
+                )
 
-        raise ValidationError(f"key {key!r} not found, but is required")
+            return obj
+
+        return parse
+
+    def _compile_find(self) -> Callable[[dict[Any, Any], Any], Any]:
+        return self._make_find(self._compile(), self._f_optional, self._f_nullable)
+
+    def _codegen(self, gen: _CodeGen) -> str:
+        lines = ["if isinstance(obj, bool):", "    pass"]
+
+        if self._f_leaniant:
+            _, re_true, re_false, words = self._c_leaniant
+            re_true, re_false = gen.pattern(re_true), gen.pattern(re_false)
+            words = gen.const(repr(words))
+            error_regex = gen.error(
+                "invalid_value",
+                f"object has to be regex (true: {self._m_leaniant[0]!r}, false: "
+                f"{self._m_leaniant[1]!r}) accepted boolean value, but is ",
+                ("obj", "r"),
+                value="obj",
+            )
+            error_number = gen.error(
+                "invalid_value", "object has to be 1 or 0, but is ", ("obj", "r"), value="obj"
+            )
+            lines += [
+                "elif isinstance(obj, str):",
+                "    lower = obj.lower()",
+                f"    value = {words}.get(lower)",
+                "    if value is not None:",
+                "        obj = value",
+                f"    elif {re_true}.match(lower):",
+                "        obj = True",
+                f"    elif {re_false}.match(lower):",
+                "        obj = False",
+                "    else:",
+                f"        raise {error_regex}",
+                "elif isinstance(obj, int | float):",
+                "    if math.isnan(obj):",
+                "        obj = False",
+                "    elif int(obj) == 1:",
+                "        obj = True",
+                "    elif int(obj) == 0:",
+                "        obj = False",
+                "    else:",
+                f"        raise {error_number}",
+            ]
+
+        error_type = gen.error(
+            "invalid_type", "object has to be a boolean, but is ", ("obj", "r"), value="obj"
+        )
+        lines += ["else:", f"    raise {error_type}"]
+
+        if self._m_literal is not None:
+            error_literal = gen.error(
+                "invalid_literal",
+                f"object has to be {self._m_literal}, but is ",
+                ("obj", "s"),
+                value="obj",
+            )
+            lines += [f"if obj != {self._m_literal!r}:", f"    raise {error_literal}"]
+
+        return gen.function("boolean", [*lines, "return obj"])
+
+    def _codegen_find(self, gen: _CodeGen, key: Any) -> list[str]:
+        return emit_find(gen, self._codegen(gen), key, self._f_optional, self._f_nullable)
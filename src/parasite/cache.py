@@ -0,0 +1,219 @@
+# -- Future Imports -- (Use with caution, may not work as expected in all cases)
+from __future__ import annotations
+
+# -- STL Imports --
+import contextlib
+import functools
+import hashlib
+import importlib.metadata
+import importlib.util
+import marshal
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from types import CodeType
+from typing import TYPE_CHECKING, TypeVar
+
+# -- Library Imports --
+import tracing
+
+# -- Package Imports --
+from parasite import _codegen
+from parasite.compiler import CompiledSchema
+
+if TYPE_CHECKING:
+    from parasite.type import ParasiteType
+
+T = TypeVar("T")
+"""Template type for the destination value."""
+
+SUFFIX = ".marshal"
+"""File suffix of the cache entries."""
+
+
+@functools.cache
+def _build_tag() -> str:
+    """
+    Tag of the current ``parasite`` build. Changes whenever the version of ``parasite``, the python
+    bytecode format or the source of ``parasite`` itself changes, and therefore invalidates all
+    entries written by other builds.
+
+    Returns:
+        str: the build tag
+    """
+    try:
+        version = importlib.metadata.version("parasite")
+
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+
+    digest = hashlib.sha256(version.encode())
+    digest.update(importlib.util.MAGIC_NUMBER)
+
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+
+    return digest.hexdigest()
+
+
+@dataclass
+class SchemaCache:
+    """
+    Persistent on-disk cache for schemas compiled with the ``"codegen"`` backend. Every entry holds
+    the generated source and its compiled code object, and is keyed by the fingerprint of the
+    schema (see :func:`parasite.type.ParasiteType.fingerprint`). Loading an entry skips source
+    generation and compilation, which makes starting up processes that compile the same schemas
+    again and again a lot cheaper.
+
+    Entries are invalidated automatically, if the schema, the version of ``parasite`` or the python
+    bytecode format changes. Stale entries are never read again, but are also not removed from the
+    directory; use :func:`clear` for that.
+
+    Note:
+        Schemas that cannot be fingerprinted (e.g. objects with keys, that are not ``None``,
+        ``bool``, ``int``, ``float``, ``str``, ``bytes`` or tuples of those) are compiled as usual,
+        but are never written to the cache.
+
+    Inheritance:
+        .. inheritance-diagram:: parasite.cache.SchemaCache
+            :parts: 1
+
+    Example usage:
+        Let's assume we have the following schema::
+
+            from parasite import p
+            from parasite.cache import SchemaCache
+
+            cache = SchemaCache("/var/cache/my-app/parasite")
+            schema = p.obj({
+                "name": p.string().required(),
+                "age": p.number().integer().min(0).optional(),
+            }).compile("codegen", cache=cache)
+
+        The first process compiles the schema and writes it into the cache. Every following process
+        loads the compiled schema from the cache::
+
+            >>> schema.parse({ "name": "John", "age": 42 })
+            { "name": "John", "age": 42 }
+    """
+
+    _m_directory: Path  # Directory the entries are stored in.
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        """
+        Args:
+            directory (str | os.PathLike[str]): directory to store the entries in. Is created on
+                the first write, if it does not exist.
+        """
+        self._m_directory = Path(directory)
+
+    @property
+    def directory(self) -> Path:
+        """
+        Returns:
+            Path: directory the entries are stored in
+        """
+        return self._m_directory
+
+    def key(self, schema: ParasiteType) -> str | None:
+        """
+        Computes the key of a schema inside the cache.
+
+        Args:
+            schema (ParasiteType): schema to compute the key for
+
+        Returns:
+            str | None: the key, or ``None`` if the schema cannot be cached
+        """
+        try:
+            fingerprint = schema.fingerprint()
+
+        except TypeError:
+            return None
+
+        return hashlib.sha256(f"{_build_tag()}:{fingerprint}".encode()).hexdigest()
+
+    def compile(self, schema: ParasiteType[T]) -> CompiledSchema[T]:
+        """
+        Compiles a schema with the ``"codegen"`` backend. The compiled code is loaded from the
+        cache if possible, else it is generated and written to the cache.
+
+        Args:
+            schema (ParasiteType[T]): schema to compile
+
+        Returns:
+            CompiledSchema[T]: compiled schema
+        """
+        if (key := self.key(schema)) is None:
+            return schema.compile("codegen")
+
+        path = self._m_directory / f"{key}{SUFFIX}"
+
+        if (entry := self._read(path)) is not None:
+            source, name, code = entry
+
+        else:
+            source, name, gen = _codegen.generate(schema)
+            code = _codegen.build(source)
+
+            # runtime objects cannot be stored, so only cache self-contained source, and load
+            # everything else with the runtime objects of the generator
+            if not gen.portable:
+                parse = _codegen.load(code, source, name, gen.namespace())
+                return CompiledSchema(schema, parse, source)
+
+            self._write(path, marshal.dumps((_build_tag(), source, name, code)))
+
+        # entries are self-contained, so they only need the default namespace
+        namespace = _codegen._CodeGen().namespace()
+        return CompiledSchema(schema, _codegen.load(code, source, name, namespace), source)
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache, including entries written by other builds.
+        """
+        for path in self._m_directory.glob(f"*{SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+    def _read(self, path: Path) -> tuple[str, str, CodeType] | None:
+        try:
+            entry = marshal.loads(path.read_bytes())
+
+        # missing, unreadable and corrupted entries are handled like cache misses
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if (
+            type(entry) is not tuple
+            or len(entry) != 4
+            or entry[0] != _build_tag()
+            or not isinstance(entry[3], CodeType)
+        ):
+            return None
+
+        return entry[1], entry[2], entry[3]
+
+    def _write(self, path: Path, data: bytes) -> None:
+        temp: Path | None = None
+
+        try:
+            self._m_directory.mkdir(parents=True, exist_ok=True)
+
+            # write to a temporary file first, so that concurrent readers never see partial entries
+            with tempfile.NamedTemporaryFile(
+                dir=self._m_directory, prefix=".", suffix=".tmp", delete=False
+            ) as file:
+                temp = Path(file.name)
+                file.write(data)
+
+            os.replace(temp, path)
+
+        except OSError as exc:
+            # the temporary file is only removed by the replace, so remove it on failure
+            if temp is not None:
+                with contextlib.suppress(OSError):
+                    temp.unlink(missing_ok=True)
+
+            tracing.warn(f"could not write schema cache entry {str(path)!r}: {exc}")
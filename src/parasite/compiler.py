@@ -0,0 +1,184 @@
+# -- Future Imports -- (Use with caution, may not work as expected in all cases)
+from __future__ import annotations
+
+# -- STL Imports --
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Generic, Iterable, TypeVar
+
+# -- Library Imports --
+from rusttypes.result import Err, Ok, Result
+
+# -- Package Imports --
+from parasite.errors import ValidationError
+
+if TYPE_CHECKING:
+    from parasite.type import ParasiteType
+
+T = TypeVar("T")
+"""Template type for the destination value."""
+
+
+@dataclass
+class CompiledSchema(Generic[T]):
+    """
+    Compiled version of a ``parasite`` schema. The schema tree is walked once and turned into a
+    single flattened callable, with all flags, bounds and regexes already resolved. Parsing with a
+    compiled schema behaves exactly like :func:`parasite.type.ParasiteType.parse`, but skips the
+    interpretation overhead of the schema tree.
+
+    Note:
+        Please use ``schema.compile()`` instead of instantiating this class directly.
+
+    Warning:
+        A compiled schema is a snapshot of the schema at the time :func:`compile` was called.
+        Changes made to the schema afterwards are not reflected in the compiled schema.
+
+    Inheritance:
+        .. inheritance-diagram:: parasite.compiler.CompiledSchema
+            :parts: 1
+
+    Example usage:
+        Let's assume we have the following schema::
+
+            from parasite import p
+
+            schema = p.obj({
+                "name": p.string().required(),
+                "age": p.number().integer().min(0).optional(),
+            }).compile()
+
+        The compiled schema will parse the following objects::
+
+            >>> schema.parse({ "name": "John", "age": 42 })
+            { "name": "John", "age": 42 }
+
+            >>> schema.parse({ })
+            ValidationError: key "name" not found, but is required
+    """
+
+    _m_schema: ParasiteType[T]  # The schema this instance was compiled from.
+    _m_parse: Callable[[Any], T]  # The flattened parsing function.
+    _m_source: str | None = None  # The generated python source, if compiled with codegen.
+
+    @property
+    def schema(self) -> ParasiteType[T]:
+        """
+        Returns:
+            ParasiteType[T]: The schema this instance was compiled from.
+        """
+        return self._m_schema
+
+    @property
+    def source(self) -> str | None:
+        """
+        Returns:
+            str | None: The generated python source, if the schema was compiled with the
+            ``"codegen"`` backend, else ``None``.
+        """
+        return self._m_source
+
+    @property
+    def function(self) -> Callable[[Any], T]:
+        """
+        Returns:
+            Callable[[Any], T]: The raw flattened parsing function. Calling it directly saves one
+            level of indirection compared to :func:`parse`.
+        """
+        return self._m_parse
+
+    def parse(self, obj: Any) -> T:
+        """
+        Parses a value with the compiled schema.
+
+        Throws:
+            ValidationError: if the value could not be parsed or was invalid
+
+        Args:
+            obj (Any): value to parse
+
+        Returns:
+            T: parsed destination value
+        """
+        return self._m_parse(obj)
+
+    def parse_safe(self, obj: Any) -> Result[T, ValidationError]:
+        """
+        Converts the result of :func:`parse` into a :class:`rusttypes.result.Result` type.
+
+        Note:
+            Will only catch :class:`parasite.errors.ValidationError` exceptions!!!
+
+        Args:
+            obj (Any): value to parse
+
+        Returns:
+            Result[T, ValidationError]: parsed destination value or an error
+        """
+        try:
+            # may throw a ValidationError exception
+            return Ok(self._m_parse(obj))
+
+        # handle ValidationError exceptions, if parsing fails
+        except ValidationError as exc:
+            return Err(exc)
+
+    def parse_many(self, objs: Iterable[Any]) -> list[T]:
+        """
+        Parses a batch of values with the compiled schema. Equivalent to calling :func:`parse` for
+        every value, but without the per-value call overhead.
+
+        Throws:
+            ValidationError: if any of the values could not be parsed or was invalid; the message
+                contains the index of the first invalid value
+
+        Args:
+            objs (Iterable[Any]): values to parse
+
+        Returns:
+            list[T]: parsed destination values, in the same order as the values
+        """
+        parse = self._m_parse
+        results: list[T] = []
+        append = results.append
+
+        try:
+            for obj in objs:
+                append(parse(obj))
+
+        # the length of the results is the index of the value, that failed to parse
+        except ValidationError as exc:
+            raise exc.nested("object at index {} is invalid: {}", len(results)) from exc
+
+        return results
+
+    def parse_many_safe(self, objs: Iterable[Any]) -> list[Result[T, ValidationError]]:
+        """
+        Parses a batch of values with the compiled schema, and converts the result of every value
+        into a :class:`rusttypes.result.Result` type. Equivalent to calling :func:`parse_safe` for
+        every value.
+
+        Note:
+            Will only catch :class:`parasite.errors.ValidationError` exceptions!!!
+
+        Args:
+            objs (Iterable[Any]): values to parse
+
+        Returns:
+            list[Result[T, ValidationError]]: parsed destination values or errors, in the same
+            order as the values
+        """
+        parse = self._m_parse
+        results: list[Result[T, ValidationError]] = []
+        append = results.append
+
+        for obj in objs:
+            try:
+                append(Ok(parse(obj)))
+
+            except ValidationError as exc:
+                append(Err(exc))
+
+        return results
+
+    def __call__(self, obj: Any) -> T:
+        return self._m_parse(obj)
@@ -1,6 +1,46 @@
+# -- Future Imports -- (Use with caution, may not work as expected in all cases)
+from __future__ import annotations
+
+# -- STL Imports --
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from parasite.type import ParasiteType
+
+
+@dataclass(frozen=True)
+class ErrorDetail:
+    """
+    Structured record of a single failure, collected while parsing with ``collect_errors=True``
+    (see :func:`parasite.type.ParasiteType.parse`).
+
+    Inheritance:
+        .. inheritance-diagram:: parasite.errors.ErrorDetail
+            :parts: 1
+    """
+
+    path: tuple[Any, ...]  # Keys and indices leading from the root value to the failing value.
+    schema: ParasiteType  # Schema node, that failed to parse the value.
+    code: str  # Kind of the failure, e.g. ``"missing_key"`` or ``"invalid_value"``.
+    value: Any  # The offending value.
+    message: str  # Human readable description of the failure.
+
+    def __str__(self) -> str:
+        return f"at {self.path!r}: {self.message}"
+
+
 class ValidationError(Exception):
     """
-    Validation error that is raised when a value does not match the expected type.
+    Validation error that is raised when a value does not match the expected type. Carries the kind
+    of the failure (:attr:`code`), the path to the failing value (:attr:`path`) and the failing
+    value itself (:attr:`value`). The message is only formatted, when it is accessed (e.g. through
+    ``str(..)``), so that errors which are caught and discarded (e.g. by
+    :class:`parasite.variant.Variant` or the ``*_safe`` methods) are cheap.
+
+    If the value was parsed with ``collect_errors=True`` (see
+    :func:`parasite.type.ParasiteType.parse`), every failure is available as :class:`ErrorDetail`
+    in :attr:`errors`.
 
     Inheritance:
         .. inheritance-diagram:: parasite.errors.ValidationError
@@ -28,4 +68,77 @@ class ValidationError(Exception):
             except errors.ValidationError as e:
                 print(e)
                 # key "name" not found, but is required
+                print(e.code, e.path)
+                # missing_key ('name',)
     """
+
+    code: str  # Kind of the failure, e.g. ``"missing_key"`` or ``"invalid_type"``.
+    path: tuple[Any, ...]  # Keys and indices leading from the parsed value to the failing value.
+    value: Any  # The offending value.
+    errors: list[ErrorDetail]  # Collected failures, empty if not parsed with ``collect_errors``.
+
+    _c_message: str | None  # Cache of the formatted message.
+
+    def __init__(
+        self,
+        msg: str = "",
+        *params: Any,
+        code: str = "invalid_value",
+        value: Any = None,
+        path: tuple[Any, ...] = (),
+        errors: list[ErrorDetail] | None = None,
+    ) -> None:
+        """
+        Args:
+            msg (str): the message, or a :func:`str.format` template of the message, if ``params``
+                are passed. Default: ""
+            *params (Any): positional parameters of the template, formatted lazily
+            code (str): kind of the failure. Default: "invalid_value"
+            value (Any): the offending value. Default: None
+            path (tuple[Any, ...]): path to the failing value. Default: ()
+            errors (list[ErrorDetail] | None): collected failures. Default: None
+        """
+        super().__init__(msg, *params)
+        self.code = code
+        self.value = value
+        self.path = path
+        self.errors = errors if errors is not None else []
+        self._c_message = None if params else msg
+
+    @property
+    def message(self) -> str:
+        """
+        Returns:
+            str: the formatted message
+        """
+        if self._c_message is None:
+            msg, *params = self.args
+            self._c_message = msg.format(*params)
+
+        return self._c_message
+
+    def nested(self, msg: str, key: Any) -> ValidationError:
+        """
+        Wraps the error of a child value (e.g. an element of a list) into an error of its parent.
+        The message of the child is only formatted, when the message of the parent is accessed.
+
+        Args:
+            msg (str): :func:`str.format` template of the message, with the key as first and the
+                child error as second parameter
+            key (Any): key or index of the child value
+
+        Returns:
+            ValidationError: error of the parent, with ``key`` prepended to the path, and this
+            error as its cause
+        """
+        error = ValidationError(
+            msg, key, self, code=self.code, value=self.value, path=(key, *self.path)
+        )
+        error.__cause__ = self
+        return error
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.message!r})"
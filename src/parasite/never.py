@@ -3,14 +3,12 @@ from __future__ import annotations
 
 # -- STL Imports --
 from dataclasses import dataclass
-from typing import Any, TypeVar
-
-# -- Library Imports --
-from rusttypes.option import Nil, Option
+from typing import Any, Callable, TypeVar
 
 # -- Package Imports --
+from parasite._codegen import _CodeGen
 from parasite.errors import ValidationError
-from parasite.type import ParasiteType, _NotFound
+from parasite.type import ParasiteType, _Failure, _NotFound
 
 K = TypeVar("K")
 """Template type for the key in a dictionary."""
@@ -34,13 +32,57 @@ class Never(ParasiteType[None]):
     def __init__(self) -> None:
         pass
 
-    def parse(self, obj: Any) -> None:
+    def parse(self, obj: Any, collect_errors: bool = False, max_errors: int | None = None) -> None:
+        if collect_errors:
+            return self._parse_collect(obj, max_errors)
+
+        return self._unwrap(Never._check(self, obj))
+
+    def _check(self, obj: Any) -> Any:
+        # always fail, as this type can never be parsed
+        return _Failure(ValidationError("this type can never be parsed", code="never", value=obj))
+
+    def _accepts(self, cls: type) -> bool:
+        return False
+
+    def _find_and_parse_raw(self, parent: dict[K, Any], key: K) -> Any:
+        return self._unwrap(Never._check_find(self, parent, key))
+
+    def _check_find(self, parent: dict[K, Any], key: K) -> Any:
+        # if key is found, fail
+        if (value := parent.get(key, _NotFound)) is not _NotFound:
+            msg = "key {!r} found, but this type can never be parsed"
+            return _Failure(ValidationError(msg, key, code="never", value=value))
+
+        return _NotFound
+
+    def _compile(self) -> Callable[[Any], None]:
+        def parse(obj: Any) -> None:
+            # always raise an error, as this type can never be parsed
+            raise ValidationError("this type can never be parsed", code="never", value=obj)
+
+        return parse
+
+    def _compile_find(self) -> Callable[[dict[Any, Any], Any], Any]:
+        def find(parent: dict[Any, Any], key: Any) -> Any:
+            # if key is found, raise an error
+            if (value := parent.get(key, _NotFound)) is not _NotFound:
+                msg = "key {!r} found, but this type can never be parsed"
+                raise ValidationError(msg, key, code="never", value=value)
+
+            return _NotFound
+
+        return find
+
+    def _codegen(self, gen: _CodeGen) -> str:
         # always raise an error, as this type can never be parsed
-        raise ValidationError("this type can never be parsed")
+        error = gen.error("never", "this type can never be parsed", value="obj")
+        return gen.function("never", [f"raise {error}"])
 
-    def _find_and_parse(self, parent: dict[K, Any], key: K) -> Option[None]:
+    def _codegen_find(self, gen: _CodeGen, key: Any) -> list[str]:
         # if key is found, raise an error
-        if parent.get(key, _NotFound) is not _NotFound:
-            raise ValidationError(f"key {key!r} found, but this type can never be parsed")
-
-        return Nil
+        expr = gen.literal(key)
+        error = gen.error(
+            "never", f"key {key!r} found, but this type can never be parsed", value=f"obj[{expr}]"
+        )
+        return [f"if {expr} in obj:", f"    raise {error}"]
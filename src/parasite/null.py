@@ -3,18 +3,19 @@ from __future__ import annotations
 
 # -- STL Imports --
 from dataclasses import dataclass
-from typing import Any, TypeVar
-
-# -- Library Imports --
-from rusttypes.option import Nil, Option, Some
+from typing import Any, Callable, TypeVar
 
 # -- Package Imports --
+from parasite._codegen import _CodeGen
 from parasite.errors import ValidationError
-from parasite.type import ParasiteType, _NotFound
+from parasite.type import ParasiteType, _Failure, _NotFound
 
 K = TypeVar("K")
 """Template type for the key in a dictionary."""
 
+NOT_NONE = frozenset({bool, int, float, complex, str, bytes, bytearray, list, dict, tuple, set})
+"""Builtin types, whose values are never equal to None."""
+
 
 @dataclass
 class Null(ParasiteType[None]):
@@ -112,21 +113,95 @@ class Null(ParasiteType[None]):
         self._f_optional = False
         return self
 
-    def parse(self, obj: Any) -> None:
+    def parse(self, obj: Any, collect_errors: bool = False, max_errors: int | None = None) -> None:
+        if collect_errors:
+            return self._parse_collect(obj, max_errors)
+
+        return self._unwrap(Null._check(self, obj))
+
+    def _check(self, obj: Any) -> Any:
         # do a loose comparison to None, to allow for subclasses of None
         if obj == None:  # noqa: E711
             return None
 
-        # else raise an error
-        raise ValidationError(f"object has to be None, but is {obj!r}")
+        # else fail
+        msg = "object has to be None, but is {!r}"
+        return _Failure(ValidationError(msg, obj, code="invalid_type", value=obj))
 
-    def _find_and_parse(self, parent: dict[K, Any], key: K) -> Option[None]:
-        # if key is found, just package ``parse(..)`` it into a Some
+    def _accepts(self, cls: type) -> bool:
+        # only the exact builtin types are known to never be equal to None
+        return cls not in NOT_NONE
+
+    def _find_and_parse_raw(self, parent: dict[K, Any], key: K) -> Any:
+        return self._unwrap(Null._check_find(self, parent, key))
+
+    def _check_find(self, parent: dict[K, Any], key: K) -> Any:
+        # if key is found, just ``_check(..)`` it
         if (value := parent.get(key, _NotFound)) is not _NotFound:
-            return Some(self.parse(value))
+            return self._check(value)
 
-        # if key is not found, return Nil if optional, else raise an error
+        # if key is not found, return _NotFound if optional, else fail
         if self._f_optional:
-            return Nil
-
-        raise ValidationError(f"key {key!r} not found, but is required")
+            return _NotFound
+
+        msg = "key {!r} not found, but is required"
+        return _Failure(ValidationError(msg, key, code="missing_key"))
+
+    def _compile(self) -> Callable[[Any], None]:
+        def parse(obj: Any) -> None:
+            # do a loose comparison to None, to allow for subclasses of None
+            if obj == None:  # noqa: E711
+                return None
+
+            raise ValidationError(
+                "object has to be None, but is {!r}", obj, code="invalid_type", value=obj
+            )
+
+        return parse
+
+    def _compile_find(self) -> Callable[[dict[Any, Any], Any], Any]:
+        parse = self._compile()
+        optional = self._f_optional
+
+        def find(parent: dict[Any, Any], key: Any) -> Any:
+            if (value := parent.get(key, _NotFound)) is not _NotFound:
+                return parse(value)
+
+            # if key is not found, return _NotFound if optional, else raise an error
+            if optional:
+                return _NotFound
+
+            raise ValidationError("key {!r} not found, but is required", key, code="missing_key")
+
+        return find
+
+    def _codegen(self, gen: _CodeGen) -> str:
+        error = gen.error(
+            "invalid_type", "object has to be None, but is ", ("obj", "r"), value="obj"
+        )
+        return gen.function(
+            "null",
+            [
+                "if obj == None:  # noqa: E711",
+                "    return None",
+                f"raise {error}",
+            ],
+        )
+
+    def _codegen_find(self, gen: _CodeGen, key: Any) -> list[str]:
+        parse = self._codegen(gen)
+        expr = gen.literal(key)
+        lines = [
+            f"value = obj.get({expr}, _NotFound)",
+            "if value is not _NotFound:",
+            *gen.indent(gen.store(expr, f"{parse}(value)")),
+        ]
+
+        # if key is not found, skip it if optional, else raise an error
+        if not self._f_optional:
+            lines += [
+                "else:",
+                f"    raise {gen.error('missing_key', f'key {key!r} not found, but is required')}",
+            ]
+
+        return lines
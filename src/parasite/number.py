@@ -2,15 +2,16 @@
 from __future__ import annotations
 
 # -- STL Imports --
-from dataclasses import dataclass
-from typing import Any, TypeVar
-
-# -- Library Imports --
-from rusttypes.option import Nil, Option, Some
+import functools
+import operator
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
 
 # -- Package Imports --
+from parasite import _vector
+from parasite._codegen import _CodeGen, emit_find
 from parasite.errors import ValidationError
-from parasite.type import ParasiteType, _NotFound
+from parasite.type import ParasiteType, _Failure, _NotFound
 from parasite._utils import map_optional
 
 K = TypeVar("K")
@@ -19,6 +20,32 @@ K = TypeVar("K")
 Numerical = int | float
 
 
+MSG_LT = "object has to be < '{}', but is {!r}"
+"""Message template for values, that are not less than the upper limit."""
+
+MSG_LTE = "object has to be =<'{}', but is {!r}"
+"""Message template for values, that are greater than the upper limit."""
+
+MSG_GT = "object has to be > '{}', but is {!r}"
+"""Message template for values, that are not greater than the lower limit."""
+
+MSG_GTE = "object has to be >='{}', but is {!r}"
+"""Message template for values, that are less than the lower limit."""
+
+MSG_INTEGER = "object has to be an integer, but is {!r}"
+"""Message template for floats, if the value has to be an integer."""
+
+MSG_TYPE = "object has to be a number, but is {!r}"
+"""Message template for values, that are not a number."""
+
+FAILS: dict[str, tuple[Callable[[Any, Any], bool], str, str]] = {
+    ">=": (operator.ge, MSG_LT, "too_big"),
+    ">": (operator.gt, MSG_LTE, "too_big"),
+    "<=": (operator.le, MSG_GT, "too_small"),
+    "<": (operator.lt, MSG_GTE, "too_small"),
+}
+"""Comparison, message template and code of each failing comparison (see :func:`Number._bounds`)."""
+
 @dataclass
 class Number(ParasiteType[Numerical]):
     """
@@ -46,6 +73,11 @@ class Number(ParasiteType[Numerical]):
     _m_ul: Numerical | None = None  # Upper limit for the value
     _m_ll: Numerical | None = None  # Lower limit for the value
 
+    # Resolved bounds and their checking function, rebuilt whenever a field changes.
+    _c_bounds: tuple[tuple[tuple[str, Numerical], ...], Callable[[Numerical], Any]] = field(
+        default=((), lambda obj: obj), compare=False, repr=False
+    )
+
     def __init__(self) -> None:
         pass
 
@@ -241,41 +273,29 @@ class Number(ParasiteType[Numerical]):
 
     def _parse(self, obj: Numerical) -> Numerical:
         """
-        Private function for parsing the value. This function is called by ``parse(..)`` and should
-        not be called directly by the user.
-
-        Throws:
-            ValidationError: if the value could not be parsed or was invalid
+        Private function for parsing the value. This function is called by ``_check(..)`` and
+        should not be called directly by the user.
 
         Args:
             obj (Numerical): value to parse
 
         Returns:
-            Numerical: parsed destination value
+            Numerical: parsed destination value, or ``_Failure`` if the value is out of bounds
         """
-        # cast to integer, if required
-        if self._f_integer:
-            self._m_ll = map_optional(int, self._m_ll)
-            self._m_ul = map_optional(int, self._m_ul)
-
-        # validate upper limit values and guard clauses
-        if self._f_lt and obj >= self._m_ul:
-            raise ValidationError(f"object has to be < '{self._m_ul}', but is {obj!r}")
-
-        elif self._f_lte and obj > self._m_ul:
-            raise ValidationError(f"object has to be =<'{self._m_ul}', but is {obj!r}")
-
-        # validate lower limit values and guard clauses
-        if self._f_gt and obj <= self._m_ll:
-            raise ValidationError(f"object has to be > '{self._m_ll}', but is {obj!r}")
+        return self._c_bounds[1](obj)
 
-        elif self._f_gte and obj < self._m_ll:
-            raise ValidationError(f"object has to be >='{self._m_ll}', but is {obj!r}")
+    def parse(
+        self,
+        obj: Any,
+        collect_errors: bool = False,
+        max_errors: int | None = None,
+    ) -> Numerical:
+        if collect_errors:
+            return self._parse_collect(obj, max_errors)
 
-        # return the parsed value
-        return obj
+        return self._unwrap(Number._check(self, obj))
 
-    def parse(self, obj: Any) -> Numerical:
+    def _check(self, obj: Any) -> Any:
         # python handles bool as int, so we have to check for bool first
         if isinstance(obj, bool):
             # fallthrough on boolean values
@@ -283,28 +303,269 @@ class Number(ParasiteType[Numerical]):
 
         elif isinstance(obj, float):
             if self._f_integer:
-                raise ValidationError(f"object has to be an integer, but is {obj!r}")
-            return float(self._parse(obj))
+                return _Failure(ValidationError(MSG_INTEGER, obj, code="not_integer", value=obj))
+            value = self._parse(obj)
+            return value if type(value) is _Failure else float(value)
 
         elif isinstance(obj, int):
-            return int(self._parse(obj))
+            value = self._parse(obj)
+            return value if type(value) is _Failure else int(value)
+
+        return _Failure(ValidationError(MSG_TYPE, obj, code="invalid_type", value=obj))
+
+    def _accepts(self, cls: type) -> bool:
+        # python handles bool as int, but booleans are never numbers
+        return issubclass(cls, (int, float)) and not issubclass(cls, bool)
 
-        raise ValidationError(f"object has to be a number, but is {obj!r}")
+    def _find_and_parse_raw(self, parent: dict[K, Any], key: K) -> Any:
+        return self._unwrap(Number._check_find(self, parent, key))
 
-    def _find_and_parse(self, parent: dict[K, Any], key: K) -> Option[Numerical | None]:
+    def _check_find(self, parent: dict[K, Any], key: K) -> Any:
         if (value := parent.get(key, _NotFound)) is not _NotFound:
-            # if key is found, just package ``parse(..)`` it into a Some
+            # if key is found, just ``_check(..)`` it
             if value is not None:
-                return Some(self.parse(value))
+                return self._check(value)
 
             # if value is None, check if the value is nullable
             if self._f_nullable:
-                return Some(None)
+                return None
 
-            raise ValidationError(f"key {key!r} is not nullable, but is None")
+            msg = "key {!r} is not nullable, but is None"
+            return _Failure(ValidationError(msg, key, code="not_nullable"))
 
-        # if key is not found, return Nil if optional, else raise an error
+        # if key is not found, return _NotFound if optional, else fail
         if self._f_optional:
-            return Nil
+            return _NotFound
+
+        msg = "key {!r} not found, but is required"
+        return _Failure(ValidationError(msg, key, code="missing_key"))
+
+    def _refresh(self) -> None:
+        self._c_bounds = self._resolve()
+
+    def _resolve(self) -> tuple[tuple[tuple[str, Numerical], ...], Callable[[Numerical], Any]]:
+        """
+        Resolves the bounds of the value (see :func:`_bounds`). Called whenever a field changes (see
+        :func:`parasite.type.ParasiteType._refresh`), so that parsing does not have to resolve them.
+
+        Returns:
+            tuple[tuple[tuple[str, Numerical], ...], Callable[[Numerical], Any]]: the bounds, and
+            the checking function of the bounds
+        """
+        bounds = self._bounds()
+        return bounds, self._compile_bounds(bounds)
+
+    @staticmethod
+    def _compile_bounds(bounds: tuple[tuple[str, Numerical], ...]) -> Callable[[Numerical], Any]:
+        """
+        Compiles the bounds of the value into a single checking function, with one comparison per
+        bound and no flags to test.
+
+        Args:
+            bounds (tuple[tuple[str, Numerical], ...]): resolved bounds (see :func:`_bounds`)
+
+        Returns:
+            Callable[[Numerical], Any]: checking function, that returns the value, or ``_Failure``
+            if the value is out of bounds
+        """
+        if not bounds:
+            return lambda obj: obj
+
+        if len(bounds) == 1:
+            (op, limit), = bounds
+            fail, msg, code = FAILS[op]
+
+            def check(obj: Numerical) -> Any:
+                if fail(obj, limit):
+                    return _Failure(ValidationError(msg, limit, obj, code=code, value=obj))
+
+                return obj
+
+            return check
+
+        (op_ul, ul), (op_ll, ll) = bounds
+        fail_ul, msg_ul, code_ul = FAILS[op_ul]
+        fail_ll, msg_ll, code_ll = FAILS[op_ll]
+
+        def check_both(obj: Numerical) -> Any:
+            # validate upper limit values and guard clauses
+            if fail_ul(obj, ul):
+                return _Failure(ValidationError(msg_ul, ul, obj, code=code_ul, value=obj))
+
+            # validate lower limit values and guard clauses
+            if fail_ll(obj, ll):
+                return _Failure(ValidationError(msg_ll, ll, obj, code=code_ll, value=obj))
+
+            return obj
+
+        return check_both
 
-        raise ValidationError(f"key {key!r} not found, but is required")
+    def _compile(self) -> Callable[[Any], Numerical]:
+        integer = self._f_integer
+        bounds, check = self._c_bounds
+        check = check if bounds else None
+
+        def parse(obj: Any) -> Numerical:
+            # python handles bool as int, so we have to check for bool first
+            if isinstance(obj, bool):
+                pass
+
+            elif isinstance(obj, float):
+                if integer:
+                    raise ValidationError(MSG_INTEGER, obj, code="not_integer", value=obj)
+                if check is not None and type(failure := check(obj)) is _Failure:
+                    raise failure.error
+                return float(obj)
+
+            elif isinstance(obj, int):
+                if check is not None and type(failure := check(obj)) is _Failure:
+                    raise failure.error
+                return int(obj)
+
+            raise ValidationError(MSG_TYPE, obj, code="invalid_type", value=obj)
+
+        return parse
+
+    def _compile_find(self) -> Callable[[dict[Any, Any], Any], Any]:
+        return self._make_find(self._compile(), self._f_optional, self._f_nullable)
+
+    def _parse_column(self, rows: list[dict[Any, Any]], key: Any, values: list[Any]) -> None:
+        column = [row.get(key, _NotFound) for row in rows]
+
+        # fast path: if every value is a plain number, the bounds only have to be checked against
+        # the smallest and largest value of the column
+        if column and self._valid_column(column):
+            values.extend(column)
+            return
+
+        # else find the failing row (or parse mixed columns) value by value
+        super()._parse_column(rows, key, values)
+
+    def _valid_column(self, column: list[Any]) -> bool:
+        """
+        Checks if a column of values is valid as a whole. Only columns of plain ``int`` (and
+        ``float``, if not :func:`integer`) values are supported, as only for those parsing returns
+        the value itself.
+
+        Args:
+            column (list[Any]): values of the column
+
+        Returns:
+            bool: ``True`` if every value is valid, ``False`` if the column is invalid or has to be
+            checked value by value
+        """
+        types = set(map(type, column))
+
+        if not types <= ({int} if self._f_integer else {int, float}):
+            return False
+
+        if not (bounds := self._c_bounds[0]):
+            return True
+
+        # nan passes every bound, but breaks min/max, so leave it to the slow path
+        if float in types and any(value != value for value in column):
+            return False
+
+        # the largest value is the first to fail the upper limit, the smallest the lower limit
+        for op, limit in bounds:
+            if FAILS[op][0](max(column) if op in (">=", ">") else min(column), limit):
+                return False
+
+        return True
+
+    def _bounds(self) -> tuple[tuple[str, Numerical], ...]:
+        """
+        Collects the active bounds of the value. Equivalent to :func:`_parse`.
+
+        Returns:
+            tuple[tuple[str, Numerical], ...]: failing comparison (one of ``">="``, ``">"``,
+            ``"<="``, ``"<"``) and limit of each active bound
+        """
+        ll, ul = self._m_ll, self._m_ul
+        bounds: list[tuple[str, Numerical]] = []
+
+        # cast to integer, if required
+        if self._f_integer:
+            ll = map_optional(int, ll)
+            ul = map_optional(int, ul)
+
+        # validate upper limit values and guard clauses
+        if self._f_lt:
+            bounds.append((">=", ul))
+
+        elif self._f_lte:
+            bounds.append((">", ul))
+
+        # validate lower limit values and guard clauses
+        if self._f_gt:
+            bounds.append(("<=", ll))
+
+        elif self._f_gte:
+            bounds.append(("<", ll))
+
+        return tuple(bounds)
+
+    def _codegen_bounds(self, gen: _CodeGen) -> list[str]:
+        """
+        Generates the python source for the bounds of the value. Equivalent to :func:`_parse`.
+
+        Args:
+            gen (_CodeGen): code generator
+
+        Returns:
+            list[str]: lines of source
+        """
+        # messages and codes of the failing comparisons
+        messages = {
+            ">=": ("object has to be < '{}', but is ", "too_big"),
+            ">": ("object has to be =<'{}', but is ", "too_big"),
+            "<=": ("object has to be > '{}', but is ", "too_small"),
+            "<": ("object has to be >='{}', but is ", "too_small"),
+        }
+        lines: list[str] = []
+
+        for op, limit in self._c_bounds[0]:
+            msg, code = messages[op]
+            error = gen.error(code, msg.format(limit), ("obj", "r"), value="obj")
+            lines += [f"if obj {op} {gen.literal(limit)}:", f"    raise {error}"]
+
+        return lines
+
+    def _vectorize(self) -> Callable[[Any], int | None] | None:
+        return functools.partial(
+            _vector.first_invalid, integer=self._f_integer, bounds=self._c_bounds[0]
+        )
+
+    def _codegen_vector(self, gen: _CodeGen, values: str) -> str | None:
+        bounds = gen.literal(self._c_bounds[0])
+        return f"_vector.first_invalid({values}, {self._f_integer!r}, {bounds})"
+
+    def _codegen(self, gen: _CodeGen) -> str:
+        bounds = self._codegen_bounds(gen)
+        error_integer = gen.error(
+            "not_integer", "object has to be an integer, but is ", ("obj", "r"), value="obj"
+        )
+        error_type = gen.error(
+            "invalid_type", "object has to be a number, but is ", ("obj", "r"), value="obj"
+        )
+
+        return gen.function(
+            "number",
+            [
+                # python handles bool as int, so we have to check for bool first
+                "if isinstance(obj, bool):",
+                "    pass",
+                "elif isinstance(obj, float):",
+                *(
+                    [f"    raise {error_integer}"]
+                    if self._f_integer else [*gen.indent(bounds), "    return float(obj)"]
+                ),
+                "elif isinstance(obj, int):",
+                *gen.indent(bounds),
+                "    return int(obj)",
+                f"raise {error_type}",
+            ],
+        )
+
+    def _codegen_find(self, gen: _CodeGen, key: Any) -> list[str]:
+        return emit_find(gen, self._codegen(gen), key, self._f_optional, self._f_nullable)
@@ -2,21 +2,26 @@
 from __future__ import annotations
 
 # -- STL Imports --
-import copy
+from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Any, TypeVar
-
-# -- Library Imports --
-from rusttypes.option import Nil, Option, Some
+from enum import Enum
+from typing import Any, Callable, Container, Iterator, TypeVar
 
 # -- Package Imports --
+from parasite._codegen import _CodeGen, emit_find
 from parasite.errors import ValidationError
-from parasite.type import ParasiteType, _NotFound
+from parasite.type import ParasiteType, _Collector, _Failure, _Invalid, _NotFound, _schemas
 from parasite.variant import Variant
 
 K = TypeVar("K")
 """Template type for the key in a dictionary."""
 
+MSG_TYPE = "object has to be a dictionary, but is {!r}"
+"""Message for values, that are not a dictionary."""
+
+MSG_UNKNOWN_KEY = "object has the key {!r}, but is not allowed to"
+"""Message for keys of strict dictionaries, that are not part of the schema."""
+
 
 @dataclass
 class Object(ParasiteType[dict[Any, Any]]):
@@ -43,6 +48,20 @@ class Object(ParasiteType[dict[Any, Any]]):
             :parts: 1
     """
 
+    class _ParseMode(Enum):
+        """
+        Enum for the different modes of writing parsed values back into the dictionary. See
+        :func:`parse_mode`.
+
+        Inheritance:
+            .. inheritance-diagram:: parasite.object.Object._ParseMode
+                :parts: 1
+        """
+
+        IN_PLACE = "in_place"
+        COPY = "copy"
+        COPY_ON_WRITE = "copy_on_write"
+
     # The items of the dictionary schema.
     _m_items: dict[Any, ParasiteType] = field(default_factory=lambda: {})
 
@@ -53,6 +72,9 @@ class Object(ParasiteType[dict[Any, Any]]):
     # Whether the dictionary should be stripped of all keys that are not in the dictionary.
     _f_strip: bool = False
 
+    # How parsed values are written back into the dictionary.
+    _m_parse_mode: _ParseMode = _ParseMode.IN_PLACE
+
     def __init__(self, items: dict[Any, ParasiteType] | None = None) -> None:
         """
         Args:
@@ -292,6 +314,81 @@ class Object(ParasiteType[dict[Any, Any]]):
         self._f_strip = True
         return self
 
+    def parse_mode(self, mode: str) -> Object:
+        """
+        Sets how parsed values are written back into the dictionary. The mode is applied to this
+        schema and all objects nested inside of it (also inside of arrays and variants). Nested
+        schemas are copied first, so schemas shared with other parents and frozen schemas are not
+        modified. The following modes are available:
+
+        - ``"in_place"``: the parsed values are written into the passed dictionary, no copies are
+          made. Default.
+        - ``"copy"``: the passed dictionary is never modified, a new dictionary is returned on every
+          parse.
+        - ``"copy_on_write"``: the passed dictionary is only copied, if a parsed value differs from
+          the original value (e.g. because of :func:`parasite.string.String.trim`). If no value
+          changes, the passed dictionary itself is returned.
+
+        Note:
+            With :func:`strip`, a new dictionary is always returned, regardless of the mode.
+
+        Throws:
+            ValueError: if the mode is unknown
+
+        Args:
+            mode (str): one of ``"in_place"``, ``"copy"`` or ``"copy_on_write"``
+
+        Returns:
+            Object: The updated instance of the class.
+
+        Example usage:
+            Lets assume we have the following schema::
+
+                from parasite import p
+
+                schema = p.obj({ "name": p.string().trim() }).parse_mode("copy_on_write")
+
+                data = { "name": "John" }
+                data2 = { "name": " John " }
+
+            The resulting schema will parse the following objects::
+
+                >>> schema.parse(data) is data
+                True
+
+                >>> schema.parse(data2) is data2
+                False
+                >>> data2
+                { "name": " John " }
+        """
+        try:
+            parse_mode = Object._ParseMode(mode)
+
+        except ValueError as exc:
+            modes = [mode.value for mode in Object._ParseMode]
+            raise ValueError(f"unknown parse mode {mode!r}, has to be one of {modes!r}") from exc
+
+        self._assert_mutable()
+
+        # nested objects may be shared with other schemas or frozen, so they are never modified,
+        # the mode is applied to copies of them instead
+        for name in self._fields():
+            value = getattr(self, name)
+            if not any(isinstance(schema, Object) for schema in _schemas(value)):
+                continue
+
+            value = deepcopy(value)
+            for schema in _schemas(value):
+                if isinstance(schema, Object):
+                    object.__setattr__(schema, "_m_parse_mode", parse_mode)
+
+                schema._c_hash = schema._c_fingerprint = schema._c_compiled = None
+
+            setattr(self, name, value)
+
+        self._m_parse_mode = parse_mode
+        return self
+
     def extend(self, other: Object) -> Object:
         """
         Extend the dictionary with another dictionary. This will overwrite all values of the current
@@ -330,8 +427,10 @@ class Object(ParasiteType[dict[Any, Any]]):
                 ValidationError: key "age" has to be an integer, but is 20
         """
         if not isinstance(other, Object):
-            raise ValidationError(f"object has to be a dictionary, but is '{other!r}'")
+            msg = "object has to be a dictionary, but is '{!r}'"
+            raise ValidationError(msg, other, code="invalid_type", value=other)
 
+        self._assert_mutable()
         self._m_items.update(other._m_items)
         return self
 
@@ -381,6 +480,8 @@ class Object(ParasiteType[dict[Any, Any]]):
                 >>> schema.parse({ "name": "John", "age": "20" })
                 { "name": "John", "age": "20" }
         """
+        self._assert_mutable()
+
         for key, value in other._m_items.items():
             # If the key is in the dictionary, merge the values.
             if key in self._m_items:
@@ -451,9 +552,7 @@ class Object(ParasiteType[dict[Any, Any]]):
                 >>> schema.parse({ "name": "John", "age": 20, "city": "New York" })
                 ValidationError: object has the key "city", but is not allowed to
         """
-        new_obj = copy.deepcopy(self)
-        new_obj._m_items = {key: self._m_items[key] for key in keys}
-        return new_obj
+        return self._replace(_m_items={key: self._m_items[key] for key in keys})
 
     def pick_safe(self, keys: list) -> Object:
         """
@@ -495,9 +594,9 @@ class Object(ParasiteType[dict[Any, Any]]):
                 >>> schema.parse({ "name": "John", "age": 20, "city": "New York" })
                 { "name": "John", "age": 20 }
         """
-        new_obj = copy.deepcopy(self)
-        new_obj._m_items = {key: self._m_items[key] for key in keys if key in self._m_items}
-        return new_obj
+        return self._replace(
+            _m_items={key: self._m_items[key] for key in keys if key in self._m_items}
+        )
 
     def omit(self, keys: list) -> Object:
         """
@@ -537,9 +636,9 @@ class Object(ParasiteType[dict[Any, Any]]):
                 >>> schema.parse({ "city": "New York" })
                 { "city": "New York" }
         """
-        new_obj = copy.deepcopy(self)
-        new_obj._m_items = {key: value for key, value in self._m_items.items() if key not in keys}
-        return new_obj
+        return self._replace(
+            _m_items={key: value for key, value in self._m_items.items() if key not in keys}
+        )
 
     def add_item(self, key: Any, item: ParasiteType) -> Object:
         """
@@ -580,44 +679,346 @@ class Object(ParasiteType[dict[Any, Any]]):
                 >>> schema.parse({ "name": "John", "age": 20 })
                 ValidationError: key "city" not found, but is required
         """
+        self._assert_mutable()
         self._m_items[key] = item
         return self
 
-    def parse(self, obj: Any) -> dict[Any, Any]:
+    def _modes(self) -> tuple[bool, bool]:
+        """
+        Returns:
+            tuple[bool, bool]: whether parsed dictionaries are copied before parsing, and whether
+            they are copied on the first changed value (``strip`` always creates a new dictionary)
+        """
+        copy = not self._f_strip and self._m_parse_mode is Object._ParseMode.COPY
+        copy_on_write = not self._f_strip and self._m_parse_mode is Object._ParseMode.COPY_ON_WRITE
+        return copy, copy_on_write
+
+    @staticmethod
+    def _unknown_keys(obj: dict[Any, Any], keys: Container[Any]) -> Iterator[Any]:
+        """
+        Args:
+            obj (dict[Any, Any]): dictionary to check
+            keys (Container[Any]): keys of the schema
+
+        Returns:
+            Iterator[Any]: keys of the dictionary, that are not part of the schema
+        """
+        return (key for key in obj if key not in keys)
+
+    @staticmethod
+    def _prepare(
+        obj: dict[Any, Any], keys: Container[Any], strip: bool, copy: bool
+    ) -> dict[Any, Any]:
+        """
+        Prepares a dictionary for parsing, by stripping or copying it.
+
+        Args:
+            obj (dict[Any, Any]): dictionary to parse
+            keys (Container[Any]): keys of the schema
+            strip (bool): whether keys, that are not part of the schema, are removed
+            copy (bool): whether the dictionary is copied
+
+        Returns:
+            dict[Any, Any]: the dictionary, that the parsed values are written to
+        """
+        if strip:
+            return {key: value for key, value in obj.items() if key in keys}
+
+        return dict(obj) if copy else obj
+
+    def parse(
+        self,
+        obj: Any,
+        collect_errors: bool = False,
+        max_errors: int | None = None,
+    ) -> dict[Any, Any]:
+        if collect_errors:
+            return self._parse_collect(obj, max_errors)
+
+        return self._unwrap(Object._check(self, obj))
+
+    def _check(self, obj: Any) -> Any:
         if not isinstance(obj, dict):
-            raise ValidationError(f"object has to be a dictionary, but is {obj!r}")
+            return _Failure(ValidationError(MSG_TYPE, obj, code="invalid_type", value=obj))
 
         # If the dictionary should be strict, check if all keys are allowed.
         if self._f_strict:
-            for key in obj:
-                if key not in self._m_items:
-                    raise ValidationError(f"object has the key {key!r}, but is not allowed to")
-
-        # If the dictionary should be stripped, strip it.
-        if self._f_strip:
-            obj = {key: value for key, value in obj.items() if key in self._m_items}
+            for key in self._unknown_keys(obj, self._m_items):
+                msg = MSG_UNKNOWN_KEY
+                return _Failure(
+                    ValidationError(msg, key, code="unknown_key", value=obj[key], path=(key,))
+                )
+
+        # Strip or copy the dictionary, and on copy-on-write keep the original dictionary to check
+        # if it was copied already.
+        copy, copy_on_write = self._modes()
+        obj = self._prepare(obj, self._m_items, self._f_strip, copy)
+        src = obj if copy_on_write else None
 
         # Parse the dictionary.
         for key, item in self._m_items.items():
-            item._find_and_parse(obj, key).map(lambda x, k=key: obj.update({k: x}))
+            # Prepend the key to the path of the failing value.
+            if type(value := item._check_find(obj, key)) is _Failure:
+                value.error.path = (key, *value.error.path)
+                return value
+
+            if value is not _NotFound:
+                if obj is src:
+                    if value is obj[key]:
+                        continue
+
+                    obj = dict(obj)
+
+                obj[key] = value
 
         return obj
 
-    def _find_and_parse(self, parent: dict[K, Any], key: K) -> Option[dict[K, Any] | None]:
+    def _accepts(self, cls: type) -> bool:
+        return issubclass(cls, dict)
+
+    def _find_and_parse_raw(self, parent: dict[K, Any], key: K) -> Any:
+        return self._unwrap(Object._check_find(self, parent, key))
+
+    def _check_find(self, parent: dict[K, Any], key: K) -> Any:
         if (value := parent.get(key, _NotFound)) is not _NotFound:
-            # If key is found, just package ``parse(..)`` it into a Some.
+            # If key is found, just ``_check(..)`` it.
             if value is not None:
-                return Some(self.parse(value))
+                return self._check(value)
 
             # If value is None, check if the value is nullable.
             if self._f_nullable:
-                return Some(None)
+                return None
 
-            raise ValidationError(f"key {key!r} is not nullable, but is None")
+            msg = "key {!r} is not nullable, but is None"
+            return _Failure(ValidationError(msg, key, code="not_nullable"))
 
-        # If the value is optional, return a Nil.
+        # If the value is optional, return _NotFound.
         if self._f_optional:
-            return Nil
+            return _NotFound
+
+        # If the value is required, fail.
+        msg = "key {!r} not found, but is required"
+        return _Failure(ValidationError(msg, key, code="missing_key"))
+
+    def _collect(self, obj: Any, path: tuple[Any, ...], collector: _Collector) -> Any:
+        if not isinstance(obj, dict):
+            collector.add(path, self, "invalid_type", obj, MSG_TYPE.format(obj))
+            return _Invalid
+
+        # If the dictionary should be strict, report every key, that is not allowed.
+        if self._f_strict:
+            for key in self._unknown_keys(obj, self._m_items):
+                msg = MSG_UNKNOWN_KEY.format(key)
+                collector.add((*path, key), self, "unknown_key", obj[key], msg)
+
+        # Strip or copy the dictionary, and on copy-on-write keep the original dictionary to check
+        # if it was copied already.
+        copy, copy_on_write = self._modes()
+        obj = self._prepare(obj, self._m_items, self._f_strip, copy)
+        src = obj if copy_on_write else None
+
+        # Parse the dictionary, and keep going after invalid keys.
+        for key, item in self._m_items.items():
+            value = item._collect_find(obj, key, path, collector)
+
+            if value is _NotFound or value is _Invalid:
+                continue
+
+            if obj is src:
+                if value is obj[key]:
+                    continue
+
+                obj = dict(obj)
+
+            obj[key] = value
+
+        return obj
+
+    def _collect_find(
+        self,
+        parent: dict[Any, Any],
+        key: Any,
+        path: tuple[Any, ...],
+        collector: _Collector,
+    ) -> Any:
+        # If key is found, collect the errors of the nested dictionary.
+        if (value := parent.get(key, _NotFound)) is not _NotFound and value is not None:
+            return self._collect(value, (*path, key), collector)
+
+        return super()._collect_find(parent, key, path, collector)
+
+    def _parse_columns(self, rows: list[Any], parsed: list[dict[Any, Any]]) -> None:
+        """
+        Parses a table of rows column by column (see :func:`parasite.array.Array.parse_columnar`).
+        Every column is validated at once by the schema of its key (see
+        :func:`parasite.type.ParasiteType._parse_column`). Behaves like calling :func:`parse` for
+        every row, and appends the parsed rows to ``parsed``. If multiple rows are invalid, the
+        error of the first invalid row is raised.
+
+        Throws:
+            ValidationError: if a row could not be parsed or was invalid. ``parsed`` then holds the
+                results of all rows before the failing row, so that ``len(parsed)`` is the index of
+                the failing row.
+
+        Args:
+            rows (list[Any]): rows to parse
+            parsed (list[dict[Any, Any]]): list to append the parsed rows to
+        """
+        records: list[dict[Any, Any]] = []
+        error: ValidationError | None = None
+        copy, copy_on_write = self._modes()
+
+        # check the row-wise constraints first, the table ends at the first invalid row
+        for row in rows:
+            if not isinstance(row, dict):
+                error = ValidationError(MSG_TYPE, row, code="invalid_type", value=row)
+                break
+
+            unknown = self._unknown_keys(row, self._m_items) if self._f_strict else iter(())
+            if (key := next(unknown, _NotFound)) is not _NotFound:
+                error = ValidationError(
+                    MSG_UNKNOWN_KEY, key, code="unknown_key", value=row[key], path=(key,)
+                )
+                break
+
+            records.append(self._prepare(row, self._m_items, self._f_strip, copy))
+
+        # validate the columns, every invalid column shortens the table to its first invalid row,
+        # so that errors in earlier rows (and earlier keys in the same row) take precedence
+        limit = len(records)
+        columns: list[list[Any]] = []
+
+        for key, item in self._m_items.items():
+            values: list[Any] = []
+            table = records if limit == len(records) else records[:limit]
+
+            try:
+                item._parse_column(table, key, values)
+
+            except ValidationError as exc:
+                exc.path = (key, *exc.path)
+                limit, error = len(values), exc
 
-        # If the value is required, raise an error.
-        raise ValidationError(f"object has to be a dictionary, but is '{value!r}'")
+            columns.append(values)
+
+        # write the parsed values back into the valid rows
+        for i in range(limit):
+            obj = records[i]
+            src = obj if copy_on_write else None
+
+            for key, values in zip(self._m_items, columns, strict=True):
+                if (value := values[i]) is not _NotFound:
+                    if obj is src:
+                        if value is obj[key]:
+                            continue
+
+                        obj = dict(obj)
+
+                    obj[key] = value
+
+            parsed.append(obj)
+
+        if error is not None:
+            raise error
+
+    def _compile(self) -> Callable[[Any], dict[Any, Any]]:
+        keys = frozenset(self._m_items)
+        finders = tuple((key, item._compile_find()) for key, item in self._m_items.items())
+        strict, strip = self._f_strict, self._f_strip
+        copy, copy_on_write = self._modes()
+        unknown_keys, prepare = self._unknown_keys, self._prepare
+
+        def parse(obj: Any) -> dict[Any, Any]:
+            if not isinstance(obj, dict):
+                raise ValidationError(MSG_TYPE, obj, code="invalid_type", value=obj)
+
+            # If the dictionary should be strict, check if all keys are allowed.
+            if strict:
+                for key in unknown_keys(obj, keys):
+                    raise ValidationError(
+                        MSG_UNKNOWN_KEY, key, code="unknown_key", value=obj[key], path=(key,)
+                    )
+
+            # Strip or copy the dictionary, and on copy-on-write keep the original dictionary to
+            # check if it was copied already.
+            obj = prepare(obj, keys, strip, copy)
+            src = obj if copy_on_write else None
+
+            # Parse the dictionary.
+            for key, find in finders:
+                try:
+                    value = find(obj, key)
+
+                # Prepend the key to the path of the failing value.
+                except ValidationError as exc:
+                    exc.path = (key, *exc.path)
+                    raise
+
+                if value is not _NotFound:
+                    if obj is src:
+                        if value is obj[key]:
+                            continue
+
+                        obj = dict(obj)
+
+                    obj[key] = value
+
+            return obj
+
+        return parse
+
+    def _compile_find(self) -> Callable[[dict[Any, Any], Any], Any]:
+        return self._make_find(self._compile(), self._f_optional, self._f_nullable)
+
+    def _codegen(self, gen: _CodeGen) -> str:
+        copy, copy_on_write = self._modes()
+        error_type = gen.error(
+            "invalid_type", "object has to be a dictionary, but is ", ("obj", "r"), value="obj"
+        )
+        lines = ["if not isinstance(obj, dict):", f"    raise {error_type}"]
+
+        if self._f_strict or self._f_strip:
+            keys = gen.const(
+                "frozenset((" + "".join(f"{gen.literal(key)}, " for key in self._m_items) + "))"
+            )
+
+        # If the dictionary should be strict, check if all keys are allowed.
+        if self._f_strict:
+            lines += [
+                "for key, value in obj.items():",
+                f"    if key not in {keys}:",
+                f"        raise ValidationError({MSG_UNKNOWN_KEY!r}, key, code='unknown_key',"
+                " value=value, path=(key,))",
+            ]
+
+        # If the dictionary should be stripped, strip it.
+        if self._f_strip:
+            lines.append(f"obj = {{key: value for key, value in obj.items() if key in {keys}}}")
+
+        # Else copy the dictionary, if it should not be modified.
+        elif copy:
+            lines.append("obj = dict(obj)")
+
+        # On copy-on-write, keep the original dictionary to check if it was copied already.
+        elif copy_on_write:
+            lines.append("src = obj")
+
+        # Parse the dictionary, by looking up every key by its constant.
+        previous, gen.copy_on_write = gen.copy_on_write, copy_on_write
+
+        # Prepend the key to the path of the failing value. Keys, that cannot fail, emit no source.
+        for key, item in self._m_items.items():
+            if find := item._codegen_find(gen, key):
+                lines += [
+                    "try:",
+                    *gen.indent(find),
+                    "except ValidationError as exc:",
+                    f"    exc.path = ({gen.literal(key)}, *exc.path)",
+                    "    raise",
+                ]
+
+        gen.copy_on_write = previous
+        return gen.function("object", [*lines, "return obj"])
+
+    def _codegen_find(self, gen: _CodeGen, key: Any) -> list[str]:
+        return emit_find(gen, self._codegen(gen), key, self._f_optional, self._f_nullable)
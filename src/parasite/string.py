@@ -2,24 +2,56 @@
 from __future__ import annotations
 
 # -- STL Imports --
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from re import Pattern
 import re
-from typing import Any, TypeVar
+from typing import Any, Callable, ClassVar, TypeVar
 from enum import Enum, auto
+from itertools import repeat
 
 # -- Library Imports --
-from rusttypes.option import Nil, Option, Some
 import tracing
 
 # -- Package Imports --
-from parasite import _const
+from parasite import _const, _formats
+from parasite._codegen import _CodeGen, emit_find
 from parasite.errors import ValidationError
-from parasite.type import ParasiteType, _NotFound
+from parasite.type import ParasiteType, _Failure, _NotFound
 
 K = TypeVar("K")
 """Template type for the key in a dictionary."""
 
+MSG_TOO_SHORT = "length of value '{}' is less than {}"
+"""Message template for values, that are shorter than the lower limit."""
+
+MSG_TOO_LONG = "length of value '{}' is greater than {}"
+"""Message template for values, that are longer than the upper limit."""
+
+MSG_STARTS = "value '{}' does not start with '{}'"
+"""Message template for values, that do not start with the prefix."""
+
+MSG_ENDS = "value '{}' does not end with '{}'"
+"""Message template for values, that do not end with the suffix."""
+
+MSG_CONTAINS = "value '{}' does not contain '{}'"
+"""Message template for values, that do not contain the substring."""
+
+MSG_LITERAL = "value '{}' does not equal '{}'"
+"""Message template for values, that do not equal the literal."""
+
+MSG_FORMAT = "value '{}' is not a valid {}"
+"""Message template for values, that do not match a format (e.g. email)."""
+
+MSG_REGEX = "value '{}' does not match the regex pattern"
+"""Message template for values, that do not match the custom regex."""
+
+MSG_TYPE = "expected a string, but got {!r}"
+"""Message template for values, that are not a string."""
+
+CACHE_SIZE = 4096
+"""Default number of cached format validation results (see :func:`String.cached`)."""
+
 
 @dataclass
 class String(ParasiteType[str]):
@@ -51,6 +83,19 @@ class String(ParasiteType[str]):
         IPV4 = auto()
         IPV6 = auto()
         REGEX = auto()
+        ONE_OF = auto()
+
+    # Validator, its source in generated code, and display name of every format.
+    _FORMATS: ClassVar[dict[_RegexType, tuple[Callable[[str], Any], str, str]]] = {
+        _RegexType.EMAIL: (_formats.email, "_formats.email", "email"),
+        _RegexType.URL: (_const.RE_URL.match, "_const.RE_URL.match", "URL"),
+        _RegexType.UUID: (_const.RE_UUID.match, "_const.RE_UUID.match", "UUID"),
+        _RegexType.CUID: (_const.RE_CUID.match, "_const.RE_CUID.match", "CUID"),
+        _RegexType.CUID2: (_const.RE_CUID2.match, "_const.RE_CUID2.match", "CUID2"),
+        _RegexType.ULID: (_const.RE_ULID.match, "_const.RE_ULID.match", "ULID"),
+        _RegexType.IPV4: (_formats.ipv4, "_formats.ipv4", "IPv4"),
+        _RegexType.IPV6: (_const.RE_IPV6.match, "_const.RE_IPV6.match", "IPv6"),
+    }
 
     # flags
     _f_optional: bool = False  # Whether the value is optional
@@ -69,7 +114,19 @@ class String(ParasiteType[str]):
     _m_starts: str | None = None  # String that the value must start with
     _m_ends: str | None = None  # String that the value must end with
     _m_contains: str | None = None  # String that the value must contain
+    _m_literal: str | None = None  # String that the value must equal
     _m_regex: Pattern | None = None  # Compiled regex pattern to use for validation
+    _m_formats: tuple[str, ...] | None = None  # Names of the formats, that the value may match
+    _m_format_limit: int | None = None  # Maximum length of values of unbounded formats
+    _m_cache: int | None = None  # Maximum number of cached format validation results
+
+    # Pipeline of the active checks and transformations, rebuilt whenever a field changes.
+    _c_pipeline: Callable[[str], Any] | None = field(default=None, compare=False, repr=False)
+
+    # Cache of the memoized format validator, and the format, regex and size it was built for.
+    _c_memo: tuple[tuple[Any, ...], Callable[[str], bool]] | None = field(
+        default=None, compare=False, repr=False
+    )
 
     def __init__(self) -> None:
         pass
@@ -346,10 +403,27 @@ class String(ParasiteType[str]):
         self._m_contains = value
         return self
 
+    def literal(self, value: str) -> String:
+        """
+        Sets the value that the string must equal.
+
+        Args:
+            value (str): string that the value must equal
+
+        Returns:
+            String: modified instance
+        """
+        self._m_literal = value
+        return self
+
     def email(self) -> String:
         """
         Sets the regex type to email.
 
+        Note:
+            Besides the regex, the length limits of RFC 5321 apply (at most 254 characters, and at
+            most 64 before the ``@``).
+
         Returns:
             String: modified instance
         """
@@ -436,8 +510,8 @@ class String(ParasiteType[str]):
         Returns:
             String: modified instance
         """
-        self._m_regex_t = self._RegexType.REGEX
         self._m_regex = value
+        self._m_regex_t = self._RegexType.REGEX
         return self
 
     def match(self, value: str) -> String:
@@ -452,166 +526,737 @@ class String(ParasiteType[str]):
         """
         return self.regex(re.compile(value))
 
-    def _apply_transformations(self, value: str) -> str:
+    def one_of_formats(self, formats: list[str]) -> String:
         """
-        Applies the transformations on the value.
+        Sets the formats, of which the value has to match at least one. The regexes of all formats
+        are merged into one, so that the value is matched only once, which is a lot cheaper than a
+        :class:`parasite.variant.Variant` of one string per format. Use :func:`classify` to find
+        out which format a value matches.
 
         Args:
-            value (str): value to transform
+            formats (list[str]): names of the formats, one of ``"email"``, ``"url"``, ``"uuid"``,
+                ``"cuid"``, ``"cuid2"``, ``"ulid"``, ``"ipv4"`` and ``"ipv6"``. If a value matches
+                several formats, the first one is reported.
+
+        Raises:
+            ValueError: if no format, or an unknown format is passed
 
         Returns:
-            str: transformed value
-        """
-        if self._f_trim:
-            value = value.strip()
+            String: modified instance
 
-        if self._f_to_lower:
-            value = value.lower()
+        Example usage:
+            Lets assume we have the following schema::
 
-        if self._f_to_upper:
-            value = value.upper()
+                from parasite import p
+
+                schema = p.string().one_of_formats(["uuid", "ulid"])
 
-        return value
+            The resulting schema will parse the following values::
 
-    def _parse_bounds(self, value: str) -> str:
+                >>> schema.parse("01ARZ3NDEKTSV4RRFFQ69G5FAV")
+                "01ARZ3NDEKTSV4RRFFQ69G5FAV"
+                >>> schema.classify("01ARZ3NDEKTSV4RRFFQ69G5FAV")
+                "ulid"
+                >>> schema.parse("hello")
+                ValidationError: value 'hello' is not a valid UUID or ULID
         """
-        Parses the value with the length _constraints.
+        if not formats:
+            raise ValueError("at least one format has to be passed")
+
+        if unknown := [name for name in formats if name not in _formats.PATTERNS]:
+            names = list(_formats.PATTERNS)
+            raise ValueError(f"unknown formats {unknown!r}, have to be of {names!r}")
+
+        self._m_formats = tuple(formats)
+        self._m_regex_t = self._RegexType.ONE_OF
+        return self
+
+    def classify(self, value: str) -> str | None:
+        """
+        Finds the format, that a value matches. Other constraints of the schema are not checked.
 
         Args:
-            value (str): value to parse
+            value (str): value to classify
 
         Returns:
-            str: parsed value
+            str | None: name of the format (see :func:`one_of_formats`), or ``None`` if the value
+            matches no format, or no format is set
         """
-        if self._m_ll is not None and len(value) < self._m_ll:
-            raise ValidationError(f"length of value '{value}' is less than {self._m_ll}")
+        ll, ul = self._format_bounds()
+        if len(value) < ll or (ul is not None and len(value) > ul):
+            return None
+
+        if self._m_regex_t == self._RegexType.ONE_OF:
+            return _formats.classifier(self._m_formats)(value)
 
-        if self._m_ul is not None and len(value) > self._m_ul:
-            raise ValidationError(f"length of value '{value}' is greater than {self._m_ul}")
+        if self._m_regex_t in self._FORMATS and self._FORMATS[self._m_regex_t][0](value):
+            return self._m_regex_t.name.lower()
 
-        return value
+        return None
 
-    def _parse_basic(self, value: str) -> str:
+    def format_limit(self, value: int) -> String:
         """
-        Parses the value with the basic _constraints.
+        Sets the maximum length of values, that are matched against a format, which is unbounded by
+        its regex (email, URL, CUID, CUID2, custom regex). Longer values are rejected in constant
+        time, before the regex runs, which protects against very long inputs. Formats of bounded
+        length (e.g. UUID) always reject values of impossible length this way.
+
+        Note:
+            The default is 254 for email (the limit of RFC 5321, which also applies, if a higher
+            limit is set) and 8192 for URL. Other formats are unlimited by default. For
+            :func:`one_of_formats`, the widest range of lengths of the formats applies.
 
         Args:
-            value (str): value to parse
+            value (int): maximum length of the value
 
         Returns:
-            str: parsed value
+            String: modified instance
         """
-        if self._m_starts is not None and not value.startswith(self._m_starts):
-            raise ValidationError(f"value '{value}' does not start with '{self._m_starts}'")
+        self._m_format_limit = value
+        return self
 
-        if self._m_ends is not None and not value.endswith(self._m_ends):
-            raise ValidationError(f"value '{value}' does not end with '{self._m_ends}'")
+    def cached(self, maxsize: int = CACHE_SIZE) -> String:
+        """
+        Caches the result of the format (or regex) validation for the last ``maxsize`` distinct
+        values, so that values, which repeat, are only matched once. The least recently used result
+        is evicted first. The cache is thread-safe; its statistics are available through
+        :func:`cache_info`.
 
-        if self._m_contains is not None and self._m_contains not in value:
-            raise ValidationError(f"value '{value}' does not contain '{self._m_contains}'")
+        Note:
+            Only whether the value matches is cached, all other constraints and transformations
+            apply as usual. Schemas compiled with the ``"codegen"`` backend share the cache with the
+            schema, and are therefore not written to a :class:`parasite.cache.SchemaCache`.
 
-        return value
+        Args:
+            maxsize (int): maximum number of cached results. Default: :data:`CACHE_SIZE`
 
-    def _parse_regex(self, value: str) -> str:
+        Raises:
+            ValueError: if ``maxsize`` is less than 1
+
+        Returns:
+            String: modified instance
         """
-        Parses the value with the regex _constraints.
+        if maxsize < 1:
+            raise ValueError(f"maxsize has to be at least 1, but is {maxsize!r}")
+
+        self._m_cache = maxsize
+        return self
+
+    def cache_info(self) -> tuple[int, int, int, int] | None:
+        """
+        Returns:
+            tuple[int, int, int, int] | None: the hits, misses, maximum and current size of the
+            cache of format validation results (see :func:`cached`), as named tuple of
+            :func:`functools.lru_cache`, or ``None`` if the format is not cached
+        """
+        if self._c_memo is None or self._c_memo[0] != self._memo_key():
+            return None
+
+        return self._c_memo[1].cache_info()  # type: ignore
+
+    def parse(self, obj: Any, collect_errors: bool = False, max_errors: int | None = None) -> str:
+        if collect_errors:
+            return self._parse_collect(obj, max_errors)
+
+        return self._unwrap(String._check(self, obj))
+
+    def _check(self, obj: Any) -> Any:
+        if not isinstance(obj, str):
+            return _Failure(ValidationError(MSG_TYPE, obj, code="invalid_type", value=obj))
+
+        # only the active checks and transformations run, none for an unconstrained string
+        if (run := self._c_pipeline) is None:
+            return obj
+
+        return run(obj)
+
+    def _accepts(self, cls: type) -> bool:
+        return issubclass(cls, str)
+
+    def _tag(self) -> Any:
+        # transformations before parsing may turn other values into the literal
+        if self._m_literal is None or (
+            self._f_transform_before_parse
+            and (self._f_trim or self._f_to_lower or self._f_to_upper)
+        ):
+            return _NotFound
+
+        return self._m_literal
+
+    def _find_and_parse_raw(self, parent: dict[K, Any], key: K) -> Any:
+        return self._unwrap(String._check_find(self, parent, key))
+
+    def _check_find(self, parent: dict[K, Any], key: K) -> Any:
+        if (value := parent.get(key, _NotFound)) is not _NotFound:
+            if value is not None:
+                # if key is found, just ``_check(..)`` it
+                return self._check(value)
+
+            # if value is None, check if the value is nullable
+            if self._f_nullable:
+                return None
+
+            msg = "key {!r} is not nullable, but is None"
+            return _Failure(ValidationError(msg, key, code="not_nullable"))
+
+        # if key is not found, return _NotFound if optional, else fail
+        if self._f_optional:
+            return _NotFound
+
+        msg = "key {!r} not found, but is required"
+        return _Failure(ValidationError(msg, key, code="missing_key"))
+
+    def _parse_column(self, rows: list[dict[Any, Any]], key: Any, values: list[Any]) -> None:
+        column = [row.get(key, _NotFound) for row in rows]
+
+        # fast path: if every value is a plain string and stays unchanged, each constraint can be
+        # checked for the whole column at once
+        if column and self._valid_column(column):
+            values.extend(column)
+            return
+
+        # else find the failing row (or parse mixed columns) value by value
+        super()._parse_column(rows, key, values)
+
+    def _valid_column(self, column: list[Any]) -> bool:
+        """
+        Checks if a column of values is valid as a whole. Only columns of plain ``str`` values are
+        supported, and only if no transformation or regex is set.
 
         Args:
-            value (str): value to parse
+            column (list[Any]): values of the column
 
         Returns:
-            str: parsed value
+            bool: ``True`` if every value is valid, ``False`` if the column is invalid or has to be
+            checked value by value
         """
-        match self._m_regex_t:
-            case self._RegexType.NONE:
-                return value
+        if (
+            self._f_trim
+            or self._f_to_lower
+            or self._f_to_upper
+            or self._m_regex_t != self._RegexType.NONE
+        ):
+            return False
 
-            case self._RegexType.EMAIL:
-                r = re.match(_const.RE_EMAIL, value)
-                print(f"r: {r!r}, regex = {_const.RE_EMAIL!r}")
+        if set(map(type, column)) != {str}:
+            return False
 
-                if not _const.RE_EMAIL.match(value):
-                    raise ValidationError(f"value '{value}' is not a valid email")
-                return value
+        if self._m_ll is not None or self._m_ul is not None:
+            lengths = list(map(len, column))
+
+            if self._m_ll is not None and min(lengths) < self._m_ll:
+                return False
+
+            if self._m_ul is not None and max(lengths) > self._m_ul:
+                return False
+
+        if self._m_literal is not None and any(value != self._m_literal for value in column):
+            return False
+
+        if self._m_starts is not None and not all(
+            map(str.startswith, column, repeat(self._m_starts))
+        ):
+            return False
+
+        if self._m_ends is not None and not all(map(str.endswith, column, repeat(self._m_ends))):
+            return False
+
+        return self._m_contains is None or all(
+            map(str.__contains__, column, repeat(self._m_contains))
+        )
+
+    def _refresh(self) -> None:
+        # only the active checks and transformations run, so the pipeline is built once per change
+        self._c_pipeline = self._compile_pipeline()
+
+    def _compile_pipeline(self) -> Callable[[str], Any] | None:
+        """
+        Compiles the active transformations and checks into a single function, that is applied to
+        values, which are already known to be strings.
+
+        Returns:
+            Callable[[str], Any] | None: function, that returns the (transformed) value, or
+            ``_Failure`` if the value is invalid, or ``None`` if nothing is active
+        """
+        transform = self._compile_transformations()
+        checks = tuple(self._compile_checks())
+
+        # transformations never fail, so they are the whole pipeline, if nothing is checked
+        if not checks:
+            return transform
+
+        if transform is None and len(checks) == 1:
+            return checks[0]
+
+        before = transform if self._f_transform_before_parse else None
+        after = transform if not self._f_transform_before_parse else None
+
+        def run(value: str) -> Any:
+            if before is not None:
+                value = before(value)
+
+            # every check returns the value itself, or a _Failure
+            for check in checks:
+                if type(value := check(value)) is _Failure:
+                    return value
+
+            if after is not None:
+                value = after(value)
+
+            return value
+
+        return run
+
+    def _compile_transformations(self) -> Callable[[str], str] | None:
+        """
+        Compiles the active transformations into a single function.
+
+        Returns:
+            Callable[[str], str] | None: transformation function, or ``None`` if no transformation
+                is active
+        """
+        steps = []
+
+        if self._f_trim:
+            steps.append(str.strip)
+
+        if self._f_to_lower:
+            steps.append(str.lower)
+
+        if self._f_to_upper:
+            steps.append(str.upper)
+
+        if not steps:
+            return None
+
+        if len(steps) == 1:
+            return steps[0]
+
+        def transform(value: str) -> str:
+            for step in steps:
+                value = step(value)
+            return value
+
+        return transform
 
-            case self._RegexType.URL:
-                if not _const.RE_URL.match(value):
-                    raise ValidationError(f"value '{value}' is not a valid URL")
+    def _compile_checks(self) -> list[Callable[[str], Any]]:
+        """
+        Compiles the active length, basic and format constraints into a list of checking functions.
+
+        Returns:
+            list[Callable[[str], Any]]: checking functions in the order they have to be applied,
+            that return the value, or ``_Failure`` if the value is invalid
+        """
+        checks: list[Callable[[str], Any]] = []
+
+        if (ll := self._m_ll) is not None:
+
+            def check_ll(value: str) -> Any:
+                if len(value) < ll:
+                    error = ValidationError(MSG_TOO_SHORT, value, ll, code="too_short", value=value)
+                    return _Failure(error)
                 return value
 
-            case self._RegexType.UUID:
-                if not _const.RE_UUID.match(value):
-                    raise ValidationError(f"value '{value}' is not a valid UUID")
+            checks.append(check_ll)
+
+        if (ul := self._m_ul) is not None:
+
+            def check_ul(value: str) -> Any:
+                if len(value) > ul:
+                    error = ValidationError(MSG_TOO_LONG, value, ul, code="too_long", value=value)
+                    return _Failure(error)
                 return value
 
-            case self._RegexType.CUID:
-                if not _const.RE_CUID.match(value):
-                    raise ValidationError(f"value '{value}' is not a valid CUID")
+            checks.append(check_ul)
+
+        if (literal := self._m_literal) is not None:
+
+            def check_literal(value: str) -> Any:
+                if value != literal:
+                    return _Failure(
+                        ValidationError(
+                            MSG_LITERAL, value, literal, code="invalid_literal", value=value
+                        )
+                    )
                 return value
 
-            case self._RegexType.CUID2:
-                if not _const.RE_CUID2.match(value):
-                    raise ValidationError(f"value '{value}' is not a valid CUID2")
+            checks.append(check_literal)
+
+        if (starts := self._m_starts) is not None:
+
+            def check_starts(value: str) -> Any:
+                if not value.startswith(starts):
+                    return _Failure(
+                        ValidationError(
+                            MSG_STARTS, value, starts, code="invalid_string", value=value
+                        )
+                    )
                 return value
 
-            case self._RegexType.ULID:
-                if not _const.RE_ULID.match(value):
-                    raise ValidationError(f"value '{value}' is not a valid ULID")
+            checks.append(check_starts)
+
+        if (ends := self._m_ends) is not None:
+
+            def check_ends(value: str) -> Any:
+                if not value.endswith(ends):
+                    return _Failure(
+                        ValidationError(MSG_ENDS, value, ends, code="invalid_string", value=value)
+                    )
                 return value
 
-            case self._RegexType.IPV4:
-                if not _const.RE_IPV4.match(value):
-                    raise ValidationError(f"value '{value}' is not a valid IPv4")
+            checks.append(check_ends)
+
+        if (contains := self._m_contains) is not None:
+
+            def check_contains(value: str) -> Any:
+                if contains not in value:
+                    return _Failure(
+                        ValidationError(
+                            MSG_CONTAINS, value, contains, code="invalid_string", value=value
+                        )
+                    )
                 return value
 
-            case self._RegexType.IPV6:
-                if not _const.RE_IPV6.match(value):
-                    raise ValidationError(f"value '{value}' is not a valid IPv6")
+            checks.append(check_contains)
+
+        if (check_format := self._compile_format()) is not None:
+            checks.append(check_format)
+
+        return checks
+
+    def _compile_format(self) -> Callable[[str], Any] | None:
+        """
+        Compiles the format (or custom regex) constraint into a checking function.
+
+        Returns:
+            Callable[[str], Any] | None: checking function, that returns the value, or
+            ``_Failure`` if the value is invalid, or ``None`` if no format is set
+        """
+        if self._m_regex_t == self._RegexType.NONE:
+            return None
+
+        ll, ul = self._format_bounds()
+        ul = sys.maxsize if ul is None else ul
+
+        # values of impossible length are rejected in constant time, and never reach the regex (or
+        # the cache of its results)
+        if self._m_regex_t in self._FORMATS or self._m_regex_t == self._RegexType.ONE_OF:
+            match, _, name = self._format()
+            match = self._memo(match)
+
+            def check_format(value: str) -> Any:
+                if not (ll <= len(value) <= ul and match(value)):
+                    return _Failure(
+                        ValidationError(MSG_FORMAT, value, name, code="invalid_string", value=value)
+                    )
                 return value
 
-            case self._RegexType.REGEX:
-                if not self._m_regex:
-                    raise ValidationError("no regex pattern provided")
-                if not self._m_regex.match(value):
-                    raise ValidationError(f"value '{value}' does not match the regex pattern")
+            return check_format
+
+        if self._m_regex_t == self._RegexType.REGEX:
+            if not (regex := self._m_regex):
+
+                def check_missing(value: str) -> Any:
+                    msg = "no regex pattern provided"
+                    return _Failure(ValidationError(msg, code="invalid_string", value=value))
+
+                return check_missing
+
+            match_regex = self._memo(regex.match)
+
+            def check_regex(value: str) -> Any:
+                if not (ll <= len(value) <= ul and match_regex(value)):
+                    return _Failure(
+                        ValidationError(MSG_REGEX, value, code="invalid_string", value=value)
+                    )
                 return value
 
-            case _:
-                pass
+            return check_regex
 
+        # warned once, when the pipeline is built, and not for every value
         tracing.warn(f"unsupported regex type {self._m_regex_t!r}")
-        return value
+        return None
 
-    def parse(self, obj: Any) -> str:
-        if not isinstance(obj, str):
-            raise ValidationError(f"expected a string, but got {obj!r}")
+    def _format(self) -> tuple[Callable[[str], Any], str, str]:
+        """
+        Returns:
+            tuple[Callable[[str], Any], str, str]: the validator, its source in generated code, and
+            the display name of the format (or formats, see :func:`one_of_formats`)
+        """
+        if self._m_regex_t != self._RegexType.ONE_OF:
+            return self._FORMATS[self._m_regex_t]
 
-        if self._f_transform_before_parse:
-            obj = self._apply_transformations(obj)
+        types = [self._RegexType[name.upper()] for name in self._m_formats]
+        return (
+            _formats.classifier(self._m_formats),
+            f"_formats.classifier({self._m_formats!r})",
+            " or ".join(self._FORMATS[regex_t][2] for regex_t in types),
+        )
 
-        obj = self._parse_bounds(obj)
-        obj = self._parse_basic(obj)
-        obj = self._parse_regex(obj)
+    def _format_bounds(self) -> tuple[int, int | None]:
+        """
+        Returns:
+            tuple[int, int | None]: the minimum and maximum length of values, that can match the
+            format (see :func:`format_limit`), ``None`` if unbounded
+        """
+        if self._m_regex_t == self._RegexType.ONE_OF:
+            return _formats.bounds(self._m_formats, self._m_format_limit)
 
-        if not self._f_transform_before_parse:
-            obj = self._apply_transformations(obj)
+        if self._m_regex_t in self._FORMATS:
+            return _formats.bounds((self._m_regex_t.name.lower(),), self._m_format_limit)
 
-        return obj
+        return _formats.bounds((), self._m_format_limit)
 
-    def _find_and_parse(self, parent: dict[K, Any], key: K) -> Option[str | None]:
-        if (value := parent.get(key, _NotFound)) is not _NotFound:
-            if value is not None:
-                # if key is found, just package ``parse(..)`` it into a Some
-                return Some(self.parse(value))
+    def _memo_key(self) -> tuple[Any, ...]:
+        """
+        Returns:
+            tuple[Any, ...]: the members, that the memoized format validator depends on
+        """
+        return (self._m_regex_t, self._m_regex, self._m_formats, self._m_cache)
 
-            # if value is None, check if the value is nullable
-            if self._f_nullable:
-                return Some(None)
+    def _memo(self, validator: Callable[[str], Any]) -> Callable[[str], Any]:
+        """
+        Memoizes the validator of the format (see :func:`cached`). The memoized validator is kept,
+        as long as the format, the regex and the size of the cache do not change, so that its
+        results survive rebuilding the pipeline.
 
-            raise ValidationError(f"key {key!r} is not nullable, but is None")
+        Args:
+            validator (Callable[[str], Any]): validator of the format
 
-        # if key is not found, return Nil if optional, else raise an error
-        if self._f_optional:
-            return Nil
+        Returns:
+            Callable[[str], Any]: the memoized validator, or ``validator`` if nothing is cached
+        """
+        if self._m_cache is None:
+            return validator
+
+        key = self._memo_key()
+        if (memo := self._c_memo) is None or memo[0] != key:
+            memo = self._c_memo = (key, _formats.memoize(validator, self._m_cache))
+
+        return memo[1]
+
+    def _compile(self) -> Callable[[Any], str]:
+        run = self._compile_pipeline()
+
+        if run is None:
+
+            def parse_any(obj: Any) -> str:
+                if not isinstance(obj, str):
+                    raise ValidationError(MSG_TYPE, obj, code="invalid_type", value=obj)
+
+                return obj
+
+            return parse_any
+
+        def parse(obj: Any) -> str:
+            if not isinstance(obj, str):
+                raise ValidationError(MSG_TYPE, obj, code="invalid_type", value=obj)
+
+            if type(obj := run(obj)) is _Failure:
+                raise obj.error
+
+            return obj
+
+        return parse
+
+    def _compile_find(self) -> Callable[[dict[Any, Any], Any], Any]:
+        return self._make_find(self._compile(), self._f_optional, self._f_nullable)
+
+    def _codegen_transformations(self) -> list[str]:
+        """
+        Generates the python source for the transformations. Equivalent to
+        :func:`_compile_transformations`.
+
+        Returns:
+            list[str]: lines of source
+        """
+        lines: list[str] = []
+
+        if self._f_trim:
+            lines.append("obj = obj.strip()")
+
+        if self._f_to_lower:
+            lines.append("obj = obj.lower()")
+
+        if self._f_to_upper:
+            lines.append("obj = obj.upper()")
+
+        return lines
+
+    def _codegen_bounds(self, gen: _CodeGen) -> list[str]:
+        """
+        Generates the python source for the length constraints. Equivalent to
+        :func:`_compile_checks`.
+
+        Args:
+            gen (_CodeGen): code generator
+
+        Returns:
+            list[str]: lines of source
+        """
+        lines: list[str] = []
+
+        if self._m_ll is not None:
+            error = gen.error(
+                "too_short",
+                "length of value '",
+                ("obj", "s"),
+                f"' is less than {self._m_ll}",
+                value="obj",
+            )
+            lines += [f"if len(obj) < {self._m_ll!r}:", f"    raise {error}"]
+
+        if self._m_ul is not None:
+            error = gen.error(
+                "too_long",
+                "length of value '",
+                ("obj", "s"),
+                f"' is greater than {self._m_ul}",
+                value="obj",
+            )
+            lines += [f"if len(obj) > {self._m_ul!r}:", f"    raise {error}"]
+
+        return lines
+
+    def _codegen_basic(self, gen: _CodeGen) -> list[str]:
+        """
+        Generates the python source for the basic constraints. Equivalent to
+        :func:`_compile_checks`.
+
+        Args:
+            gen (_CodeGen): code generator
+
+        Returns:
+            list[str]: lines of source
+        """
+        lines: list[str] = []
+
+        if self._m_literal is not None:
+            error = gen.error(
+                "invalid_literal",
+                "value '",
+                ("obj", "s"),
+                f"' does not equal '{self._m_literal}'",
+                value="obj",
+            )
+            lines += [
+                f"if obj != {gen.literal(self._m_literal)}:",
+                f"    raise {error}",
+            ]
+
+        if self._m_starts is not None:
+            error = gen.error(
+                "invalid_string",
+                "value '",
+                ("obj", "s"),
+                f"' does not start with '{self._m_starts}'",
+                value="obj",
+            )
+            lines += [
+                f"if not obj.startswith({gen.literal(self._m_starts)}):",
+                f"    raise {error}",
+            ]
+
+        if self._m_ends is not None:
+            error = gen.error(
+                "invalid_string",
+                "value '",
+                ("obj", "s"),
+                f"' does not end with '{self._m_ends}'",
+                value="obj",
+            )
+            lines += [
+                f"if not obj.endswith({gen.literal(self._m_ends)}):",
+                f"    raise {error}",
+            ]
+
+        if self._m_contains is not None:
+            error = gen.error(
+                "invalid_string",
+                "value '",
+                ("obj", "s"),
+                f"' does not contain '{self._m_contains}'",
+                value="obj",
+            )
+            lines += [
+                f"if {gen.literal(self._m_contains)} not in obj:",
+                f"    raise {error}",
+            ]
+
+        return lines
+
+    def _codegen_regex(self, gen: _CodeGen) -> list[str]:
+        """
+        Generates the python source for the regex constraints. Equivalent to
+        :func:`_compile_format`.
 
-        raise ValidationError(f"key {key!r} not found, but is required")
+        Args:
+            gen (_CodeGen): code generator
+
+        Returns:
+            list[str]: lines of source
+        """
+        if self._m_regex_t == self._RegexType.NONE:
+            return []
+
+        # values of impossible length are rejected, before the regex runs
+        ll, ul = self._format_bounds()
+        length = f"{ll!r} <= len(obj) <= {ul!r} and " if ul is not None else ""
+        length = f"len(obj) >= {ll!r} and " if ul is None and ll > 0 else length
+
+        if self._m_regex_t in self._FORMATS or self._m_regex_t == self._RegexType.ONE_OF:
+            validator, match, name = self._format()
+            if self._m_regex_t == self._RegexType.ONE_OF:
+                match = gen.const(match)
+
+            if self._m_cache is not None:
+                match = gen.object(self._memo(validator))
+
+            error = gen.error(
+                "invalid_string", "value '", ("obj", "s"), f"' is not a valid {name}", value="obj"
+            )
+            return [f"if not ({length}{match}(obj)):", f"    raise {error}"]
+
+        if self._m_regex_t == self._RegexType.REGEX:
+            if not self._m_regex:
+                error = gen.error("invalid_string", "no regex pattern provided", value="obj")
+                return [f"raise {error}"]
+
+            match = f"{gen.pattern(self._m_regex)}.match"
+            if self._m_cache is not None:
+                match = gen.object(self._memo(self._m_regex.match))
+
+            error = gen.error(
+                "invalid_string",
+                "value '",
+                ("obj", "s"),
+                "' does not match the regex pattern",
+                value="obj",
+            )
+            return [f"if not ({length}{match}(obj)):", f"    raise {error}"]
+
+        tracing.warn(f"unsupported regex type {self._m_regex_t!r}")
+        return []
+
+    def _codegen(self, gen: _CodeGen) -> str:
+        transformations = self._codegen_transformations()
+        error_type = gen.error(
+            "invalid_type", "expected a string, but got ", ("obj", "r"), value="obj"
+        )
+
+        return gen.function(
+            "string",
+            [
+                "if not isinstance(obj, str):",
+                f"    raise {error_type}",
+                *(transformations if self._f_transform_before_parse else []),
+                *self._codegen_bounds(gen),
+                *self._codegen_basic(gen),
+                *self._codegen_regex(gen),
+                *(transformations if not self._f_transform_before_parse else []),
+                "return obj",
+            ],
+        )
+
+    def _codegen_find(self, gen: _CodeGen, key: Any) -> list[str]:
+        return emit_find(gen, self._codegen(gen), key, self._f_optional, self._f_nullable)
@@ -2,16 +2,29 @@
 from __future__ import annotations
 
 # -- STL Imports --
+import contextlib
+import copy
+import dataclasses
+import enum
+import hashlib
+import itertools
+import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Generic, TypeVar
+from dataclasses import FrozenInstanceError, dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Generic, Iterable, Iterator, TypeVar
 
 # -- Library Imports --
-from rusttypes.option import Option
+from rusttypes.option import Nil, Option, Some
 from rusttypes.result import Err, Ok, Result
 
 # -- Package Imports --
-from parasite.errors import ValidationError
+from parasite import _codegen
+from parasite.compiler import CompiledSchema
+from parasite.errors import ErrorDetail, ValidationError
+
+if TYPE_CHECKING:
+    from parasite._codegen import _CodeGen
+    from parasite.cache import SchemaCache
 
 T = TypeVar("T")
 """Template type for the destination value."""
@@ -22,6 +35,183 @@ K = TypeVar("K")
 _NotFound = object()
 """Internal parasite value for not found keys."""
 
+_Invalid = object()
+"""Internal parasite value for values, that failed to parse while collecting errors."""
+
+_VERSIONS = itertools.count(1)
+"""Source of the versions of modified schemas, unique across all schemas."""
+
+_LATEST = [0]
+"""Version of the last modified schema, so that parents can skip collecting the states of their
+subschemas, if no schema was modified since (see :func:`ParasiteType._state`)."""
+
+PARSE_METHODS = (
+    "_check",
+    "_collect",
+    "_collect_find",
+    "_accepts",
+    "_tag",
+    "_compile",
+    "_compile_find",
+    "_codegen",
+    "_codegen_find",
+    "_parse_column",
+    "_vectorize",
+    "_codegen_vector",
+)
+"""Internal methods, that parse values without calling :func:`ParasiteType.parse`."""
+
+FIND_METHODS = (
+    "_find_and_parse_raw",
+    "_check_find",
+    "_collect_find",
+    "_compile_find",
+    "_codegen_find",
+    "_parse_column",
+)
+"""Internal methods, that find values without calling :func:`ParasiteType._find_and_parse`."""
+
+
+class _Failure:
+    """
+    Internal parasite result of a failed :func:`ParasiteType._check`. Carries the error, that
+    :func:`ParasiteType.parse` would raise, so that failures can be passed on without raising and
+    catching exceptions (e.g. for the branches of :class:`parasite.variant.Variant`).
+    """
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: ValidationError) -> None:
+        """
+        Args:
+            error (ValidationError): the error of the failed value
+        """
+        self.error = error
+
+
+class _Collector:
+    """
+    Collects the failures of a single :func:`ParasiteType.parse` call with ``collect_errors=True``.
+    """
+
+    class Full(Exception):
+        """Raised once the maximum number of errors is reached, to stop parsing early."""
+
+    def __init__(self, limit: int | None) -> None:
+        """
+        Args:
+            limit (int | None): maximum number of errors to collect, or ``None`` for no limit
+        """
+        self.errors: list[ErrorDetail] = []
+        self.limit = limit
+
+    def add(
+        self, path: tuple[Any, ...], schema: ParasiteType, code: str, value: Any, msg: str
+    ) -> None:
+        """
+        Records a failure.
+
+        Throws:
+            _Collector.Full: if the maximum number of errors is reached
+
+        Args:
+            path (tuple[Any, ...]): path of the failing value
+            schema (ParasiteType): schema node, that failed
+            code (str): kind of the failure
+            value (Any): the offending value
+            msg (str): description of the failure
+        """
+        self.errors.append(ErrorDetail(path, schema, code, value, msg))
+
+        if self.limit is not None and len(self.errors) >= self.limit:
+            raise _Collector.Full
+
+
+def _structure(value: Any) -> Any:
+    """
+    Converts a schema (or a value inside of a schema) into a nested tuple of strings, that describes
+    the value structurally. Used by :func:`ParasiteType.fingerprint`.
+
+    Throws:
+        TypeError: if the value has no structural representation
+
+    Args:
+        value (Any): value to convert
+
+    Returns:
+        Any: structural representation of the value
+    """
+    tp = type(value)
+
+    if value is None or tp in (bool, int, float, str, bytes):
+        return (tp.__name__, repr(value))
+
+    if tp in (list, tuple):
+        return (tp.__name__, *(_structure(item) for item in value))
+
+    if tp is dict:
+        return ("dict", *((_structure(k), _structure(v)) for k, v in value.items()))
+
+    if isinstance(value, re.Pattern):
+        return ("re", _structure(value.pattern), repr(int(value.flags)))
+
+    if isinstance(value, enum.Enum):
+        return (tp.__module__, tp.__qualname__, value.name)
+
+    if isinstance(value, ParasiteType):
+        return (
+            tp.__module__,
+            tp.__qualname__,
+            *((name, _structure(getattr(value, name))) for name in value._fields()),
+        )
+
+    raise TypeError(f"value {value!r} has no structural representation")
+
+
+def _hashable(value: Any) -> Any:
+    """
+    Converts a value inside of a schema into a hashable value, that compares equal whenever the
+    original values compare equal. Used by :func:`ParasiteType.__hash__`.
+
+    Args:
+        value (Any): value to convert
+
+    Returns:
+        Any: hashable representation of the value
+    """
+    if isinstance(value, dict):
+        return frozenset((k, _hashable(v)) for k, v in value.items())
+
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+
+    return value
+
+
+def _schemas(value: Any) -> Iterator[ParasiteType]:
+    """
+    Yields all schemas inside of a value of a schema (the value itself included), depth first.
+
+    Args:
+        value (Any): value to search for schemas
+
+    Returns:
+        Iterator[ParasiteType]: the schemas
+    """
+    if isinstance(value, ParasiteType):
+        yield value
+
+        for name in value._fields():
+            yield from _schemas(getattr(value, name))
+
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _schemas(item)
+
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _schemas(item)
+
 
 @dataclass
 class ParasiteType(ABC, Generic[T]):
@@ -34,26 +224,476 @@ class ParasiteType(ABC, Generic[T]):
             :parts: 1
     """
 
+    _f_frozen: bool = field(default=False, compare=False, repr=False)  # Whether frozen.
+
+    # Caches of the hash and fingerprint, only used if the instance is frozen.
+    _c_hash: int | None = field(default=None, compare=False, repr=False)
+    _c_fingerprint: str | None = field(default=None, compare=False, repr=False)
+    _c_compiled: CompiledSchema[T] | None = field(default=None, compare=False, repr=False)
+
+    # Version of the schema, changes on every modification of the schema itself.
+    _c_version: int = field(default=0, compare=False, repr=False)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # ``@dataclass`` sets ``__hash__`` to ``None`` for non-frozen dataclasses, unless the class
+        # defines it explicitly, so define it on every subclass before the decorator runs
+        cls.__hash__ = ParasiteType.__hash__  # type: ignore
+
+        # subclasses, that change how values are parsed (e.g. by only overriding the public
+        # methods), fall back to the default implementations of the internal methods, which call
+        # the overridden ones, instead of inheriting internal methods, that would bypass them
+        if "_check" in cls.__dict__ and "parse" not in cls.__dict__:
+            cls.parse = ParasiteType._parse_check  # type: ignore
+
+        if "parse" in cls.__dict__ or "_check" in cls.__dict__:
+            for name in PARSE_METHODS:
+                if name not in cls.__dict__:
+                    setattr(cls, name, getattr(ParasiteType, name))
+
+        if "_find_and_parse" in cls.__dict__ or "_find_and_parse_raw" in cls.__dict__:
+            for name in FIND_METHODS:
+                if name not in cls.__dict__:
+                    setattr(cls, name, getattr(ParasiteType, name))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith(("_f_", "_m_")):
+            if self._f_frozen:
+                raise FrozenInstanceError(f"cannot assign to {name!r}, schema is frozen")
+
+            object.__setattr__(self, name, value)
+            self._bump()
+            self._refresh()
+            return
+
+        object.__setattr__(self, name, value)
+
+    def __hash__(self) -> int:
+        if not self._f_frozen:
+            raise TypeError(f"unhashable type: {type(self).__name__!r}, use freeze() first")
+
+        if self._c_hash is None:
+            self._c_hash = hash(
+                (type(self), *(_hashable(getattr(self, name)) for name in self._fields()))
+            )
+
+        return self._c_hash
+
+    @classmethod
+    def _fields(cls) -> tuple[str, ...]:
+        """
+        Returns:
+            tuple[str, ...]: names of the fields, that define the schema (and take part in
+            comparisons)
+        """
+        return tuple(f.name for f in dataclasses.fields(cls) if f.compare)
+
+    def _walk(self) -> Iterator[ParasiteType]:
+        """
+        Returns:
+            Iterator[ParasiteType]: the schema itself and all of its subschemas, depth first
+        """
+        return _schemas(self)
+
+    def _assert_mutable(self) -> None:
+        """
+        Guard for methods, that modify members of the schema in place.
+
+        Throws:
+            FrozenInstanceError: if the schema is frozen
+        """
+        if self._f_frozen:
+            raise FrozenInstanceError(f"cannot modify {type(self).__name__!r}, schema is frozen")
+
+        self._bump()
+
+    def _bump(self) -> None:
+        """
+        Assigns a new version to the schema (see :func:`_state`), after it was modified.
+        """
+        # ``next(..)`` of ``itertools.count`` is atomic, unlike ``+= 1``
+        object.__setattr__(self, "_c_version", version := next(_VERSIONS))
+
+        # published after the version, so that states collected after reading it include it
+        _LATEST[0] = version
+
+    def _replace(self, **changes: Any) -> Any:
+        """
+        Creates a deep copy of the schema with some of the fields replaced. Works on frozen schemas
+        as well; the copy stays frozen in this case.
+
+        Args:
+            **changes (Any): fields to replace
+
+        Returns:
+            Any: the modified copy
+        """
+        new = copy.deepcopy(self)
+
+        for name, value in changes.items():
+            object.__setattr__(new, name, value)
+
+        new._c_hash = new._c_fingerprint = new._c_compiled = None
+        new._bump()
+        new._refresh()
+        return new
+
+    def _refresh(self) -> None:
+        """
+        Rebuilds the caches, that only depend on the fields of the schema itself, so that parsing
+        can use them without checking them first. Called whenever a field of the schema changes
+        (e.g. by the builder methods). The default implementation does nothing.
+        """
+
+    def _state(self) -> Any:
+        """
+        State of the schema, that the caches of its parents depend on (e.g. the results of
+        :func:`_accepts` and :func:`_tag`). Changes whenever the schema is modified. Subclasses,
+        whose state depends on their subschemas, include the state of those, and may reuse it as
+        long as no schema was modified (see :data:`_LATEST`).
+
+        Returns:
+            Any: comparable state of the schema
+        """
+        return self._c_version
+
+    @property
+    def frozen(self) -> bool:
+        """
+        Returns:
+            bool: whether the schema is frozen (see :func:`freeze`)
+        """
+        return self._f_frozen
+
+    def freeze(self) -> Any:
+        """
+        Freezes the schema and all of its subschemas. A frozen schema is immutable (all builder
+        methods raise a :class:`dataclasses.FrozenInstanceError`) and hashable, so it can be used as
+        a dictionary key or in a set. Freezing cannot be undone.
+
+        Returns:
+            Self: the frozen instance of the class
+
+        Example usage:
+            Let's assume we have the following schema::
+
+                from parasite import p
+
+                schema = p.obj({ "name": p.string() }).freeze()
+
+            The schema cannot be changed anymore, but can be hashed::
+
+                >>> schema.strict()
+                FrozenInstanceError: cannot assign to '_f_strict', schema is frozen
+
+                >>> { schema: "person" }[p.obj({ "name": p.string() }).freeze()]
+                "person"
+        """
+        for schema in self._walk():
+            object.__setattr__(schema, "_f_frozen", True)
+
+        return self
+
+    def fingerprint(self) -> str:
+        """
+        Computes a deterministic fingerprint of the schema. The fingerprint covers the whole schema
+        tree (the type of every node, flags, bounds, regex patterns, subschemas and the order of
+        keys in objects), and is stable across processes and python versions. Two schemas with the
+        same fingerprint parse values in exactly the same way.
+
+        Note:
+            The fingerprint of frozen schemas is only computed once.
+
+        Throws:
+            TypeError: if the schema contains values without a deterministic representation (e.g.
+                object keys, that are not ``None``, ``bool``, ``int``, ``float``, ``str``,
+                ``bytes`` or tuples of those)
+
+        Returns:
+            str: hex digest of the fingerprint
+
+        Example usage::
+
+            >>> p.string().min(1).fingerprint() == p.string().min(1).fingerprint()
+            True
+            >>> p.string().min(1).fingerprint() == p.string().min(2).fingerprint()
+            False
+        """
+        if self._c_fingerprint is not None:
+            return self._c_fingerprint
+
+        fingerprint = hashlib.sha256(repr(_structure(self)).encode()).hexdigest()
+
+        if self._f_frozen:
+            self._c_fingerprint = fingerprint
+
+        return fingerprint
+
     @abstractmethod
-    def parse(self, obj: Any) -> T:
+    def parse(self, obj: Any, collect_errors: bool = False, max_errors: int | None = None) -> T:
         """
-        Default method for parsing a value. This method should be overridden by subclasses.
+        Default method for parsing a value. This method should be overridden by subclasses, which
+        delegate to :func:`_parse_collect` if ``collect_errors`` is set.
+
+        Throws:
+            ValidationError: if the value could not be parsed or was invalid. If ``collect_errors``
+                is set, the error holds every failure in
+                :attr:`parasite.errors.ValidationError.errors`.
+            ValueError: if ``max_errors`` is smaller than 1
+
+        Args:
+            obj (Any): value to parse
+            collect_errors (bool): whether to keep parsing after the first failure, and collect
+                every failure (see :class:`parasite.errors.ErrorDetail`). Default: False
+            max_errors (int | None): maximum number of failures to collect, parsing stops as soon
+                as it is reached. Only used if ``collect_errors`` is set. Default: None
+
+        Returns:
+            T: parsed destination value
+
+        Example usage:
+            Let's assume we have the following schema::
+
+                from parasite import p
+
+                schema = p.obj({ "name": p.string(), "tags": p.array(p.string()) })
+
+            Every failure is collected with ``collect_errors=True``::
+
+                >>> try:
+                ...     schema.parse({ "tags": ["a", 1, None] }, collect_errors=True)
+                ... except ValidationError as exc:
+                ...     [(e.path, e.code) for e in exc.errors]
+                [
+                    (('name',), 'missing_key'),
+                    (('tags', 1), 'invalid_value'),
+                    (('tags', 2), 'invalid_value'),
+                ]
+        """
+
+    def _parse_check(
+        self, obj: Any, collect_errors: bool = False, max_errors: int | None = None
+    ) -> T:
+        """
+        Default implementation of :func:`parse` for subclasses, that only override :func:`_check`.
 
         Throws:
             ValidationError: if the value could not be parsed or was invalid
 
         Args:
             obj (Any): value to parse
+            collect_errors (bool): collect every failure instead of stopping at the first one
+            max_errors (int | None): maximum number of failures to collect
 
         Returns:
             T: parsed destination value
         """
+        if collect_errors:
+            return self._parse_collect(obj, max_errors)
 
-    @abstractmethod
-    def _find_and_parse(self, parent: dict[K, Any], key: K) -> Option[T | None]:
+        return self._unwrap(self._check(obj))
+
+    def _parse_collect(self, obj: Any, max_errors: int | None) -> T:
+        """
+        Parses a value, and collects every failure instead of stopping at the first one. Called by
+        :func:`parse` if ``collect_errors`` is set.
+
+        Throws:
+            ValidationError: if the value could not be parsed or was invalid, with every failure in
+                :attr:`parasite.errors.ValidationError.errors`
+            ValueError: if ``max_errors`` is smaller than 1
+
+        Args:
+            obj (Any): value to parse
+            max_errors (int | None): maximum number of failures to collect
+
+        Returns:
+            T: parsed destination value
+        """
+        if max_errors is not None and max_errors < 1:
+            raise ValueError(f"max_errors has to be at least 1, but is {max_errors!r}")
+
+        collector = _Collector(max_errors)
+
+        # parsing stops as soon as the maximum number of errors is reached
+        value = _Invalid
+        with contextlib.suppress(_Collector.Full):
+            value = self._collect(obj, (), collector)
+
+        if errors := collector.errors:
+            raise ValidationError(
+                f"object is invalid, found {len(errors)} errors: "
+                + "; ".join(str(error) for error in errors),
+                errors=errors,
+            )
+
+        return value
+
+    def _collect(self, obj: Any, path: tuple[Any, ...], collector: _Collector) -> Any:
+        """
+        Parses a value like :func:`parse`, but records failures in the collector instead of
+        raising them. Container types override this method, to keep parsing their remaining
+        children after a failure.
+
+        Throws:
+            _Collector.Full: if the maximum number of errors is reached
+
+        Args:
+            obj (Any): value to parse
+            path (tuple[Any, ...]): path of the value
+            collector (_Collector): collector of the failures
+
+        Returns:
+            Any: parsed destination value, or ``_Invalid`` if the value is invalid
+        """
+        if type(value := self._check(obj)) is _Failure:
+            error = value.error
+            collector.add((*path, *error.path), self, error.code, error.value, str(error))
+            return _Invalid
+
+        return value
+
+    def _collect_find(
+        self,
+        parent: dict[Any, Any],
+        key: Any,
+        path: tuple[Any, ...],
+        collector: _Collector,
+    ) -> Any:
+        """
+        Finds and parses a value from a dictionary like :func:`_find_and_parse_raw`, but records
+        failures in the collector instead of raising them.
+
+        Throws:
+            _Collector.Full: if the maximum number of errors is reached
+
+        Args:
+            parent (dict[Any, Any]): dictionary to search for the key
+            key (Any): key to search for in the dictionary
+            path (tuple[Any, ...]): path of the dictionary
+            collector (_Collector): collector of the failures
+
+        Returns:
+            Any: parsed destination value, ``_NotFound`` or ``_Invalid``
+        """
+        if type(value := self._check_find(parent, key)) is _Failure:
+            error = value.error
+            collector.add((*path, key, *error.path), self, error.code, error.value, str(error))
+            return _Invalid
+
+        return value
+
+    def _check(self, obj: Any) -> Any:
+        """
+        Parses a value like :func:`parse`, but returns a failure instead of raising it. This is the
+        internal protocol, that is used by containers for their children, and by the ``*_safe``
+        methods, so that failures are only raised at the public :func:`parse`. Subclasses should
+        override this method, and implement :func:`parse` through it (see :func:`_unwrap`).
+
+        Args:
+            obj (Any): value to parse
+
+        Returns:
+            Any: parsed destination value, or ``_Failure`` if the value is invalid
+        """
+        try:
+            return self.parse(obj)
+
+        except ValidationError as exc:
+            return _Failure(exc)
+
+    def _check_find(self, parent: dict[K, Any], key: K) -> Any:
+        """
+        Finds and parses a value from a dictionary like :func:`_find_and_parse_raw`, but returns a
+        failure instead of raising it (see :func:`_check`). Subclasses should override this
+        method, and implement :func:`_find_and_parse_raw` through it.
+
+        Args:
+            parent (dict[K, Any]): dictionary to search for the key
+            key (K): key to search for in the dictionary
+
+        Returns:
+            Any: parsed destination value, ``_NotFound`` or ``_Failure``
+        """
+        try:
+            return self._find_and_parse_raw(parent, key)
+
+        except ValidationError as exc:
+            return _Failure(exc)
+
+    def _accepts(self, cls: type) -> bool:
+        """
+        Cheap check, whether values of a type can be parsed at all. Used by
+        :class:`parasite.variant.Variant` to skip the variants, that can never parse a value.
+        Subclasses should override this method, if they only accept some types, and have to return
+        ``True`` if in doubt.
+
+        Args:
+            cls (type): exact type of the value
+
+        Returns:
+            bool: ``False`` if no value of the type can be parsed
+        """
+        return True
+
+    def _tag(self) -> Any:
+        """
+        The only raw value, that can be parsed by the schema (e.g. the value of a literal). Used by
+        :class:`parasite.variant.Variant` to look up the variants of a discriminated union.
+
+        Returns:
+            Any: the only value, that can be parsed, or ``_NotFound`` if there are more
+        """
+        return _NotFound
+
+    @staticmethod
+    def _unwrap(value: Any) -> Any:
+        """
+        Raises the error of a failed :func:`_check` or :func:`_check_find`.
+
+        Throws:
+            ValidationError: if the value is a ``_Failure``
+
+        Args:
+            value (Any): result of :func:`_check` or :func:`_check_find`
+
+        Returns:
+            Any: the value itself
+        """
+        if type(value) is _Failure:
+            raise value.error
+
+        return value
+
+    def _find_and_parse_raw(self, parent: dict[K, Any], key: K) -> Any:
         """
         Default method for finding and parsing a value from a dictionary. This method should be
-        overridden by subclasses. If the key is not found, the method should return :class:`Nil`.
+        overridden by subclasses. If the key is not found, the method should return ``_NotFound``.
+        The default implementation unwraps :func:`_find_and_parse`, so that subclasses, which only
+        implement :func:`_find_and_parse`, keep working.
+
+        Note:
+            This is the internal protocol between :class:`parasite.object.Object` and its children.
+            It returns the parsed value directly, so that no :class:`Option` has to be allocated
+            per key. Use :func:`_find_and_parse` for the :class:`Option` based interface.
+
+        Throws:
+            ValidationError: if the value could not be parsed or was invalid
+
+        Args:
+            parent (dict[K, Any]): dictionary to search for the key
+            key (K): key to search for in the dictionary
+
+        Returns:
+            Any: parsed destination value or ``_NotFound``
+        """
+        return self._find_and_parse(parent, key).unwrap_or(_NotFound)
+
+    def _find_and_parse(self, parent: dict[K, Any], key: K) -> Option[T | None]:
+        """
+        Finds and parses a value from a dictionary. Wrapper around :func:`_find_and_parse_raw`, that
+        returns :class:`Nil` instead of ``_NotFound`` if the key is not found.
 
         Throws:
             ValidationError: if the value could not be parsed or was invalid
@@ -65,8 +705,240 @@ class ParasiteType(ABC, Generic[T]):
         Returns:
             Option[T]: parsed destination value or ``Nil``
         """
+        # both methods default to each other, so use the nearest class, that implements
+        # ``_find_and_parse_raw`` itself, as subclasses may call this method via ``super()``
+        for cls in type(self).__mro__:
+            raw = cls.__dict__.get("_find_and_parse_raw", ParasiteType._find_and_parse_raw)
+            if raw is not ParasiteType._find_and_parse_raw:
+                break
+        else:
+            raise NotImplementedError(f"{type(self).__name__!r} does not implement _find_and_parse")
+
+        if (value := raw(self, parent, key)) is _NotFound:
+            return Nil
+
+        return Some(value)
+
+    def _compile(self) -> Callable[[Any], T]:
+        """
+        Default method for compiling the schema into a flattened parsing function. This method
+        should be overridden by subclasses. The returned function has to behave exactly like
+        :func:`parse`, but should resolve all flags, bounds and subschemas ahead of time. The
+        default implementation returns :func:`parse` itself.
+
+        Returns:
+            Callable[[Any], T]: flattened parsing function
+        """
+        return self.parse
+
+    def _compile_find(self) -> Callable[[dict[Any, Any], Any], Any]:
+        """
+        Default method for compiling the schema into a flattened find-and-parse function. This
+        method should be overridden by subclasses. The returned function has to behave exactly like
+        :func:`_find_and_parse_raw`, which the default implementation returns itself.
+
+        Returns:
+            Callable[[dict[Any, Any], Any], Any]: flattened find-and-parse function
+        """
+        return self._find_and_parse_raw
+
+    def _codegen(self, gen: _CodeGen) -> str:
+        """
+        Default method for generating the python source of the schema. This method should be
+        overridden by subclasses. The method has to define a module level function with
+        :func:`parasite._codegen._CodeGen.function`, that behaves exactly like :func:`parse`. The
+        default implementation calls :func:`parse` itself, which makes the source non-portable.
+
+        Args:
+            gen (_CodeGen): code generator
+
+        Returns:
+            str: name of the generated function
+        """
+        return gen.object(self.parse)
+
+    def _codegen_find(self, gen: _CodeGen, key: Any) -> list[str]:
+        """
+        Default method for generating the python source of :func:`_find_and_parse`. This method
+        should be overridden by subclasses. The generated lines work on the parent dictionary
+        ``obj`` and write the parsed value back into it, if the key is found. The default
+        implementation calls :func:`_find_and_parse_raw` itself, which makes the source
+        non-portable.
+
+        Args:
+            gen (_CodeGen): code generator
+            key (Any): key to search for in the dictionary
+
+        Returns:
+            list[str]: lines of source
+        """
+        expr = gen.literal(key)
+        return [
+            f"value = obj.get({expr}, _NotFound)",
+            f"found = {gen.object(self._find_and_parse_raw)}(obj, {expr})",
+            "if found is not _NotFound:",
+            *gen.indent(gen.store(expr, "found")),
+        ]
+
+    def _parse_column(self, rows: list[dict[Any, Any]], key: Any, values: list[Any]) -> None:
+        """
+        Finds and parses the value of a key in every row of a table (see
+        :func:`parasite.array.Array.parse_columnar`). Behaves like calling
+        :func:`_find_and_parse_raw` for every row, and appends the results to ``values``.
+        Subclasses can override this method, to validate a whole column at once.
 
-    def parse_safe(self, obj: Any) -> Result[T, ValidationError]:
+        Throws:
+            ValidationError: if a value could not be parsed or was invalid. ``values`` then holds
+                the results of all rows before the failing row, so that ``len(values)`` is the index
+                of the failing row.
+
+        Args:
+            rows (list[dict[Any, Any]]): rows of the table
+            key (Any): key of the column
+            values (list[Any]): list to append the parsed values (or ``_NotFound``) to
+        """
+        find = self._compile_find()
+        append = values.append
+
+        for row in rows:
+            append(find(row, key))
+
+    def _vectorize(self) -> Callable[[Any], int | None] | None:
+        """
+        Compiles a function, that validates a whole sequence of values at once (see
+        :mod:`parasite._vector`), for the elements of a :class:`parasite.array.Array`. The function
+        returns the index of the first invalid value, the length of the sequence if every value is
+        valid, or ``None`` if the sequence has to be parsed value by value. Subclasses can override
+        this method, if their values can be validated as a whole.
+
+        Returns:
+            Callable[[Any], int | None] | None: validating function, or ``None`` if not supported
+        """
+        return None
+
+    def _codegen_vector(self, gen: _CodeGen, values: str) -> str | None:
+        """
+        Generates the python source of :func:`_vectorize`.
+
+        Args:
+            gen (_CodeGen): code generator
+            values (str): expression of the sequence of values
+
+        Returns:
+            str | None: expression of the index, or ``None`` if not supported
+        """
+        return None
+
+    @staticmethod
+    def _make_find(
+        parse: Callable[[Any], T],
+        optional: bool,
+        nullable: bool,
+    ) -> Callable[[dict[Any, Any], Any], Any]:
+        """
+        Builds the default find-and-parse function for compiled schemas, that handles the
+        ``optional`` and ``nullable`` flags the same way as the :func:`_find_and_parse`
+        implementations of the subclasses do.
+
+        Args:
+            parse (Callable[[Any], T]): compiled parsing function of the schema
+            optional (bool): whether the key is allowed to be missing
+            nullable (bool): whether the value is allowed to be ``None``
+
+        Returns:
+            Callable[[dict[Any, Any], Any], Any]: flattened find-and-parse function
+        """
+
+        def find(parent: dict[Any, Any], key: Any) -> Any:
+            if (value := parent.get(key, _NotFound)) is not _NotFound:
+                # if key is found, just ``parse(..)`` it
+                if value is not None:
+                    return parse(value)
+
+                # if value is None, check if the value is nullable
+                if nullable:
+                    return None
+
+                msg = "key {!r} is not nullable, but is None"
+                raise ValidationError(msg, key, code="not_nullable")
+
+            # if key is not found, return _NotFound if optional, else raise an error
+            if optional:
+                return _NotFound
+
+            raise ValidationError("key {!r} not found, but is required", key, code="missing_key")
+
+        return find
+
+    def compile(
+        self,
+        backend: str = "closure",
+        cache: SchemaCache | None = None,
+    ) -> CompiledSchema[T]:
+        """
+        Compiles the schema into a :class:`parasite.compiler.CompiledSchema`. The schema tree is
+        walked exactly once, and all flags, bounds and regexes are resolved ahead of time. Use this,
+        if the same schema is used to parse a lot of values.
+
+        The following backends are available:
+
+        - ``"closure"``: composes the parsing functions of the schema nodes as closures. Default.
+        - ``"codegen"``: generates straight-line python source for the schema (with inlined type,
+          length and bound checks, and dictionary lookups by constant keys) and executes it. The
+          source is available through :attr:`parasite.compiler.CompiledSchema.source`. Supports
+          persistent caching through :class:`parasite.cache.SchemaCache`.
+
+        Warning:
+            The compiled schema is a snapshot. Changes made to the schema after calling
+            :func:`compile` are not reflected in the compiled schema.
+
+        Throws:
+            ValueError: if the backend is unknown, or does not support caching
+
+        Args:
+            backend (str): backend to compile the schema with. Default: "closure"
+            cache (SchemaCache, optional): on-disk cache to load the compiled schema from, or to
+                store it into. Only supported by the ``"codegen"`` backend. Default: None
+
+        Returns:
+            CompiledSchema[T]: compiled schema
+
+        Example usage:
+            Let's assume we have the following schema::
+
+                from parasite import p
+
+                schema = p.obj({ "name": p.string(), "age": p.number().integer() }).compile()
+
+            The compiled schema will parse the following objects::
+
+                >>> schema.parse({ "name": "John", "age": 42 })
+                { "name": "John", "age": 42 }
+                >>> schema.parse({ "name": "John", "age": 4.2 })
+                ValidationError: object has to be an integer, but is 4.2
+        """
+        if cache is not None and backend != "codegen":
+            raise ValueError(f"backend {backend!r} does not support caching, use 'codegen'")
+
+        if backend == "closure":
+            return CompiledSchema(self, self._compile())
+
+        if backend == "codegen":
+            if cache is not None:
+                return cache.compile(self)
+
+            source, entry, gen = _codegen.generate(self)
+            code = _codegen.build(source)
+            return CompiledSchema(self, _codegen.load(code, source, entry, gen.namespace()), source)
+
+        raise ValueError(f"unknown backend {backend!r}, has to be one of ['closure', 'codegen']")
+
+    def parse_safe(
+        self,
+        obj: Any,
+        collect_errors: bool = False,
+        max_errors: int | None = None,
+    ) -> Result[T, ValidationError]:
         """
         Converts the result of :func:`parse` into a :class:`rusttypes.result.Result` type. Should be
         used when safe parsing is required.
@@ -76,17 +948,103 @@ class ParasiteType(ABC, Generic[T]):
 
         Args:
             obj (Any): value to parse
+            collect_errors (bool): whether to collect every failure (see :func:`parse`).
+                Default: False
+            max_errors (int | None): maximum number of failures to collect. Default: None
 
         Returns:
             Result[T, ValidationError]: parsed destination value or an error
         """
-        try:
-            # may throw a ValidationError exception
-            return Ok(self.parse(obj))
+        if collect_errors:
+            try:
+                # may throw a ValidationError exception
+                return Ok(self.parse(obj, collect_errors, max_errors))
 
-        # handle ValidationError exceptions, if parsing fails
-        except ValidationError as exc:
-            return Err(exc)
+            # handle ValidationError exceptions, if parsing fails
+            except ValidationError as exc:
+                return Err(exc)
+
+        # parse without raising, failures are returned as _Failure
+        if type(value := self._check(obj)) is _Failure:
+            return Err(value.error)
+
+        return Ok(value)
+
+    def _compiled(self) -> CompiledSchema[T]:
+        """
+        Returns:
+            CompiledSchema[T]: the schema compiled with the ``"closure"`` backend. The compiled
+            schema of frozen schemas is only created once.
+        """
+        if not self._f_frozen:
+            return self.compile()
+
+        if self._c_compiled is None:
+            self._c_compiled = self.compile()
+
+        return self._c_compiled
+
+    def parse_many(self, objs: Iterable[Any]) -> list[T]:
+        """
+        Parses a batch of values. Equivalent to calling :func:`parse` for every value, but the
+        schema is compiled (see :func:`compile`) once per batch, and the values are parsed without
+        the per-value call overhead. Frozen schemas (see :func:`freeze`) are only compiled once.
+
+        Throws:
+            ValidationError: if any of the values could not be parsed or was invalid; the message
+                contains the index of the first invalid value
+
+        Args:
+            objs (Iterable[Any]): values to parse
+
+        Returns:
+            list[T]: parsed destination values, in the same order as the values
+
+        Example usage:
+            Let's assume we have the following schema::
+
+                from parasite import p
+
+                schema = p.obj({ "name": p.string(), "age": p.number().integer() })
+
+            The schema will parse the following batches::
+
+                >>> schema.parse_many([{ "name": "John", "age": 42 }, { "name": "Jane", "age": 7 }])
+                [{ "name": "John", "age": 42 }, { "name": "Jane", "age": 7 }]
+                >>> schema.parse_many([{ "name": "John", "age": 42 }, { "name": "Jane" }])
+                ValidationError: object at index 1 is invalid: key 'age' not found, but is required
+        """
+        return self._compiled().parse_many(objs)
+
+    def parse_many_safe(self, objs: Iterable[Any]) -> list[Result[T, ValidationError]]:
+        """
+        Parses a batch of values, and converts the result of every value into a
+        :class:`rusttypes.result.Result` type. Equivalent to calling :func:`parse_safe` for every
+        value, with the same optimizations as :func:`parse_many`.
+
+        Note:
+            Will only catch :class:`parasite.errors.ValidationError` exceptions!!!
+
+        Args:
+            objs (Iterable[Any]): values to parse
+
+        Returns:
+            list[Result[T, ValidationError]]: parsed destination values or errors, in the same
+            order as the values
+
+        Example usage:
+            Let's assume we have the following schema::
+
+                from parasite import p
+
+                schema = p.number().integer()
+
+            The schema will parse the following batches::
+
+                >>> schema.parse_many_safe([1, 2.5, 3])
+                [Ok(1), Err(ValidationError("object has to be an integer, but is 2.5")), Ok(3)]
+        """
+        return self._compiled().parse_many_safe(objs)
 
     def _find_and_parse_safe(
         self,
@@ -107,10 +1065,8 @@ class ParasiteType(ABC, Generic[T]):
         Returns:
             Result[T, ValidationError]: parsed destination value or an error
         """
-        try:
-            # may throw a ValidationError exception
-            return Ok(self._find_and_parse(parent, key))
+        # parse without raising, failures are returned as _Failure
+        if type(value := self._check_find(parent, key)) is _Failure:
+            return Err(value.error)
 
-        # handle ValidationError exceptions, if parsing fails
-        except ValidationError as exc:
-            return Err(exc)
+        return Ok(Nil if value is _NotFound else Some(value))
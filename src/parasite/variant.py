@@ -3,20 +3,65 @@ from __future__ import annotations
 
 # -- STL Imports --
 from dataclasses import dataclass, field
-from typing import Any, TypeVar
+from typing import Any, Callable, TypeVar
 from collections.abc import Iterable
 
 # -- Library Imports --
-from rusttypes.option import Nil, Option, Some
 from rusttypes.result import Result, Err, Ok
 
 # -- Package Imports --
+from parasite._codegen import _CodeGen, emit_find
 from parasite.errors import ValidationError
-from parasite.type import ParasiteType, _NotFound
+from parasite.type import _LATEST, ParasiteType, _Collector, _Failure, _NotFound
 
 K = TypeVar("K")
 """Template type for the key in a dictionary."""
 
+MSG_NO_VARIANT = "object has to be one of {!r}, but is {!r}"
+"""Message for values, that could not be parsed by any of the variants."""
+
+MSG_MISSING_TAG = "key {!r} not found, but is required"
+"""Message for objects, that do not contain the discriminator."""
+
+MSG_UNKNOWN_TAG = "value of key {!r} has to be one of {!r}, but is {!r}"
+"""Message for objects, whose discriminator does not select any of the variants."""
+
+DISPATCH = (type(None), bool, int, float, str, list, dict)
+"""Types, for which compiled variants precompute the variants, that can accept their values."""
+
+ADAPT_INTERVAL = 1024
+"""Number of parsed values, after which adaptive variants reorder their variants."""
+
+
+class _Adaptive:
+    """
+    State of an adaptive :class:`Variant`, that counts the hits of each variant and tries the most
+    frequent ones first (see :func:`Variant.adaptive`).
+    """
+
+    def __init__(self, ids: tuple[int, ...], state: Any) -> None:
+        """
+        Args:
+            ids (tuple[int, ...]): identities of the variants, the state was created for
+            state (Any): state of the variant, the tables were built for
+        """
+        self.ids = ids
+        self.state = state
+        self.hits = [0] * len(ids)  # Number of values parsed by each variant.
+        self.count = 0  # Number of values parsed since the last reordering.
+        self.order = tuple(range(len(ids)))  # Indices of the variants, in the order to try them.
+        self.tables: dict[type, tuple[int, ...]] = {}  # Ordered indices per type of value.
+
+    def reorder(self) -> None:
+        """
+        Sorts the variants by their hits, most frequent first, and halves the hits so that the
+        order follows changes of the traffic. Ties keep the declared order.
+        """
+        self.order = tuple(sorted(self.order, key=lambda i: (-self.hits[i], i)))
+        self.tables = {}
+        self.hits = [hit // 2 for hit in self.hits]
+        self.count = 0
+
 
 @dataclass
 class Variant(ParasiteType[Any]):
@@ -26,6 +71,15 @@ class Variant(ParasiteType[Any]):
     by trying to parse it with each variant in the order they are added. If none of the variants can
     parse the value, a :class:`ValidationError` is raised.
 
+    Note:
+        Only the variants, that can accept the type of the value at all, are tried (e.g. a ``str``
+        is never parsed by a :class:`parasite.number.Number`). The variants are looked up once per
+        type of value.
+
+    Note:
+        If a discriminator is set (see :func:`discriminator`), the variant of an object is looked
+        up by the value of the discriminator, instead of being tried in order.
+
     Inheritance:
         .. inheritance-diagram:: parasite.variant.Variant
             :parts: 1
@@ -37,6 +91,30 @@ class Variant(ParasiteType[Any]):
     _f_optional: bool = False  # Whether the value is optional.
     _f_nullable: bool = False  # Whether the value can be None.
 
+    _m_discriminator: str | None = None  # Key, whose literal value selects the variant.
+
+    _f_adaptive: bool = False  # Whether the most frequent variants are tried first.
+    _f_exclusive: bool = False  # Whether no value can be parsed by more than one variant.
+
+    # Cache of the variants per type of value, and the state of the variant it was built for.
+    _c_dispatch: tuple[Any, dict[type, tuple[ParasiteType, ...]]] | None = field(
+        default=None, compare=False, repr=False
+    )
+
+    # Hits and order of the variants, if adaptive.
+    _c_adaptive: _Adaptive | None = field(default=None, compare=False, repr=False)
+
+    # Cache of the variants per value of the discriminator, and the state of the variants and their
+    # items it was built for.
+    _c_tags: tuple[Any, dict[Any, ParasiteType]] | None = field(
+        default=None, compare=False, repr=False
+    )
+
+    # Latest version of any schema (see :data:`parasite.type._LATEST`), when the state of the
+    # variants (see :func:`_state`) and their items (see :func:`_item_state`) was collected.
+    _c_state: tuple[int, Any] = field(default=(-1, None), compare=False, repr=False)
+    _c_item_state: tuple[int, Any] = field(default=(-1, None), compare=False, repr=False)
+
     def __init__(self, variants: Iterable[ParasiteType] | None = None):
         """
         Args:
@@ -266,6 +344,10 @@ class Variant(ParasiteType[Any]):
             with each variant in the order they are added. The first variant that can parse the
             value is used.
 
+        Throws:
+            ValueError: if the variant is a discriminated union (see :func:`discriminator`), and the
+                added variant has no literal discriminator, or the same one as another variant.
+
         Args:
             variant (ParasiteType): The variant to add.
 
@@ -289,6 +371,11 @@ class Variant(ParasiteType[Any]):
                 >>> schema.parse(42)
                 ValidationError: object has to be one of [String(...)], but is 42
         """
+        self._assert_mutable()
+
+        if self._m_discriminator is not None:
+            self._tag_table(self._m_discriminator, [*self._m_variants, variant])
+
         self._m_variants.append(variant)
         return self
 
@@ -329,6 +416,8 @@ class Variant(ParasiteType[Any]):
                 >>> schema.parse("42")
                 ValidationError: object has to be one of [Number(...)], but is '42'
         """
+        self._assert_mutable()
+
         try:
             self._m_variants.remove(variant)
 
@@ -387,30 +476,557 @@ class Variant(ParasiteType[Any]):
         except ValueError as exc:
             return Err(exc)
 
-    def parse(self, obj: Any) -> Any:
-        for variant in self._m_variants:
+    def discriminator(self, key: str) -> Variant:
+        """
+        Turns the variant into a discriminated union. Every variant has to be a
+        :class:`parasite.object.Object`, that has a literal (e.g.
+        :func:`parasite.string.String.literal`) at ``key``. Objects are parsed by the variant, whose
+        literal equals the value at ``key``, without trying the other variants.
+
+        Throws:
+            ValueError: if a variant has no literal at ``key``, or two variants have the same one.
+
+        Args:
+            key (str): The key of the discriminator.
+
+        Returns:
+            Variant: The updated instance of the class.
+
+        Example usage:
+            You can create a discriminated union by calling the :func:`discriminator` function. The
+            following example shows how to create a union of two events::
+
+                from parasite import p
+
+                schema = p.variant([
+                    p.obj({ "type": p.string().literal("click"), "x": p.number() }),
+                    p.obj({ "type": p.string().literal("key"), "code": p.string() }),
+                ]).discriminator("type")
+
+            The resulting schema will parse the following objects::
+
+                >>> schema.parse({ "type": "key", "code": "Enter" })
+                { "type": "key", "code": "Enter" }
+
+                >>> schema.parse({ "type": "key", "x": 42 })
+                ValidationError: key 'code' not found, but is required
+                >>> schema.parse({ "type": "scroll" })
+                ValidationError: value of key 'type' has to be one of ['click', 'key'], but is ...
+        """
+        # validate the discriminator first, so the schema is left unchanged if it is invalid
+        self._tag_table(key, self._m_variants)
+        self._m_discriminator = key
+        self._tags()
+        return self
+
+    def adaptive(self, exclusive: bool = False) -> Variant:
+        """
+        Makes the variant adaptive. The variant counts, which variant parses each value, and
+        reorders the variants every :data:`ADAPT_INTERVAL` values, so that the most frequent ones
+        are tried first. The declared order is used for the error messages.
+
+        Note:
+            The result only equals the one of the declared order, if no value can be parsed by more
+            than one variant. Unless ``exclusive`` is set, only the variants, that provably cannot
+            parse the same values, are reordered: variants, that accept different types of values,
+            literals with different values, or objects with different literals at a common key.
+            Any other variants are tried in the declared order.
+
+        Note:
+            Compiled schemas (see :func:`parasite.type.ParasiteType.compile`) use the order, that
+            was learned up to the compilation.
+
+        Args:
+            exclusive (bool): Whether the variants are known to be mutually exclusive, so that
+                they are reordered, even if that cannot be proven. Default: False
+
+        Returns:
+            Variant: The updated instance of the class.
+
+        Example usage:
+            Lets assume most values are scroll events, but the union has to try other variants
+            first::
+
+                from parasite import p
+
+                schema = p.variant([
+                    p.obj({ "type": p.string().literal("click"), "x": p.number().integer() }),
+                    p.obj({ "type": p.string().literal("scroll"), "dy": p.number() }),
+                ]).adaptive()
+
+            After :data:`ADAPT_INTERVAL` values, that are mostly scroll events, the second
+            variant is tried first::
+
+                >>> schema.parse({ "type": "scroll", "dy": 1.5 })
+                { "type": "scroll", "dy": 1.5 }
+        """
+        self._f_adaptive = True
+        self._f_exclusive = exclusive
+        return self
+
+    def parse(self, obj: Any, collect_errors: bool = False, max_errors: int | None = None) -> Any:
+        if collect_errors:
+            return self._parse_collect(obj, max_errors)
+
+        return self._unwrap(Variant._check(self, obj))
+
+    def _collect(self, obj: Any, path: tuple[Any, ...], collector: _Collector) -> Any:
+        # the selected variant of a discriminated union collects the failures of its keys
+        if self._m_discriminator is not None and type(variant := self._select(obj)) is not _Failure:
+            return variant._collect(obj, path, collector)
+
+        return super()._collect(obj, path, collector)
+
+    def _check(self, obj: Any) -> Any:
+        if self._m_discriminator is not None:
+            if type(variant := self._select(obj)) is _Failure:
+                return variant
+
+            return variant._check(obj)
+
+        if self._f_adaptive:
+            return self._check_adaptive(obj)
+
+        # the failures of the variants are discarded, without raising them
+        for variant in self._dispatch(type(obj)):
+            if type(value := variant._check(obj)) is not _Failure:
+                return value
+
+        msg, variants = MSG_NO_VARIANT, self._m_variants
+        return _Failure(ValidationError(msg, variants, obj, code="no_variant", value=obj))
+
+    def _check_adaptive(self, obj: Any) -> Any:
+        """
+        Parses a value like :func:`_check`, with the variants in the adaptive order, and records
+        which variant parsed it (see :func:`adaptive`).
+
+        Args:
+            obj (Any): value to parse
+
+        Returns:
+            Any: parsed value, or ``_Failure`` if no variant can parse the value
+        """
+        state, variants = self._adaptive(), self._m_variants
+
+        if (indices := state.tables.get(cls := type(obj))) is None:
+            indices = state.tables[cls] = self._arrange(cls)
+
+        for i in indices:
+            if type(value := variants[i]._check(obj)) is not _Failure:
+                break
+
+        else:
+            msg = MSG_NO_VARIANT
+            return _Failure(ValidationError(msg, variants, obj, code="no_variant", value=obj))
+
+        state.hits[i] += 1
+        state.count += 1
+
+        if state.count >= ADAPT_INTERVAL:
+            state.reorder()
+
+        return value
+
+    def _adaptive(self) -> _Adaptive:
+        """
+        Returns:
+            _Adaptive: the state of the adaptive order, reset if the variants were replaced
+        """
+        # rebuild the tables, if the variants or their items were modified since, as they decide,
+        # which variants are exclusive (frozen schemas cannot be modified)
+        if (state := self._c_adaptive) is None or (
+            not self._f_frozen and state.state is not self._item_state()
+        ):
+            ids, current = tuple(map(id, self._m_variants)), self._item_state()
+
+            if state is None or state.ids != ids:
+                state = self._c_adaptive = _Adaptive(ids, current)
+
+            state.state, state.tables = current, {}
+
+        return state
+
+    def _order(self) -> list[ParasiteType]:
+        """
+        Returns:
+            list[ParasiteType]: the variants, in the order they are tried for values of any type
+        """
+        return [self._m_variants[i] for i in self._arrange(None)]
+
+    def _arrange(self, cls: type | None) -> tuple[int, ...]:
+        """
+        Args:
+            cls (type | None): exact type of a value, or ``None`` for values of any type
+
+        Returns:
+            tuple[int, ...]: indices of the variants, that can accept values of the type, in the
+            order they are tried
+        """
+        variants = self._m_variants
+        indices = tuple(
+            i for i in range(len(variants)) if cls is None or variants[i]._accepts(cls)
+        )
+
+        # the learned order may only change the result, if a value is parsed by several variants
+        if not self._f_adaptive or not (
+            self._f_exclusive or self._exclusive([variants[i] for i in indices])
+        ):
+            return indices
+
+        return tuple(i for i in self._adaptive().order if i in indices)
+
+    @staticmethod
+    def _exclusive(variants: list[ParasiteType]) -> bool:
+        """
+        Checks, whether no value can be parsed by more than one of the variants, because they are
+        literals with different values, or objects with different literals at a common required
+        key (see :func:`parasite.type.ParasiteType._tag`).
+
+        Args:
+            variants (list[ParasiteType]): variants, that accept the same type of values
+
+        Returns:
+            bool: ``True`` if the variants are provably exclusive, ``False`` if in doubt
+        """
+        # pylint: disable=import-outside-toplevel
+        from parasite.object import Object
+
+        def distinct(tags: list[Any]) -> bool:
             try:
-                return variant.parse(obj)
+                return _NotFound not in tags and len(set(tags)) == len(tags)
+
+            except TypeError:
+                return False
+
+        if len(variants) < 2 or distinct([variant._tag() for variant in variants]):
+            return True
+
+        if not all(isinstance(variant, Object) for variant in variants):
+            return False
+
+        # a missing or null key would be accepted by optional or nullable literals alike
+        keys = set.intersection(*(set(variant._m_items) for variant in variants))
+        return any(
+            distinct([variant._m_items[key]._tag() for variant in variants])
+            and not any(
+                getattr(item := variant._m_items[key], "_f_optional", False)
+                or getattr(item, "_f_nullable", False)
+                for variant in variants
+            )
+            for key in keys
+        )
+
+    def _accepts(self, cls: type) -> bool:
+        return any(variant._accepts(cls) for variant in self._m_variants)
+
+    def _state(self) -> Any:
+        # the variant accepts, what its variants accept; the state is only collected again, after
+        # any schema was modified, and kept if equal, so that the caches compare it by identity
+        if (memo := self._c_state)[0] != (latest := _LATEST[0]):
+            state = (self._c_version, *(variant._state() for variant in self._m_variants))
+            memo = self._c_state = (latest, memo[1] if state == memo[1] else state)
+
+        return memo[1]
+
+    def _select(self, obj: Any) -> Any:
+        """
+        Looks up the variant of an object by the value of the discriminator.
+
+        Args:
+            obj (Any): value to parse
+
+        Returns:
+            Any: the variant, or ``_Failure`` if no variant is selected
+        """
+        tags, key = self._tags(), self._m_discriminator
+
+        if not isinstance(obj, dict):
+            msg, variants = MSG_NO_VARIANT, self._m_variants
+            return _Failure(ValidationError(msg, variants, obj, code="no_variant", value=obj))
+
+        if (tag := obj.get(key, _NotFound)) is _NotFound:
+            return _Failure(
+                ValidationError(MSG_MISSING_TAG, key, code="missing_key", path=(key,))
+            )
+
+        try:
+            return tags[tag]
+
+        except (KeyError, TypeError):
+            return _Failure(
+                ValidationError(
+                    MSG_UNKNOWN_TAG,
+                    key,
+                    list(tags),
+                    tag,
+                    code="invalid_discriminator",
+                    value=tag,
+                    path=(key,),
+                )
+            )
+
+    def _tags(self) -> dict[Any, ParasiteType]:
+        """
+        Throws:
+            ValueError: if a variant has no literal discriminator, or two variants have the same
+
+        Returns:
+            dict[Any, ParasiteType]: the variants by the literal value of their discriminator (see
+            :func:`parasite.type.ParasiteType._tag`), in order
+        """
+        # rebuild the table, if the variants or their discriminators were modified since (frozen
+        # schemas cannot be)
+        if (tags := self._c_tags) is not None and (
+            self._f_frozen or tags[0] is self._item_state()
+        ):
+            return tags[1]
+
+        table = self._tag_table(self._m_discriminator, self._m_variants)
+        self._c_tags = (self._item_state(), table)
+        return table
+
+    @staticmethod
+    def _tag_table(key: Any, variants: Iterable[ParasiteType]) -> dict[Any, ParasiteType]:
+        """
+        Throws:
+            ValueError: if a variant has no literal discriminator, or two variants have the same
+
+        Args:
+            key (Any): key of the discriminator
+            variants (Iterable[ParasiteType]): variants of the discriminated union
+
+        Returns:
+            dict[Any, ParasiteType]: the variants by the literal value of their discriminator
+        """
+        # pylint: disable=import-outside-toplevel
+        from parasite.object import Object
+
+        table: dict[Any, ParasiteType] = {}
+
+        for variant in variants:
+            item = variant._m_items.get(key) if isinstance(variant, Object) else None
+
+            if item is None or (tag := item._tag()) is _NotFound:
+                raise ValueError(f"variant {variant!r} has no literal discriminator {key!r}")
+
+            if tag in table:
+                raise ValueError(f"discriminator {key!r} is {tag!r} in more than one variant")
+
+            table[tag] = variant
 
-            except ValidationError:
-                continue
+        return table
 
-        raise ValidationError(f"object has to be one of {self._m_variants!r}, but is {obj!r}")
+    def _item_state(self) -> Any:
+        """
+        Returns:
+            Any: state of the variants and the items of the object variants (see
+            :func:`parasite.type.ParasiteType._state`), that the literals and flags of the items,
+            which :func:`_tags` and :func:`_exclusive` depend on, are part of
+        """
+        # collected like :func:`_state`
+        if (memo := self._c_item_state)[0] != (latest := _LATEST[0]):
+            # pylint: disable=import-outside-toplevel
+            from parasite.object import Object
+
+            state = (
+                self._state(),
+                *(
+                    item._state()
+                    for variant in self._m_variants
+                    if isinstance(variant, Object)
+                    for item in variant._m_items.values()
+                ),
+            )
+            memo = self._c_item_state = (latest, memo[1] if state == memo[1] else state)
+
+        return memo[1]
+
+    def _dispatch(self, cls: type) -> tuple[ParasiteType, ...]:
+        """
+        Args:
+            cls (type): exact type of a value
 
-    def _find_and_parse(self, parent: dict[K, Any], key: K) -> Option[Any | None]:
+        Returns:
+            tuple[ParasiteType, ...]: the variants, that can accept values of the type (see
+            :func:`parasite.type.ParasiteType._accepts`), in order
+        """
+        # rebuild the table, if the variants were modified since (frozen schemas cannot be)
+        if (dispatch := self._c_dispatch) is None or (
+            not self._f_frozen and dispatch[0] is not self._state()
+        ):
+            dispatch = self._c_dispatch = (self._state(), {})
+
+        if (variants := dispatch[1].get(cls)) is None:
+            variants = tuple(variant for variant in self._m_variants if variant._accepts(cls))
+            dispatch[1][cls] = variants
+
+        return variants
+
+    def _find_and_parse_raw(self, parent: dict[K, Any], key: K) -> Any:
+        return self._unwrap(Variant._check_find(self, parent, key))
+
+    def _check_find(self, parent: dict[K, Any], key: K) -> Any:
         if (value := parent.get(key, _NotFound)) is not _NotFound:
-            # if key is found, just package ``parse(..)`` it into a Some
+            # if key is found, just ``_check(..)`` it
             if value is not None:
-                return Some(self.parse(value))
+                return self._check(value)
 
             # if value is None, check if the value is nullable
             if self._f_nullable:
-                return Some(None)
+                return None
 
-            raise ValidationError(f"key {key!r} is not nullable, but is None")
+            msg = "key {!r} is not nullable, but is None"
+            return _Failure(ValidationError(msg, key, code="not_nullable"))
 
-        # if key is not found, return Nil if optional, else raise an error
+        # if key is not found, return _NotFound if optional, else fail
         if self._f_optional:
-            return Nil
+            return _NotFound
+
+        msg = "key {!r} not found, but is required"
+        return _Failure(ValidationError(msg, key, code="missing_key"))
+
+    def _compile(self) -> Callable[[Any], Any]:
+        if self._m_discriminator is not None:
+            return self._compile_tagged()
+
+        variants = list(self._m_variants)
+        compiled = [variant._compile() for variant in variants]
+        branches = tuple(compiled[i] for i in self._arrange(None))
+
+        # the compiled schema is a snapshot, so only the common types are dispatched, ahead of time
+        dispatch = {cls: tuple(compiled[i] for i in self._arrange(cls)) for cls in DISPATCH}
+
+        def parse(obj: Any) -> Any:
+            for branch in dispatch.get(type(obj), branches):
+                try:
+                    return branch(obj)
+
+                except ValidationError:
+                    continue
+
+            raise ValidationError(MSG_NO_VARIANT, variants, obj, code="no_variant", value=obj)
+
+        return parse
+
+    def _compile_tagged(self) -> Callable[[Any], Any]:
+        """
+        Compiles a discriminated union. Equivalent to :func:`_select`.
+
+        Returns:
+            Callable[[Any], Any]: parsing function
+        """
+        variants, key = list(self._m_variants), self._m_discriminator
+        branches = {tag: variant._compile() for tag, variant in self._tags().items()}
+        tags = list(branches)
+
+        def parse(obj: Any) -> Any:
+            if not isinstance(obj, dict):
+                raise ValidationError(MSG_NO_VARIANT, variants, obj, code="no_variant", value=obj)
 
-        raise ValidationError(f"key {key!r} not found, but is required")
+            if (tag := obj.get(key, _NotFound)) is _NotFound:
+                raise ValidationError(MSG_MISSING_TAG, key, code="missing_key", path=(key,))
+
+            try:
+                branch = branches[tag]
+
+            except (KeyError, TypeError):
+                raise ValidationError(
+                    MSG_UNKNOWN_TAG,
+                    key,
+                    tags,
+                    tag,
+                    code="invalid_discriminator",
+                    value=tag,
+                    path=(key,),
+                ) from None
+
+            return branch(obj)
+
+        return parse
+
+    def _compile_find(self) -> Callable[[dict[Any, Any], Any], Any]:
+        return self._make_find(self._compile(), self._f_optional, self._f_nullable)
+
+    def _codegen(self, gen: _CodeGen) -> str:
+        if self._m_discriminator is not None:
+            return self._codegen_tagged(gen)
+
+        names = [variant._codegen(gen) for variant in self._m_variants]
+
+        def attempts(indices: list[int]) -> list[str]:
+            lines: list[str] = []
+
+            for i in indices:
+                lines += [
+                    "try:",
+                    f"    return {names[i]}(obj)",
+                    "except ValidationError:",
+                    "    pass",
+                ]
+
+            return lines or ["pass"]
+
+        # dispatch the common types to the variants, that can accept them
+        lines: list[str] = []
+        every = list(self._arrange(None))
+
+        for cls in DISPATCH:
+            indices = list(self._arrange(cls))
+
+            if indices != every:
+                name = "type(None)" if cls is type(None) else cls.__name__
+                lines.append(f"{'elif' if lines else 'if'} cls is {name}:")
+                lines += gen.indent(attempts(indices))
+
+        if lines:
+            lines = ["cls = type(obj)", *lines, "else:", *gen.indent(attempts(every))]
+
+        else:
+            lines = attempts(every) if every else []
+
+        msg = f"object has to be one of {self._m_variants!r}, but is "
+        error = gen.error("no_variant", msg, ("obj", "r"), value="obj")
+        return gen.function("variant", [*lines, f"raise {error}"])
+
+    def _codegen_tagged(self, gen: _CodeGen) -> str:
+        """
+        Generates the python source for a discriminated union. Equivalent to :func:`_select`. The
+        table of the variants is bound as a default argument of the generated function.
+
+        Args:
+            gen (_CodeGen): code generator
+
+        Returns:
+            str: name of the generated function
+        """
+        key = self._m_discriminator
+        names = {tag: variant._codegen(gen) for tag, variant in self._tags().items()}
+        table = ", ".join(f"{gen.literal(tag)}: {name}" for tag, name in names.items())
+        path = f"({gen.literal(key)},)"
+
+        msg = f"object has to be one of {self._m_variants!r}, but is "
+        error_type = gen.error("no_variant", msg, ("obj", "r"), value="obj")
+        msg = f"key {key!r} not found, but is required"
+        error_missing = gen.error("missing_key", msg, path=path)
+        msg = f"value of key {key!r} has to be one of {list(names)!r}, but is "
+        error_tag = gen.error("invalid_discriminator", msg, ("tag", "r"), value="tag", path=path)
+
+        return gen.function(
+            "variant",
+            [
+                "if not isinstance(obj, dict):",
+                f"    raise {error_type}",
+                f"tag = obj.get({gen.literal(key)}, _NotFound)",
+                "if tag is _NotFound:",
+                f"    raise {error_missing}",
+                "try:",
+                "    branch = tags[tag]",
+                "except (KeyError, TypeError):",
+                f"    raise {error_tag} from None",
+                "return branch(obj)",
+            ],
+            args=f"obj, tags={{{table}}}",
+        )
+
+    def _codegen_find(self, gen: _CodeGen, key: Any) -> list[str]:
+        return emit_find(gen, self._codegen(gen), key, self._f_optional, self._f_nullable)
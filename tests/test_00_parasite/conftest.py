@@ -0,0 +1,66 @@
+import copy
+from typing import Any, Callable
+
+import pytest
+from parasite import p
+from parasite.object import Object
+from parasite.type import ParasiteType
+
+BACKENDS: list[str] = ["interpreted", "closure", "codegen"]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request: pytest.FixtureRequest) -> str:
+    # tests, that only cover some backends, parametrize ``backend`` themselves
+    return request.param
+
+
+@pytest.fixture
+def compile_schema(backend: str) -> Callable[[ParasiteType], Any]:
+    def compile_schema(schema: ParasiteType) -> Any:
+        # the schema and the compiled schema share ``parse``, ``parse_safe`` and ``parse_many``
+        return schema if backend == "interpreted" else schema.compile(backend)
+
+    return compile_schema
+
+
+@pytest.fixture
+def assert_equivalent(
+    compile_schema: Callable[[ParasiteType], Any],
+) -> Callable[..., None]:
+    def assert_equivalent(schema: ParasiteType, value: Any, compiled: Any = None) -> None:
+        compiled = compile_schema(schema) if compiled is None else compiled
+        expected = schema.parse_safe(copy.deepcopy(value))
+        actual = compiled.parse_safe(copy.deepcopy(value))
+
+        assert expected.is_ok() == actual.is_ok()
+
+        if expected.is_ok():
+            assert repr(expected.unwrap()) == repr(actual.unwrap())
+        else:
+            error, other = expected.unwrap_err(), actual.unwrap_err()
+            assert str(error) == str(other)
+            assert (error.code, error.path, repr(error.value)) == (
+                other.code,
+                other.path,
+                repr(other.value),
+            )
+
+    return assert_equivalent
+
+
+@pytest.fixture
+def person() -> Callable[[], Object]:
+    def person() -> Object:
+        return p.obj(
+            {
+                "name": p.string().trim().min(1),
+                "age": p.number().integer().gte(0).optional(),
+                "tags": p.array(p.string().trim().to_lower()).max(2).optional(),
+                "sub": p.obj({"id": p.number(), "flag": p.boolean().leaniant().nullable()})
+                .strict()
+                .optional(),
+            }
+        )
+
+    return person
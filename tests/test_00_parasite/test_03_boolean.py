@@ -1,6 +1,7 @@
 from rusttypes.option import Nil, Some
 from rusttypes.result import Ok
 from parasite import p
+from parasite.boolean import _tokens
 
 
 def test_boolean_default() -> None:
@@ -78,3 +79,28 @@ def test_boolean_literal() -> None:
 
     assert p.boolean().literal(False).parse_safe(False) == Ok(False)
     assert p.boolean().literal(False).parse_safe(True).is_err()
+
+
+def test_boolean_leaniant_words() -> None:
+    assert _tokens(r"^(true|1|yes|y)$") == ["true", "1", "yes", "y"]
+    assert _tokens(r"^no$") == ["no"]
+    assert _tokens(r"^t.*$") == []
+
+    # words of the false pattern, that the true pattern matches, are true
+    s1 = p.boolean().leaniant(r"^y.*$", r"^(yes|no)$")
+    assert s1._c_leaniant[3] == {"no": False}
+    assert s1.parse_safe("YES") == Ok(True)
+    assert s1.parse_safe("no") == Ok(False)
+
+    # values, that are not a word, are still matched as regex
+    assert p.boolean().leaniant().parse_safe("True\n") == Ok(True)
+
+    # the words are collected again, if the patterns change
+    s2 = p.boolean().leaniant()
+    assert s2.parse_safe("si").is_err()
+    assert s2.leaniant(r"^(si)$").parse_safe("si") == Ok(True)
+
+    # assigning the patterns directly compiles them as well
+    s2._m_leaniant = (r"^on$", r"^off$")
+    assert s2.parse_safe("on") == Ok(True)
+    assert s2.compile("codegen").parse("off") is False
@@ -131,3 +131,19 @@ def test_number_max() -> None:
     assert p.number().max(1).parse_safe(0) == Ok(0)
     assert p.number().max(1).parse_safe(1) == Ok(1)
     assert p.number().max(1).parse_safe(2).is_err()
+
+
+def test_number_resolved_bounds() -> None:
+    s1 = p.number().gt(0.5).lte(10.5)
+    assert s1._c_bounds[0] == ((">", 10.5), ("<=", 0.5))
+    assert s1.parse_safe(10.5) == Ok(10.5)
+
+    # bounds are resolved without modifying the schema, and again once they change
+    s1.integer()
+    assert s1.parse_safe(10).is_ok()
+    assert s1.parse_safe(0).is_err()
+    assert (s1._m_ll, s1._m_ul) == (0.5, 10.5)
+
+    s1.lt(5)
+    assert s1.parse_safe(5).is_err()
+    assert s1.freeze().parse_safe(4) == Ok(4)
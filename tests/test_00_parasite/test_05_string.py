@@ -1,4 +1,5 @@
 import re
+import pytest
 from rusttypes.option import Nil, Some
 from rusttypes.result import Ok
 from parasite import p
@@ -203,3 +204,108 @@ def test_string_regex() -> None:
 def test_string_match() -> None:
     assert p.string().match(r"^[0-9]+$").parse_safe("123456") == Ok("123456")
     assert p.string().match(r"^[0-9]+$").parse_safe("hello").is_err()
+
+
+def test_string_literal() -> None:
+    assert p.string().literal("hello").parse_safe("hello") == Ok("hello")
+    assert p.string().literal("hello").parse_safe("Hello").is_err()
+    assert p.string().literal("hello").to_lower().parse_safe("Hello").is_err()
+
+    s1 = p.string().literal("hello").to_lower().transform_before_parse()
+    assert s1.parse_safe("Hello") == Ok("hello")
+
+
+def test_string_email_quiet(capsys: pytest.CaptureFixture[str]) -> None:
+    for backend in ["closure", "codegen"]:
+        assert p.string().email().compile(backend).parse_safe("john@example.com").is_ok()
+
+    assert p.string().email().parse_safe("john@example.com").is_ok()
+    assert capsys.readouterr() == ("", "")
+
+
+def test_string_pipeline() -> None:
+    s1 = p.string()
+    assert s1.parse_safe("hello") == Ok("hello")
+    assert s1._c_pipeline is None
+
+    # the pipeline is rebuilt, once the schema changes
+    s1.min(3).to_upper()
+    assert s1.parse_safe("hello") == Ok("HELLO")
+    assert s1.parse_safe("hi").is_err()
+
+    s1.transform_before_parse().trim().starts_with("HE").contains("@")
+    assert s1.parse_safe("  hello@example.com ") == Ok("HELLO@EXAMPLE.COM")
+    assert s1.parse_safe("  hello ").is_err()
+    assert s1.freeze().parse_safe(" hi ").is_err()
+
+
+def test_string_cached() -> None:
+    s1 = p.string().email().cached(2)
+    assert s1.cache_info() == (0, 0, 2, 0)
+    assert p.string().email().cache_info() is None
+
+    for value in ["a@b.co", "a@b.co", "x.y.z", "a@b.co", "c@d.co", "x.y.z"]:
+        assert s1.parse_safe(value).is_ok() == ("@" in value)
+
+    # "x.y.z" was evicted by "c@d.co", as "a@b.co" was used more recently
+    assert s1.cache_info() == (2, 4, 2, 2)
+
+    # results of other formats are not mixed up with cached ones
+    s1.uuid()
+    assert s1.parse_safe("a@b.co" * 6).is_err()
+    assert s1.cache_info() == (0, 1, 2, 1)
+
+    s2 = p.string().to_upper().transform_before_parse().match(r"^[A-Z]+$").cached()
+    assert s2.parse_safe("abc") == Ok("ABC")
+    assert s2.compile("codegen").parse_safe("abc") == Ok("ABC")
+    assert s2.compile("closure").parse_safe("ab1").is_err()
+    assert s2.cache_info() == (1, 2, 4096, 2)
+
+    with pytest.raises(ValueError):
+        p.string().cached(0)
+
+
+def test_string_one_of_formats() -> None:
+    s1 = p.string().one_of_formats(["uuid", "ulid", "cuid2"])
+    assert s1.parse_safe("01ARZ3NDEKTSV4RRFFQ69G5FAV") == Ok("01ARZ3NDEKTSV4RRFFQ69G5FAV")
+    assert s1.parse_safe("abc1") == Ok("abc1")
+    assert str(s1.parse_safe("Hello").unwrap_err()) == (
+        "value 'Hello' is not a valid UUID or ULID or CUID2"
+    )
+
+    assert s1.classify("123e4567-e89b-42d3-a456-426614174000") == "uuid"
+    assert s1.classify("01ARZ3NDEKTSV4RRFFQ69G5FAV") == "ulid"
+    assert s1.classify("abc1") == "cuid2"
+    assert s1.classify("Hello") is None
+
+    assert p.string().ipv4().classify("1.2.3.4") == "ipv4"
+    assert p.string().ipv4().classify("hello") is None
+    assert p.string().classify("hello") is None
+
+    with pytest.raises(ValueError):
+        p.string().one_of_formats([])
+
+    with pytest.raises(ValueError):
+        p.string().one_of_formats(["uuid", "isbn"])
+
+
+def test_string_format_limit() -> None:
+    uuid = "123e4567-e89b-42d3-a456-426614174000"
+    assert p.string().uuid().parse_safe(uuid + "\n").is_ok()
+    assert p.string().uuid().parse_safe(uuid + "0").is_err()
+    assert p.string().uuid().parse_safe(uuid * 1_000).unwrap_err().code == "invalid_string"
+
+    url = "https://example.com/" + "a" * 10_000
+    assert p.string().url().parse_safe(url).is_err()
+    assert p.string().url().format_limit(20_000).parse_safe(url) == Ok(url)
+    assert p.string().url().format_limit(20).parse_safe("https://example.com/a").is_err()
+    assert p.string().url().format_limit(20).classify("https://example.com/a") is None
+
+    assert p.string().cuid2().parse_safe("a" * 10_000).is_ok()
+    assert p.string().cuid2().format_limit(32).parse_safe("a" * 33).is_err()
+    assert p.string().match(r"^[a-z]+$").format_limit(3).parse_safe("abcd").is_err()
+
+    s1 = p.string().one_of_formats(["ipv4", "ulid"])
+    assert s1.parse_safe("1.2.3.4").is_ok()
+    assert s1.parse_safe("1" * 28).is_err()
+    assert s1.classify("01ARZ3NDEKTSV4RRFFQ69G5FAV\n") == "ulid"
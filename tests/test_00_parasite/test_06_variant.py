@@ -1,6 +1,8 @@
+import pytest
 from rusttypes.option import Nil, Some
 from rusttypes.result import Ok
 from parasite import p
+from parasite.variant import ADAPT_INTERVAL, Variant
 
 
 def test_variant_default() -> None:
@@ -88,3 +90,191 @@ def test_variant_rm_variant_safe() -> None:
 
     assert v.rm_variant_safe(p.number()).unwrap().parse_safe("hello") == Ok("hello")
     assert v.rm_variant_safe(p.any()).is_err()
+
+
+def test_variant_dispatch() -> None:
+    n, b, s = p.number(), p.boolean(), p.string()
+    v = p.variant([n, b, s, p.array(p.number()), p.obj()])
+
+    assert v._dispatch(str) == (s,)
+    assert v._dispatch(bool) == (b,)
+    assert v._dispatch(int) == (n,)
+    assert v._dispatch(type(None)) == ()
+
+    # the dispatch table is rebuilt, when a variant is modified
+    b.leaniant()
+    assert v._dispatch(str) == (b, s)
+    assert v.parse("yes") is True
+
+    v.add_variant(p.null())
+    assert len(v._dispatch(type(None))) == 1
+    assert v.parse(None) is None
+
+    # modifications of other schemas keep the table
+    table = v._c_dispatch
+    p.string().min(1)
+    assert v._dispatch(str) == (b, s) and v._c_dispatch is table
+
+    # variants of nested variants are part of the state as well
+    inner = p.boolean()
+    outer = p.variant([p.variant([inner]), p.string()])
+    assert outer.parse("yes") == "yes"
+
+    inner.leaniant()
+    assert outer.parse("yes") is True
+
+    # the state is only collected again after a modification, and kept by identity while equal
+    state = outer._state()
+    assert outer._state() is state
+    p.string().min(1)
+    assert outer._state() is state
+    inner.literal(True)
+    assert outer._state() is not state
+
+
+def test_variant_dispatch_custom() -> None:
+    class Upper(p.any().__class__):  # type: ignore[misc]
+        def parse(self, obj, *, collect_errors=False):  # type: ignore[no-untyped-def]
+            return str(obj).upper()
+
+    v = p.variant([p.number(), Upper()])
+
+    assert v.parse(1) == 1
+    assert v.parse("a") == "A"
+
+
+def test_variant_discriminator() -> None:
+    click = p.obj({"type": p.string().literal("click"), "x": p.number()})
+    key = p.obj({"type": p.string().literal("key"), "code": p.string()})
+    v = p.variant([click, key]).discriminator("type")
+
+    assert v.parse_safe({"type": "key", "code": "a"}) == Ok({"type": "key", "code": "a"})
+    assert v.parse_safe({"type": "click", "x": 1}) == Ok({"type": "click", "x": 1})
+
+    # the error of the selected variant is reported
+    error = v.parse_safe({"type": "key", "x": 1}).unwrap_err()
+    assert (error.code, error.path) == ("missing_key", ("code",))
+
+    error = v.parse_safe({"type": "scroll"}).unwrap_err()
+    assert (error.code, error.path, error.value) == ("invalid_discriminator", ("type",), "scroll")
+
+    error = v.parse_safe({"x": 1}).unwrap_err()
+    assert (error.code, error.path) == ("missing_key", ("type",))
+
+    assert v.parse_safe({"type": ["key"]}).unwrap_err().code == "invalid_discriminator"
+    assert v.parse_safe("key").unwrap_err().code == "no_variant"
+
+    # the table is rebuilt, when a literal is modified
+    key._m_items["type"].literal("press")
+    assert v.parse_safe({"type": "press", "code": "a"}).is_ok()
+    assert v.parse_safe({"type": "key", "code": "a"}).is_err()
+
+
+def test_variant_discriminator_invalid() -> None:
+    with pytest.raises(ValueError, match="no literal discriminator"):
+        p.variant([p.obj({"type": p.string()})]).discriminator("type")
+
+    with pytest.raises(ValueError, match="no literal discriminator"):
+        p.variant([p.string()]).discriminator("type")
+
+    with pytest.raises(ValueError, match="no literal discriminator"):
+        p.variant([p.obj({"type": p.boolean().literal(True).leaniant()})]).discriminator("type")
+
+    with pytest.raises(ValueError, match="more than one variant"):
+        p.variant(
+            [p.obj({"type": p.string().literal("a")}), p.obj({"type": p.string().literal("a")})]
+        ).discriminator("type")
+
+
+def test_variant_discriminator_invalid_unchanged() -> None:
+    a, x = p.obj({"t": p.string().literal("a")}), p.obj({"x": p.number()})
+
+    # an invalid discriminator leaves the variant unchanged
+    v = p.variant([a, x])
+    with pytest.raises(ValueError, match="no literal discriminator"):
+        v.discriminator("t")
+
+    assert v._m_discriminator is None
+    assert v.parse_safe({"t": "a"}).unwrap() == {"t": "a"}
+
+    # an invalid variant is not added to a discriminated union
+    v = p.variant([a]).discriminator("t")
+    with pytest.raises(ValueError, match="no literal discriminator"):
+        v.add_variant(x)
+
+    assert v._m_variants == [a]
+    assert v.parse_safe({"t": "a"}).unwrap() == {"t": "a"}
+    assert v.parse_safe({"x": 1}).unwrap_err().code == "missing_key"
+
+
+def test_variant_adaptive() -> None:
+    ids = p.obj({"type": p.string().literal("id"), "id": p.number()})
+    names = p.obj({"type": p.string().literal("name"), "name": p.string()})
+    v = p.variant([ids, names]).adaptive()
+
+    for _ in range(ADAPT_INTERVAL):
+        assert v.parse({"type": "name", "name": "John"}) == {"type": "name", "name": "John"}
+
+    assert v._order() == [names, ids]
+    assert v.parse({"type": "id", "id": 1}) == {"type": "id", "id": 1}
+    assert v.compile("codegen").parse({"type": "id", "id": 1}) == {"type": "id", "id": 1}
+    assert v.parse_safe(1).unwrap_err().code == "no_variant"
+
+    # the learned order is dropped, once the literals no longer make the variants exclusive
+    names._m_items["type"].literal("id")
+    assert v.parse({"type": "id", "id": 1}) == {"type": "id", "id": 1}
+    assert v._adaptive().tables[dict] == (0, 1) and v._order() == [ids, names]
+    names._m_items["type"].literal("name")
+    assert v._order() == [names, ids]
+
+    # the state is reset, when the variants are replaced
+    v.add_variant(p.string())
+    assert v._order() == [ids, names, v._m_variants[2]]
+
+
+def test_variant_adaptive_overlap() -> None:
+    ids, names = p.obj({"id": p.number()}), p.obj({"name": p.string()})
+
+    # overlapping variants keep the declared order, unless they are declared to be exclusive
+    for exclusive, order in [(False, [ids, names]), (True, [names, ids])]:
+        v = p.variant([ids, names]).adaptive(exclusive)
+        assert v.parse({"id": 1, "name": "John"}) == {"id": 1, "name": "John"}
+
+        for _ in range(ADAPT_INTERVAL):
+            v.parse({"name": "John"})
+
+        assert v._order() == order
+
+    # the result does not depend on the traffic, even if the overlap was never seen
+    v = p.variant([p.string().min(3).to_upper(), p.string()]).adaptive()
+
+    for _ in range(ADAPT_INTERVAL):
+        assert v.parse("ab") == "ab"
+
+    for backend in ["closure", "codegen"]:
+        assert v.compile(backend).parse("abc") == "ABC"
+
+    assert v.parse("abc") == "ABC"
+
+    # optional literals do not make objects exclusive, as both accept a missing key
+    a = p.obj({"type": p.string().literal("a").optional()})
+    b = p.obj({"type": p.string().literal("b").optional(), "x": p.number().optional()})
+    assert not Variant._exclusive([a, b])
+    a._m_items["type"].required()
+    assert not Variant._exclusive([a, b])
+    b._m_items["type"].required()
+    assert Variant._exclusive([a, b])
+
+
+def test_variant_adaptive_types() -> None:
+    # variants of different types are reordered per type, literals among each other
+    a, b, number = p.string().literal("a"), p.string().literal("b"), p.number()
+    v = p.variant([a, b, number]).adaptive()
+
+    for _ in range(ADAPT_INTERVAL):
+        assert v.parse("b") == "b"
+
+    assert v._arrange(str) == (1, 0)
+    assert v._arrange(int) == (2,)
+    assert v.compile("codegen").parse("a") == "a"
+    assert v.compile("closure").parse(1) == 1
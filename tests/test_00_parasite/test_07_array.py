@@ -1,6 +1,11 @@
+from typing import Any, Callable
+
+import pytest
 from rusttypes.option import Nil, Some
 from rusttypes.result import Ok
 from parasite import p
+from parasite.errors import ValidationError
+from parasite.type import ParasiteType
 
 
 def test_array_default() -> None:
@@ -125,3 +130,137 @@ def test_array_element() -> None:
     assert a.parse_safe([(), set()]).is_err()
     assert a.parse_safe([set(), frozenset()]).is_err()
     assert a.parse_safe([object(), object()]).is_err()
+
+
+def test_array_identity(compile_schema: Callable[[ParasiteType], Any]) -> None:
+    def parser(schema):
+        return compile_schema(schema).parse
+
+    data = [1, 2.5, 3]
+    assert parser(p.array(p.number()))(data) is data
+
+    data = ["a", " b ", "c"]
+    parsed = parser(p.array(p.string().trim()))(data)
+
+    assert parsed is not data
+    assert parsed == ["a", "b", "c"]
+    assert data == ["a", " b ", "c"]
+    assert parsed[0] is data[0]
+
+    data = ["yes", "no"]
+    parsed = parser(p.array(p.boolean().leaniant()))(data)
+
+    assert parsed == [True, False]
+    assert data == ["yes", "no"]
+
+    with pytest.raises(ValidationError) as excinfo:
+        parser(p.array(p.string().trim()))(["a", " b ", 1])
+
+    assert "element at index 2 is invalid" in str(excinfo.value)
+
+
+def _columnar_equivalent(schema, rows) -> None:
+    import copy
+
+    expected = schema.parse_safe(copy.deepcopy(rows))
+
+    if expected.is_ok():
+        assert schema.parse_columnar(copy.deepcopy(rows)) == expected.unwrap()
+        return
+
+    with pytest.raises(ValidationError) as excinfo:
+        schema.parse_columnar(copy.deepcopy(rows))
+
+    assert str(excinfo.value) == str(expected.unwrap_err())
+
+
+def test_array_columnar() -> None:
+    schema = p.array(
+        p.obj(
+            {
+                "id": p.number().integer().gte(0).lt(100),
+                "score": p.number().gt(0.5).optional(),
+                "name": p.string().min(1).max(8).starts_with("J"),
+                "tag": p.string().trim().to_lower().nullable(),
+                "sub": p.obj({"x": p.boolean()}).optional(),
+            }
+        )
+    )
+
+    rows = [
+        {"id": i, "score": i + 1.5, "name": f"J{i}", "tag": " A ", "sub": {"x": True}}
+        for i in range(10)
+    ]
+
+    _columnar_equivalent(schema, rows)
+    _columnar_equivalent(schema, [])
+
+    for row, key, value in [
+        (3, "id", -1),
+        (3, "id", 1.5),
+        (3, "id", True),
+        (4, "score", float("nan")),
+        (4, "score", 0.1),
+        (5, "name", ""),
+        (5, "name", "Max"),
+        (5, "name", 1),
+        (6, "tag", None),
+        (6, "tag", 1),
+        (7, "sub", {"x": 1}),
+    ]:
+        _columnar_equivalent(schema, [*rows[:row], {**rows[row], key: value}, *rows[row + 1 :]])
+
+    # the error of the first invalid row (and first invalid key in it) is raised
+    broken = [dict(row) for row in rows]
+    broken[2]["name"], broken[5]["id"], broken[2]["tag"] = "", -1, 1
+    _columnar_equivalent(schema, broken)
+
+    broken = [dict(row) for row in rows]
+    broken[7]["id"], broken[4] = -1, None
+    _columnar_equivalent(schema, broken)
+
+    broken = [dict(row) for row in rows]
+    del broken[6]["name"]
+    del broken[8]["score"]
+    _columnar_equivalent(schema, broken)
+
+
+def test_array_columnar_strict() -> None:
+    rows = [{"id": 1}, {"id": 2, "extra": 1}, {"id": -1}]
+
+    _columnar_equivalent(p.array(p.obj({"id": p.number()}).strict()), rows)
+    _columnar_equivalent(p.array(p.obj({"id": p.number().gte(0)}).strict()), rows)
+    _columnar_equivalent(p.array(p.obj({"id": p.number()}).strip()), rows)
+
+
+def test_array_columnar_modes() -> None:
+    schema = p.array(p.obj({"name": p.string().trim(), "id": p.number()}))
+
+    rows = [{"name": "a", "id": 1}, {"name": " b ", "id": 2}]
+    parsed = schema.parse_columnar(rows)
+
+    assert parsed is rows
+    assert rows == [{"name": "a", "id": 1}, {"name": "b", "id": 2}]
+
+    schema._m_element.parse_mode("copy_on_write")
+    rows = [{"name": "a", "id": 1}, {"name": " b ", "id": 2}]
+    parsed = schema.parse_columnar(rows)
+
+    assert parsed is not rows and parsed[0] is rows[0] and parsed[1] is not rows[1]
+    assert parsed == [{"name": "a", "id": 1}, {"name": "b", "id": 2}]
+    assert rows == [{"name": "a", "id": 1}, {"name": " b ", "id": 2}]
+
+    rows = [{"name": "a", "id": 1}, {"name": " b ", "id": "2"}]
+
+    with pytest.raises(ValidationError):
+        schema.parse_columnar(rows)
+
+    assert rows == [{"name": "a", "id": 1}, {"name": " b ", "id": "2"}]
+
+
+def test_array_columnar_element() -> None:
+    with pytest.raises(TypeError):
+        p.array(p.number()).parse_columnar([1, 2])
+
+    with pytest.raises(TypeError):
+        p.array().parse_columnar([])
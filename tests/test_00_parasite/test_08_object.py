@@ -1,8 +1,12 @@
+from dataclasses import FrozenInstanceError
+from typing import Any, Callable
+
 import pytest
 from rusttypes.option import Nil, Some
 from rusttypes.result import Ok
 from parasite import p
 from parasite.errors import ValidationError
+from parasite.type import ParasiteType
 
 
 def test_object_default() -> None:
@@ -184,3 +188,102 @@ def test_object_add_item() -> None:
     assert p.obj({"key": p.string()}).add_item("key2", p.string()) == p.obj(
         {"key": p.string(), "key2": p.string()}
     )
+
+
+def test_object_parse_mode(compile_schema: Callable[[ParasiteType], Any]) -> None:
+    def parser(mode: str):
+        schema = p.obj(
+            {
+                "name": p.string().trim(),
+                "age": p.number().optional(),
+                "sub": p.obj({"id": p.string().trim()}).optional(),
+            }
+        ).parse_mode(mode)
+
+        return compile_schema(schema).parse
+
+    # in place: the passed dictionaries are modified and returned
+    data = {"name": " John ", "sub": {"id": " 1 "}}
+    parsed = parser("in_place")(data)
+
+    assert parsed is data
+    assert data == {"name": "John", "sub": {"id": "1"}}
+
+    # copy: the passed dictionaries are never modified
+    data = {"name": " John ", "sub": {"id": "1"}}
+    parsed = parser("copy")(data)
+
+    assert parsed is not data and parsed["sub"] is not data["sub"]
+    assert parsed == {"name": "John", "sub": {"id": "1"}}
+    assert data == {"name": " John ", "sub": {"id": "1"}}
+
+    # copy on write: the passed dictionaries are only copied if a value changes
+    data = {"name": "John", "age": 1, "sub": {"id": "1"}}
+
+    assert parser("copy_on_write")(data) is data
+
+    data = {"name": "John", "age": 1, "sub": {"id": " 1 "}}
+    parsed = parser("copy_on_write")(data)
+
+    assert parsed is not data and parsed["sub"] is not data["sub"]
+    assert parsed == {"name": "John", "age": 1, "sub": {"id": "1"}}
+    assert data == {"name": "John", "age": 1, "sub": {"id": " 1 "}}
+
+    data = {"name": " John ", "sub": {"id": "1"}}
+    parsed = parser("copy_on_write")(data)
+
+    assert parsed is not data and parsed["sub"] is data["sub"]
+    assert data == {"name": " John ", "sub": {"id": "1"}}
+
+
+def test_object_parse_mode_nested() -> None:
+    schema = p.obj(
+        {
+            "items": p.array(p.obj({"id": p.number()})),
+            "sub": p.variant([p.obj({"id": p.number()})]),
+        }
+    ).parse_mode("copy")
+
+    assert schema._m_parse_mode == schema._m_items["items"]._m_element._m_parse_mode
+    assert schema._m_parse_mode == schema._m_items["sub"]._m_variants[0]._m_parse_mode
+
+    data = {"items": [{"id": 1}], "sub": {"id": 2}}
+    parsed = schema.parse(data)
+
+    assert parsed == data
+    assert parsed["items"][0] is not data["items"][0]
+    assert parsed["sub"] is not data["sub"]
+
+
+def test_object_parse_mode_shared() -> None:
+    shared = p.obj({"id": p.number()})
+    frozen = p.obj({"id": p.number()}).freeze()
+    other = p.obj({"sub": shared})
+
+    schema = p.obj({"sub": shared, "items": p.array(frozen).optional()}).parse_mode("copy")
+
+    # nested schemas are copied, instead of modified in place
+    assert schema._m_items["sub"]._m_parse_mode == schema._m_parse_mode
+    assert schema._m_items["items"]._m_element._m_parse_mode == schema._m_parse_mode
+    assert schema._m_items["items"]._m_element.frozen
+    assert shared._m_parse_mode == other._m_parse_mode == frozen._m_parse_mode
+
+    data = {"sub": {"id": 1}}
+    assert other.parse(data)["sub"] is data["sub"]
+    assert schema.parse(data)["sub"] is not data["sub"]
+
+    with pytest.raises(FrozenInstanceError):
+        frozen.parse_mode("copy")
+
+
+def test_object_parse_mode_strip() -> None:
+    data = {"name": "John", "extra": 1}
+    parsed = p.obj({"name": p.string()}).strip().parse_mode("copy_on_write").parse(data)
+
+    assert parsed == {"name": "John"}
+    assert data == {"name": "John", "extra": 1}
+
+
+def test_object_parse_mode_unknown() -> None:
+    with pytest.raises(ValueError):
+        p.obj().parse_mode("unknown")
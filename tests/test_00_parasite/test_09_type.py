@@ -1,3 +1,5 @@
+from typing import Any, Callable
+
 from parasite import p, Namespace
 import pytest
 
@@ -12,3 +14,151 @@ def test_namespace():
         p()
 
     assert "cannot instantiate a namespace" in str(excinfo.value)
+
+
+def test_find_and_parse_raw():
+    from rusttypes.option import Nil, Some
+    from parasite.type import _NotFound
+
+    schemas = [
+        p.any(),
+        p.never(),
+        p.null(),
+        p.boolean(),
+        p.number(),
+        p.string(),
+        p.array(),
+        p.obj(),
+        p.variant([p.string()]),
+    ]
+
+    for schema in schemas:
+        if hasattr(schema, "optional"):
+            schema.optional()
+
+        assert schema._find_and_parse_raw({}, "key") is _NotFound
+        assert schema._find_and_parse({}, "key") == Nil
+
+    assert p.string()._find_and_parse_raw({"key": "value"}, "key") == "value"
+    assert p.string()._find_and_parse({"key": "value"}, "key") == Some("value")
+    assert p.string().nullable()._find_and_parse_raw({"key": None}, "key") is None
+    assert p.string().nullable()._find_and_parse({"key": None}, "key") == Some(None)
+
+
+def test_check():
+    from parasite.errors import ValidationError
+    from parasite.type import _Failure
+
+    schemas = [
+        p.never(),
+        p.null(),
+        p.boolean().leaniant().literal(True),
+        p.number().integer().gt(0).lt(10),
+        p.string().min(2).starts_with("a").email(),
+        p.array(p.number()).max(2),
+        p.obj({"name": p.string(), "sub": p.obj({"id": p.number()})}).strict(),
+        p.variant([p.number(), p.string().uuid()]),
+    ]
+    values = [None, True, "no", 0, 5, 4.5, "a", "ab", [1, "2"], [1, 2, 3], {}, {"x": 1}]
+    values += [{"name": "a", "sub": {"id": "1"}}, {"name": "a", "sub": {"id": 1}}]
+
+    for schema in schemas:
+        for value in values:
+            result = schema._check(value)
+
+            try:
+                assert schema.parse(value) == result
+
+            except ValidationError as exc:
+                assert type(result) is _Failure
+                assert (str(result.error), result.error.path) == (str(exc), exc.path)
+
+    # every schema, except for ``p.never()``, requires the key
+    assert all(type(schema._check_find({}, "key")) is _Failure for schema in schemas[1:])
+
+
+def test_check_custom():
+    from typing import Any
+
+    from parasite.any import Any_
+    from parasite.errors import ValidationError
+
+    class Even(Any_):
+        def parse(self, obj: Any, collect_errors: bool = False, max_errors: Any = None) -> Any:
+            if obj % 2:
+                raise ValidationError("odd")
+
+            return obj
+
+    schema = p.variant([Even(), p.string()])
+
+    assert schema.parse(2) == 2
+    assert schema.parse_safe(3).is_err()
+    assert p.obj({"key": Even()}).parse_safe({"key": 3}).unwrap_err().path == ("key",)
+
+
+def test_custom_subclass(compile_schema: Callable[[Any], Any]) -> None:
+    from rusttypes.option import Nil, Option, Some
+
+    from parasite.errors import ValidationError
+    from parasite.type import ParasiteType
+
+    # a subclass, that only implements the public interface of the baseline
+    class Even(ParasiteType[int]):
+        def parse(self, obj: Any) -> int:
+            if not isinstance(obj, int) or obj % 2:
+                raise ValidationError(f"{obj!r} is not even")
+
+            return obj
+
+        def _find_and_parse(self, parent: dict[Any, Any], key: Any) -> Option[int | None]:
+            if key not in parent:
+                return Nil
+
+            return Some(self.parse(parent[key]))
+
+    schema = compile_schema(p.obj({"even": Even(), "list": p.array(Even()).optional()}))
+
+    assert schema.parse({"even": 2}) == {"even": 2}
+    assert schema.parse({"even": 2, "list": [0, 4]}) == {"even": 2, "list": [0, 4]}
+    assert schema.parse({}) == {}
+    assert schema.parse_safe({"even": 3}).is_err()
+    assert schema.parse_safe({"even": 2, "list": [1]}).is_err()
+
+
+def test_custom_subclass_overrides() -> None:
+    from typing import Any
+
+    from rusttypes.option import Option, Some
+
+    from parasite.string import String
+    from parasite.type import ParasiteType
+
+    # overrides of the public methods are not bypassed by the internal ones of the parent class
+    class Upper(String):
+        def parse(self, obj: Any) -> str:
+            return super().parse(obj).upper()
+
+    class Default(String):
+        def _find_and_parse(self, parent: dict[Any, Any], key: Any) -> Option[str | None]:
+            if key not in parent:
+                return Some("default")
+
+            return super()._find_and_parse(parent, key)
+
+    schema = p.obj({"upper": Upper(), "default": Default()})
+
+    for parse in [schema.parse, schema.compile("closure").parse, schema.compile("codegen").parse]:
+        assert parse({"upper": "a"}) == {"upper": "A", "default": "default"}
+        assert parse({"upper": "a", "default": "b"}) == {"upper": "A", "default": "b"}
+
+    assert p.array(Upper()).parse(["a", "b"]) == ["A", "B"]
+    assert p.array(Upper()).parse_many([["a"]]) == [["A"]]
+
+    # one of the find methods has to be implemented
+    class Broken(ParasiteType[Any]):
+        def parse(self, obj: Any) -> Any:
+            return obj
+
+    with pytest.raises(NotImplementedError):
+        Broken()._find_and_parse_raw({}, "key")
@@ -0,0 +1,183 @@
+import re
+from typing import Any, Callable
+
+import pytest
+from rusttypes.result import Ok
+from parasite import p
+from parasite.errors import ValidationError
+from parasite.type import ParasiteType
+
+VALUES: list[Any] = [
+    None,
+    True,
+    False,
+    0,
+    1,
+    -1,
+    42,
+    1.0,
+    1.5,
+    -3.7,
+    float("nan"),
+    "",
+    "hello",
+    "  Hello World  ",
+    "yes",
+    "No",
+    "0",
+    "john@example.com",
+    "https://example.com",
+    "123e4567-e89b-42d3-a456-426614174000",
+    "01ARZ3NDEKTSV4RRFFQ69G5FAV",
+    "192.168.0.1",
+    [],
+    [1, 2, 3],
+    ["a", "b"],
+    [1, "a", None],
+    {},
+    {"name": "John"},
+    {"name": "John", "age": 42},
+    {"name": "John", "age": 4.2},
+    {"name": None, "age": 42},
+    {"name": "John", "age": 42, "extra": True},
+    {"name": "John", "tags": ["a", "b"], "sub": {"id": 1}},
+    {"name": "John", "tags": ["a", 1], "sub": {"id": "1"}},
+    (),
+    object,
+]
+
+SCHEMAS: list[Callable[[], ParasiteType]] = [
+    lambda: p.any(),
+    lambda: p.never(),
+    lambda: p.null(),
+    lambda: p.boolean(),
+    lambda: p.boolean().leaniant(),
+    lambda: p.boolean().leaniant(r"^(si)$", r"^(no)$").literal(False),
+    lambda: p.boolean().literal(True),
+    lambda: p.boolean().leaniant(r"^y.*$", r"^(yes|no)$"),
+    lambda: p.number(),
+    lambda: p.number().integer(),
+    lambda: p.number().integer().gt(0.5).lt(42.5),
+    lambda: p.number().gte(-1).lte(1.5),
+    lambda: p.number().positive(),
+    lambda: p.string(),
+    lambda: p.string().min(1).max(5),
+    lambda: p.string().trim().to_lower().transform_before_parse().starts_with("hello"),
+    lambda: p.string().trim().to_upper().ends_with("D"),
+    lambda: p.string().contains("@").email(),
+    lambda: p.string().url(),
+    lambda: p.string().uuid(),
+    lambda: p.string().ulid(),
+    lambda: p.string().ipv4(),
+    lambda: p.string().match(r"^[0-9]+$"),
+    lambda: p.string().match(r"^[0-9]+$").cached(2),
+    lambda: p.string().email().cached(),
+    lambda: p.string().one_of_formats(["uuid", "ulid", "cuid2"]),
+    lambda: p.string().one_of_formats(["email", "ipv4"]).cached(),
+    lambda: p.string().url().format_limit(12),
+    lambda: p.string().match(r"^[a-z]+$").format_limit(4),
+    lambda: p.string().literal("hello"),
+    lambda: p.array(),
+    lambda: p.array(p.number()).min(1).max(3),
+    lambda: p.array(p.string().to_upper()),
+    lambda: p.variant(),
+    lambda: p.variant([p.number().integer(), p.string().min(1), p.null()]),
+    lambda: p.variant(
+        [
+            p.obj({"name": p.string().literal("John"), "age": p.number().integer()}),
+            p.obj({"name": p.string().literal("Jane")}).strict(),
+        ]
+    ).discriminator("name"),
+    lambda: p.obj(),
+    lambda: p.obj({"name": p.string(), "age": p.number().integer().optional()}),
+    lambda: p.obj({"name": p.string().nullable(), "age": p.number()}).strict(),
+    lambda: p.obj({"name": p.string().to_upper(), "age": p.any().optional()}).strip(),
+    lambda: p.obj({"name": p.string().trim(), "age": p.null().optional()}).parse_mode("copy"),
+    lambda: p.obj(
+        {
+            "name": p.string().to_lower().nullable(),
+            "age": p.number().integer().optional(),
+            "tags": p.array(p.string()).optional(),
+            "sub": p.obj({"id": p.number()}).optional(),
+            "null": p.null().optional(),
+        }
+    ).parse_mode("copy_on_write"),
+    lambda: p.obj(
+        {
+            "name": p.string(),
+            "tags": p.array(p.string()).optional(),
+            "sub": p.obj({"id": p.number().integer()}).optional(),
+            "missing": p.never(),
+            "null": p.null().optional(),
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("backend", ["closure", "codegen"])
+@pytest.mark.parametrize("factory", SCHEMAS)
+def test_compile_equivalence(
+    factory: Callable[[], ParasiteType],
+    compile_schema: Callable[[ParasiteType], Any],
+    assert_equivalent: Callable[..., None],
+) -> None:
+    compiled = compile_schema(factory())
+
+    for value in VALUES:
+        assert_equivalent(factory(), value, compiled)
+
+
+@pytest.mark.parametrize("backend", ["closure", "codegen"])
+@pytest.mark.parametrize("factory", SCHEMAS)
+def test_compile_find_equivalence(
+    factory: Callable[[], ParasiteType],
+    compile_schema: Callable[[ParasiteType], Any],
+    assert_equivalent: Callable[..., None],
+) -> None:
+    schema = p.obj({"key": factory(), "opt": factory()})
+
+    if hasattr(schema._m_items["opt"], "optional"):
+        schema._m_items["opt"].optional()  # type: ignore
+
+    compiled = compile_schema(schema)
+
+    for value in VALUES:
+        assert_equivalent(schema, {"key": value, "opt": value}, compiled)
+        assert_equivalent(schema, {"key": value}, compiled)
+        assert_equivalent(schema, {}, compiled)
+
+
+def test_compile_schema() -> None:
+    schema = p.string()
+    compiled = schema.compile()
+
+    assert compiled.schema is schema
+    assert compiled.source is None
+    assert compiled("hello") == "hello"
+    assert compiled.function("hello") == "hello"
+    assert compiled.parse_safe("hello") == Ok("hello")
+    assert compiled.parse_safe(1).is_err()
+
+    with pytest.raises(ValidationError):
+        compiled.parse(1)
+
+
+def test_compile_snapshot() -> None:
+    schema = p.string()
+    compiled = schema.compile()
+    schema.min(10)
+
+    assert compiled.parse_safe("hello") == Ok("hello")
+    assert schema.parse_safe("hello").is_err()
+
+
+def test_compile_regex() -> None:
+    compiled = p.string().regex(re.compile(r"^a+$")).compile()
+
+    assert compiled.parse_safe("aaa") == Ok("aaa")
+    assert compiled.parse_safe("aba").is_err()
+
+
+def test_compile_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        p.string().compile("unknown")
@@ -0,0 +1,102 @@
+import re
+from typing import Callable
+
+import pytest
+from rusttypes.result import Ok
+from parasite import p
+from parasite.errors import ValidationError
+from parasite.type import ParasiteType
+
+
+def test_codegen_source() -> None:
+    compiled = p.obj({"name": p.string().min(1), "age": p.number().integer()}).compile("codegen")
+
+    assert compiled.source is not None
+    assert "obj.get('name', _NotFound)" in compiled.source
+    assert "isinstance(obj, str)" in compiled.source
+    assert "len(obj) < 1" in compiled.source
+    assert compiled.parse_safe({"name": "John", "age": 42}) == Ok({"name": "John", "age": 42})
+
+
+def test_codegen_deterministic() -> None:
+    def schema() -> ParasiteType:
+        return p.obj({"name": p.string(), "sub": p.obj({"id": p.number()}).optional()})
+
+    assert schema().compile("codegen").source == schema().compile("codegen").source
+
+
+@pytest.mark.parametrize("backend", ["codegen"])
+def test_codegen_quoting(assert_equivalent: Callable[..., None]) -> None:
+    for text in ["'", '"', "{}", "{0}", "\\", "\n", "'\"{x}\""]:
+        schema = p.obj({text: p.string().starts_with(text).ends_with(text).contains(text)})
+
+        assert_equivalent(schema, {text: text})
+        assert_equivalent(schema, {text: "x"})
+        assert_equivalent(schema, {text: None})
+        assert_equivalent(schema, {})
+
+
+@pytest.mark.parametrize("backend", ["codegen"])
+def test_codegen_keys(assert_equivalent: Callable[..., None]) -> None:
+    key = frozenset([1, 2])
+    schema = p.obj({1: p.number(), (1, "a"): p.string(), None: p.any(), key: p.boolean()}).strict()
+
+    assert_equivalent(schema, {1: 1, (1, "a"): "a", None: None, key: True})
+    assert_equivalent(schema, {1: 1, (1, "a"): "a", None: None, key: 1})
+    assert_equivalent(schema, {1: 1, (1, "a"): "a", key: True})
+    assert_equivalent(schema, {1: 1, (1, "a"): "a", None: None, key: True, 2: 2})
+
+
+@pytest.mark.parametrize("backend", ["codegen"])
+def test_codegen_bounds(assert_equivalent: Callable[..., None]) -> None:
+    inf = float("inf")
+
+    for schema in [
+        p.number().lt(inf),
+        p.number().gt(-inf),
+        p.number().lte(1e300).gte(-1e-300),
+        p.number().integer().gt(0.5).lt(10.9),
+    ]:
+        for value in [0, 1, 10, 11, 1.5, 1e301, -inf, inf, float("nan"), True, "1"]:
+            assert_equivalent(schema, value)
+
+
+@pytest.mark.parametrize("backend", ["codegen"])
+def test_codegen_regex(assert_equivalent: Callable[..., None]) -> None:
+    schema = p.string().regex(re.compile(r"^[a-z]+$", re.IGNORECASE))
+
+    for value in ["abc", "ABC", "a1", "", 1]:
+        assert_equivalent(schema, value)
+
+
+@pytest.mark.parametrize("backend", ["codegen"])
+def test_codegen_nested(assert_equivalent: Callable[..., None]) -> None:
+    schema = p.array(
+        p.variant(
+            [
+                p.obj({"type": p.boolean().literal(True), "items": p.array(p.number()).max(2)}),
+                p.obj({"type": p.boolean().literal(False)}).strip(),
+                p.array(p.array(p.string().trim())),
+            ]
+        )
+    )
+
+    for value in [
+        [{"type": True, "items": [1, 2]}],
+        [{"type": True, "items": [1, 2, 3]}],
+        [{"type": False, "items": [1, 2, 3]}],
+        [[["  a  "], []]],
+        [[["  a  ", 1]]],
+        [None],
+        None,
+    ]:
+        assert_equivalent(schema, value)
+
+
+def test_codegen_traceback() -> None:
+    compiled = p.obj({"name": p.string()}).compile("codegen")
+
+    with pytest.raises(ValidationError) as excinfo:
+        compiled.parse({"name": 1})
+
+    assert "expected a string, but got 1" in str(excinfo.value)
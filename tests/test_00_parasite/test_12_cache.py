@@ -0,0 +1,135 @@
+from enum import Enum
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from rusttypes.result import Ok
+from parasite import p, _codegen, cache as cache_module
+from parasite.cache import SUFFIX, SchemaCache
+from parasite.object import Object
+
+
+def _raise(*args, **kwargs):
+    raise AssertionError("source should not be generated")
+
+
+def test_cache_roundtrip(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, person: Callable[[], Object]
+) -> None:
+    cache = SchemaCache(tmp_path / "cache")
+    compiled = person().compile("codegen", cache=cache)
+
+    assert len(list(cache.directory.glob(f"*{SUFFIX}"))) == 1
+    assert compiled.parse_safe({"name": "John", "tags": ["A"]}) == Ok(
+        {"name": "John", "tags": ["a"]}
+    )
+
+    # a second compile has to load the entry instead of generating the source again
+    monkeypatch.setattr(_codegen, "generate", _raise)
+    loaded = person().compile("codegen", cache=cache)
+
+    assert loaded.source == compiled.source
+    assert loaded.parse_safe({"name": "John", "tags": ["A"]}) == Ok({"name": "John", "tags": ["a"]})
+    assert loaded.parse_safe({"name": ""}).is_err()
+
+
+def test_cache_key(tmp_path: Path, person: Callable[[], Object]) -> None:
+    cache = SchemaCache(tmp_path)
+
+    assert cache.key(person()) == cache.key(person())
+    assert cache.key(person()) != cache.key(person().strict())
+    assert cache.key(p.number().lt(1)) != cache.key(p.number().lt(1.0))
+    assert cache.key(p.obj({frozenset([1]): p.string()})) is None
+
+
+def test_cache_schema_change(tmp_path: Path, person: Callable[[], Object]) -> None:
+    cache = SchemaCache(tmp_path)
+    person().compile("codegen", cache=cache)
+    compiled = person().strict().compile("codegen", cache=cache)
+
+    assert len(list(tmp_path.glob(f"*{SUFFIX}"))) == 2
+    assert compiled.parse_safe({"name": "John", "extra": 1}).is_err()
+
+
+def test_cache_version_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, person: Callable[[], Object]
+) -> None:
+    cache = SchemaCache(tmp_path)
+    key = cache.key(person())
+    person().compile("codegen", cache=cache)
+
+    monkeypatch.setattr(cache_module, "_build_tag", lambda: "other")
+
+    assert cache.key(person()) != key
+    assert cache._read(tmp_path / f"{key}{SUFFIX}") is None
+
+
+def test_cache_corrupted(tmp_path: Path, person: Callable[[], Object]) -> None:
+    cache = SchemaCache(tmp_path)
+    (tmp_path / f"{cache.key(person())}{SUFFIX}").write_bytes(b"garbage")
+    compiled = person().compile("codegen", cache=cache)
+
+    assert compiled.parse_safe({"name": "John"}) == Ok({"name": "John"})
+    assert cache._read(tmp_path / f"{cache.key(person())}{SUFFIX}") is not None
+
+
+def test_cache_write_failed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, person: Callable[[], Object]
+) -> None:
+    def replace(*args, **kwargs):
+        raise OSError("disk full")
+
+    # a failed write leaves no temporary file behind, and the schema is still compiled
+    cache = SchemaCache(tmp_path)
+    monkeypatch.setattr(cache_module.os, "replace", replace)
+    assert person().compile("codegen", cache=cache).parse({"name": "a"}) == {"name": "a"}
+    assert not list(tmp_path.iterdir())
+
+
+def test_cache_not_portable(tmp_path: Path) -> None:
+    cache = SchemaCache(tmp_path)
+    compiled = p.obj({frozenset([1]): p.string()}).compile("codegen", cache=cache)
+
+    assert compiled.parse_safe({frozenset([1]): "a"}) == Ok({frozenset([1]): "a"})
+    assert not list(tmp_path.glob(f"*{SUFFIX}"))
+
+
+def test_cache_not_portable_fingerprint(tmp_path: Path) -> None:
+    class Key(Enum):
+        A = "a"
+
+    # enum keys can be fingerprinted, but are runtime objects in the generated source
+    cache = SchemaCache(tmp_path)
+    schema = p.obj({Key.A: p.string()})
+    compiled = schema.compile("codegen", cache=cache)
+
+    assert cache.key(schema) is not None
+    assert compiled.parse_safe({Key.A: "a"}) == Ok({Key.A: "a"})
+    assert compiled.parse_safe({}).is_err()
+    assert not list(tmp_path.glob(f"*{SUFFIX}"))
+
+
+def test_cache_string_cached(tmp_path: Path) -> None:
+    # the memo of cached formats is a runtime object, so the schema is never written
+    cache = SchemaCache(tmp_path)
+    email = p.string().email().cached(16)
+    compiled = p.obj({"e": email}).compile("codegen", cache=cache)
+
+    assert compiled.parse_safe({"e": "a@b.co"}) == Ok({"e": "a@b.co"})
+    assert compiled.parse_safe({"e": "a@b.co"}) == Ok({"e": "a@b.co"})
+    assert compiled.parse_safe({"e": "a"}).is_err()
+    assert email.cache_info()[:2] == (1, 1)
+    assert not list(tmp_path.glob(f"*{SUFFIX}"))
+
+
+def test_cache_clear(tmp_path: Path, person: Callable[[], Object]) -> None:
+    cache = SchemaCache(tmp_path)
+    person().compile("codegen", cache=cache)
+    cache.clear()
+
+    assert not list(tmp_path.glob(f"*{SUFFIX}"))
+
+
+def test_cache_backend(tmp_path: Path, person: Callable[[], Object]) -> None:
+    with pytest.raises(ValueError):
+        person().compile(cache=SchemaCache(tmp_path))
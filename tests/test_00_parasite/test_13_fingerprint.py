@@ -0,0 +1,105 @@
+import re
+from dataclasses import FrozenInstanceError
+from typing import Callable
+
+import pytest
+from rusttypes.result import Ok
+from parasite import p
+from parasite.object import Object
+
+
+def test_fingerprint_deterministic(person: Callable[[], Object]) -> None:
+    assert person().fingerprint() == person().fingerprint()
+    assert len(person().fingerprint()) == 64
+
+
+def test_fingerprint_changes(person: Callable[[], Object]) -> None:
+    fingerprints = {
+        person().fingerprint(),
+        person().strip().fingerprint(),
+        p.obj({"a": p.string(), "b": p.number()}).fingerprint(),
+        p.obj({"b": p.number(), "a": p.string()}).fingerprint(),
+        p.string().fingerprint(),
+        p.string().min(1).fingerprint(),
+        p.string().match(r"^a$").fingerprint(),
+        p.string().regex(re.compile(r"^a$", re.IGNORECASE)).fingerprint(),
+        p.number().lt(1).fingerprint(),
+        p.number().lt(1.0).fingerprint(),
+        p.number().lte(1).fingerprint(),
+        p.variant([p.string(), p.number()]).fingerprint(),
+        p.variant([p.number(), p.string()]).fingerprint(),
+        p.array(p.string()).fingerprint(),
+        p.array(p.string().optional()).fingerprint(),
+    }
+
+    assert len(fingerprints) == 15
+
+
+def test_fingerprint_unsupported() -> None:
+    with pytest.raises(TypeError):
+        p.obj({object(): p.string()}).fingerprint()
+
+
+def test_freeze(person: Callable[[], Object]) -> None:
+    schema = person().freeze()
+
+    assert schema.frozen
+    assert schema._m_items["name"].frozen
+    assert schema._m_items["tags"]._m_element.frozen
+    assert schema._m_items["sub"]._m_items["flag"].frozen
+    assert schema.parse_safe({"name": "John", "sub": {"id": 1, "flag": "yes"}}) == Ok(
+        {"name": "John", "sub": {"id": 1, "flag": True}}
+    )
+
+    with pytest.raises(FrozenInstanceError):
+        schema.strip()
+
+    with pytest.raises(FrozenInstanceError):
+        schema._m_items["name"].max(5)
+
+    with pytest.raises(FrozenInstanceError):
+        schema.add_item("extra", p.string())
+
+    with pytest.raises(FrozenInstanceError):
+        schema._m_items["tags"]._m_element.to_upper()
+
+    with pytest.raises(FrozenInstanceError):
+        p.array(p.variant([p.string()])).freeze()._m_element.add_variant(p.null())
+
+    assert schema == person()
+    assert schema.fingerprint() == person().fingerprint()
+
+
+def test_freeze_integer_bounds() -> None:
+    schema = p.number().integer().gt(0.5).lt(10.5).freeze()
+
+    assert schema.parse_safe(1) == Ok(1)
+    assert schema.parse_safe(11).is_err()
+
+
+def test_freeze_pick(person: Callable[[], Object]) -> None:
+    schema = person().freeze()
+    picked = schema.pick(["name"])
+
+    assert picked.frozen
+    assert list(picked._m_items) == ["name"]
+    assert picked.fingerprint() != schema.fingerprint()
+    assert list(schema.omit(["name"])._m_items) == ["age", "tags", "sub"]
+
+
+def test_hash(person: Callable[[], Object]) -> None:
+    registry = {person().freeze(): "person", p.string().freeze(): "string"}
+
+    assert registry[person().freeze()] == "person"
+    assert registry[p.string().freeze()] == "string"
+    assert len({p.number().lt(1).freeze(), p.number().lt(1.0).freeze()}) == 1
+
+    # equal schemas have to hash equal, even if their fingerprints differ
+    first = p.obj({"a": p.any(), "b": p.any()}).freeze()
+    second = p.obj({"b": p.any(), "a": p.any()}).freeze()
+
+    assert first == second and hash(first) == hash(second)
+    assert first.fingerprint() != second.fingerprint()
+
+    with pytest.raises(TypeError):
+        hash(p.string())
@@ -0,0 +1,62 @@
+from typing import Any, Callable
+
+import pytest
+from rusttypes.result import Ok
+from parasite.errors import ValidationError
+from parasite.object import Object
+from parasite.type import ParasiteType
+
+
+def test_parse_many(person: Callable[[], Object]) -> None:
+    data = [{"name": " John ", "age": 42}, {"name": "Jane"}]
+
+    assert person().parse_many(data) == [{"name": "John", "age": 42}, {"name": "Jane"}]
+    assert person().parse_many(iter([])) == []
+    assert person().parse_many({"name": str(i)} for i in range(3)) == [
+        {"name": "0"},
+        {"name": "1"},
+        {"name": "2"},
+    ]
+
+
+def test_parse_many_error(person: Callable[[], Object]) -> None:
+    with pytest.raises(ValidationError) as excinfo:
+        person().parse_many([{"name": "John"}, {"name": "Jane", "age": 4.2}, {}])
+
+    assert str(excinfo.value).startswith("object at index 1 is invalid: ")
+
+
+def test_parse_many_safe(person: Callable[[], Object]) -> None:
+    data = [{"name": "John"}, {"name": "Jane", "age": 4.2}, None, {"name": " Max "}]
+    results = person().parse_many_safe(data)
+
+    assert len(results) == 4
+    assert results[0] == Ok({"name": "John"})
+    assert results[1].is_err()
+    assert results[2].is_err()
+    assert results[3] == Ok({"name": "Max"})
+    assert str(results[1].unwrap_err()) == str(person().parse_safe(data[1]).unwrap_err())
+
+
+@pytest.mark.parametrize("backend", ["closure", "codegen"])
+def test_parse_many_compiled(
+    person: Callable[[], Object], compile_schema: Callable[[ParasiteType], Any]
+) -> None:
+    compiled = compile_schema(person())
+
+    assert compiled.parse_many([{"name": " John "}]) == [{"name": "John"}]
+    assert compiled.parse_many_safe([{"name": 1}])[0].is_err()
+
+
+def test_parse_many_frozen(person: Callable[[], Object]) -> None:
+    schema = person().freeze()
+    schema.parse_many([{"name": "John"}])
+    compiled = schema._c_compiled
+
+    assert compiled is not None
+    schema.parse_many_safe([{"name": "John"}])
+    assert schema._c_compiled is compiled
+
+    unfrozen = person()
+    unfrozen.parse_many([{"name": "John"}])
+    assert unfrozen._c_compiled is None
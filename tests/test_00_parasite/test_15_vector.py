@@ -0,0 +1,154 @@
+import array
+from typing import Any, Callable
+
+import pytest
+from parasite import _vector, p
+from parasite.errors import ValidationError
+from parasite.type import ParasiteType
+
+N = _vector.THRESHOLD
+
+SCHEMAS: list[Callable[[], ParasiteType]] = [
+    lambda: p.array(p.number()),
+    lambda: p.array(p.number().integer().min(0).max(255)),
+    lambda: p.array(p.number().integer().gt(0.5).lt(300.5)).min(N).max(2 * N),
+    lambda: p.array(p.number().gte(-1.5).lte(1000)),
+    lambda: p.array(p.number().gt(2**60)),
+]
+
+VALUES: list[Any] = [
+    list(range(N)),
+    list(range(1, N + 1)),
+    [i % 256 for i in range(2 * N)],
+    [*range(N - 1), 256],
+    [*range(N - 1), -1],
+    [*range(N - 1), 1.5],
+    [*range(N - 1), True],
+    [*range(N - 1), "1"],
+    [*range(N - 1), 2**70],
+    [*range(N - 1), 2**60],
+    [float(i) for i in range(N)],
+    [*(i / 2 for i in range(N - 1)), float("nan")],
+    [*(i / 2 for i in range(N - 1)), float("inf")],
+    [*range(N - 1), float("-inf")],
+    list(range(3)),
+    list(range(3 * N)),
+]
+
+def _outcome(schema: Any, value: Any) -> Any:
+    try:
+        return ("ok", schema.parse(value))
+
+    except ValidationError as exc:
+        return ("err", str(exc))
+
+
+@pytest.mark.parametrize("factory", SCHEMAS)
+def test_vector_equivalence(
+    factory: Callable[[], ParasiteType],
+    compile_schema: Callable[[ParasiteType], Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    vectorized = [_outcome(compile_schema(factory()), value) for value in VALUES]
+
+    # without numpy, every list is parsed value by value
+    monkeypatch.setattr(_vector, "np", None)
+    expected = [_outcome(compile_schema(factory()), value) for value in VALUES]
+
+    assert vectorized == expected
+
+
+def test_vector_identity(compile_schema: Callable[[ParasiteType], Any]) -> None:
+    value = list(range(N))
+    assert compile_schema(p.array(p.number().integer().min(0))).parse(value) is value
+
+
+def test_vector_first_invalid() -> None:
+    pytest.importorskip("numpy")
+
+    bounds = ((">", 255), ("<", 0))
+
+    assert _vector.first_invalid(list(range(N)), True, ()) == N
+    assert _vector.first_invalid([*range(N), 256, -1], True, bounds) == 256
+    assert _vector.first_invalid([*range(N), 1.0], True, bounds) is None
+    assert _vector.first_invalid([*range(N), False], False, bounds) is None
+    assert _vector.first_invalid([*range(N), 2**64], False, bounds) is None
+    assert _vector.first_invalid(list(range(3)), True, bounds) is None
+    assert _vector.first_invalid((1, 2, 3), True, bounds) is None
+
+
+def test_vector_numpy(compile_schema: Callable[[ParasiteType], Any]) -> None:
+    np = pytest.importorskip("numpy")
+
+    parse = compile_schema(p.array(p.number().integer().min(0).max(255))).parse
+    array = np.arange(256, dtype=np.uint8)
+
+    assert parse(array) is array
+    assert compile_schema(p.array(p.number())).parse(array / 2) is not None
+
+    with pytest.raises(ValidationError, match="element at index 3 is invalid: .* 256"):
+        parse(np.array([1, 2, 3, 256]))
+
+    # arrays, that cannot be validated at once, are validated element by element
+    assert parse(np.array([1, 2], dtype=object)) is not None
+
+    with pytest.raises(ValidationError, match="index 0 is invalid: .* integer, but is 0.0$"):
+        parse(array / 2)
+
+    with pytest.raises(ValidationError, match="index 0 is invalid: .* number, but is"):
+        parse(np.zeros((2, 2), dtype=np.int64))
+
+    with pytest.raises(ValidationError, match="at most 2 elements"):
+        compile_schema(p.array(p.number()).max(2)).parse(array)
+
+
+def test_vector_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_vector, "np", None)
+
+    assert not _vector.applicable(list(range(N)))
+    assert _vector.applicable(b"")
+    assert _vector.first_invalid(list(range(N)), True, ()) is None
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_vector_buffer(
+    compile_schema: Callable[[ParasiteType], Any], numpy: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(_vector, "np", None)
+
+    byte = p.array(p.number().integer().min(0).max(255))
+    positive = p.array(p.number().gt(0))
+
+    for value in [
+        bytes(range(256)),
+        bytearray(range(256)),
+        array.array("B", range(256)),
+        array.array("q", range(256)),
+        memoryview(array.array("h", range(256)))[::2],
+        b"",
+    ]:
+        assert compile_schema(byte).parse(value) is value
+
+    assert compile_schema(positive).parse(array.array("d", [1.5, float("nan")])) is not None
+    assert compile_schema(positive).parse(array.array("f", [0.1, 2.0])) is not None
+
+    with pytest.raises(ValidationError, match="index 0 is invalid: .* integer, but is 1.0$"):
+        compile_schema(byte).parse(array.array("d", [1.0, 2.0]))
+
+    with pytest.raises(ValidationError, match="index 2 is invalid: .* >='0', but is -3$"):
+        compile_schema(byte).parse(array.array("i", [1, 2, -3, -4]))
+
+    with pytest.raises(ValidationError, match="index 1 is invalid: .* > '0', but is 0.0$"):
+        compile_schema(positive).parse(array.array("f", [1.5, 0.0]))
+
+    with pytest.raises(ValidationError, match="at least 3 elements, but has 2"):
+        compile_schema(byte.min(3)).parse(b"ab")
+
+    with pytest.raises(ValidationError, match="index 0 is invalid: .* number, but is"):
+        compile_schema(byte).parse(memoryview(bytes(6)).cast("B", (3, 2)))
+
+    with pytest.raises(ValidationError, match="has to be a list"):
+        compile_schema(p.array(p.string())).parse(b"ab")
@@ -0,0 +1,95 @@
+import copy
+from typing import Any, Callable
+
+import pytest
+from parasite import p
+from parasite.errors import ValidationError
+from parasite.object import Object
+
+
+def _errors(schema: Any, obj: Any, **kwargs: Any) -> list[tuple[Any, ...]]:
+    with pytest.raises(ValidationError) as excinfo:
+        schema.parse(obj, collect_errors=True, **kwargs)
+
+    return [(error.path, error.code, error.value) for error in excinfo.value.errors]
+
+
+def test_collect_errors(person: Callable[[], Object]) -> None:
+    data = {"age": 4.2, "tags": [" a ", 1, None], "sub": {"id": "1", "flag": None, "x": 0}}
+
+    assert _errors(person(), data) == [
+        (("name",), "missing_key", None),
+        (("age",), "not_integer", 4.2),
+        (("tags",), "too_long", [" a ", 1, None]),
+        (("tags", 1), "invalid_type", 1),
+        (("tags", 2), "invalid_type", None),
+        (("sub", "x"), "unknown_key", 0),
+        (("sub", "id"), "invalid_type", "1"),
+    ]
+
+
+def test_collect_errors_detail(person: Callable[[], Object]) -> None:
+    schema = person()
+
+    with pytest.raises(ValidationError) as excinfo:
+        schema.parse({"name": "", "tags": [], "sub": None}, collect_errors=True)
+
+    name, sub = excinfo.value.errors
+
+    assert name.schema is schema._m_items["name"]
+    assert name.message == "length of value '' is less than 1"
+    assert str(name) == f"at ('name',): {name.message}"
+    assert sub.schema is schema._m_items["sub"]
+    assert sub.code == "not_nullable"
+    assert str(excinfo.value).startswith("object is invalid, found 2 errors: at ('name',): ")
+
+
+def test_collect_errors_root() -> None:
+    assert _errors(p.number(), "1") == [((), "invalid_type", "1")]
+    assert _errors(p.obj(), []) == [((), "invalid_type", [])]
+    assert _errors(p.array(p.number()), {}) == [((), "invalid_type", {})]
+
+
+def test_collect_errors_max(person: Callable[[], Object]) -> None:
+    data = {"tags": [1, 2, 3, 4], "sub": {}}
+
+    assert len(_errors(person(), data)) == 8
+    assert _errors(person(), data, max_errors=2) == [
+        (("name",), "missing_key", None),
+        (("tags",), "too_long", [1, 2, 3, 4]),
+    ]
+
+    with pytest.raises(ValueError):
+        person().parse({}, collect_errors=True, max_errors=0)
+
+
+def test_collect_errors_valid(person: Callable[[], Object]) -> None:
+    data = {"name": "John", "tags": [" a "], "sub": {"id": 1, "flag": None}}
+
+    assert person().parse(copy.deepcopy(data), collect_errors=True) == person().parse(data)
+    assert person().parse_safe(data, collect_errors=True).is_ok()
+    assert person().parse_safe({}, collect_errors=True).unwrap_err().errors
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        None,
+        {},
+        {"name": 1},
+        {"name": "John", "tags": "a", "sub": {}},
+        {"name": "John", "tags": ["a", "b", "c"], "sub": {"id": 1}},
+        {"name": "John", "tags": ["a", 2], "sub": {"id": 1}},
+        {"name": "John", "tags": [], "sub": {"id": 1, "x": 1}},
+    ],
+)
+def test_collect_errors_first(obj: Any, person: Callable[[], Object]) -> None:
+    with pytest.raises(ValidationError) as expected:
+        person().parse(copy.deepcopy(obj))
+
+    with pytest.raises(ValidationError) as actual:
+        person().parse(copy.deepcopy(obj), collect_errors=True)
+
+    # the first collected error is the error raised without collecting
+    assert str(expected.value).endswith(actual.value.errors[0].message)
+    assert expected.value.errors == []
@@ -0,0 +1,80 @@
+from typing import Any, Callable
+
+import pytest
+from parasite import p
+from parasite.errors import ValidationError
+from parasite.type import ParasiteType
+
+def _error(schema: Any, value: Any) -> ValidationError:
+    with pytest.raises(ValidationError) as excinfo:
+        schema.parse(value)
+
+    return excinfo.value
+
+
+def test_error_structure(compile_schema: Callable[[ParasiteType], Any]) -> None:
+    schema = compile_schema(
+        p.obj(
+            {
+                "name": p.string().min(1),
+                "tags": p.array(p.obj({"id": p.number().integer()})).max(2),
+                "sub": p.obj({"flag": p.boolean()}).strict(),
+                "any": p.variant([p.number(), p.null()]).optional(),
+            }
+        )
+    )
+    valid = {"name": "John", "tags": [{"id": 1}], "sub": {"flag": True}}
+
+    for value, code, path, offending in [
+        ([], "invalid_type", (), []),
+        ({}, "missing_key", ("name",), None),
+        ({**valid, "name": None}, "not_nullable", ("name",), None),
+        ({**valid, "name": ""}, "too_short", ("name",), ""),
+        ({**valid, "tags": [{}] * 3}, "too_long", ("tags",), [{}] * 3),
+        ({**valid, "tags": [{"id": 1}, {"id": 1.5}]}, "not_integer", ("tags", 1, "id"), 1.5),
+        ({**valid, "tags": [{"id": 1}, {}]}, "missing_key", ("tags", 1, "id"), None),
+        ({**valid, "sub": {"flag": True, "x": 2}}, "unknown_key", ("sub", "x"), 2),
+        ({**valid, "sub": {"flag": "1"}}, "invalid_type", ("sub", "flag"), "1"),
+        ({**valid, "any": "1"}, "no_variant", ("any",), "1"),
+    ]:
+        error = _error(schema, value)
+        assert (error.code, error.path, error.value) == (code, path, offending)
+
+
+def test_error_message(compile_schema: Callable[[ParasiteType], Any]) -> None:
+    schema = compile_schema(p.array(p.obj({"id": p.number().integer().gte(0)})))
+    error = _error(schema, [{"id": 1}, {"id": -1}])
+
+    assert str(error) == "element at index 1 is invalid: object has to be >='0', but is -1"
+    assert repr(error) == f"ValidationError({str(error)!r})"
+    assert error.message is error.message
+
+
+def test_error_lazy() -> None:
+    class Value:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def __repr__(self) -> str:
+            self.calls += 1
+            return "Value()"
+
+    value = Value()
+    schema = p.variant([p.number(), p.string(), p.array()])
+
+    assert schema.parse_safe(value).is_err()
+    assert p.array(p.number()).parse_safe([value]).is_err()
+    assert value.calls == 0
+
+    error = _error(schema, value)
+    assert str(error).endswith("but is Value()")
+    assert str(error).endswith("but is Value()")
+    assert value.calls == 1
+
+
+def test_error_defaults() -> None:
+    error = ValidationError("value {} is invalid")
+
+    assert str(error) == "value {} is invalid"
+    assert (error.code, error.path, error.value, error.errors) == ("invalid_value", (), None, [])
+    assert str(ValidationError("value {!r} is invalid", "a", code="x")) == "value 'a' is invalid"
@@ -0,0 +1,146 @@
+import itertools
+import socket
+from typing import Any, Callable
+
+import pytest
+from parasite import _const, _formats, p
+from parasite.type import ParasiteType
+
+OCTETS: list[str] = [
+    "",
+    "0",
+    "00",
+    "01",
+    "1",
+    "9",
+    "10",
+    "99",
+    "100",
+    "199",
+    "200",
+    "249",
+    "250",
+    "255",
+    "256",
+    "300",
+    "1000",
+    "0x1",
+    "a",
+    " 1",
+    "1\n",
+    "١",
+]
+
+
+def _regex(value: str) -> bool:
+    return _const.RE_IPV4.match(value) is not None
+
+
+def test_formats_ipv4_equivalence() -> None:
+    for octets in itertools.product(OCTETS, repeat=4):
+        value = ".".join(octets)
+        assert _formats.ipv4(value) == _regex(value), value
+
+    for value in ["", ".", "1.2.3", "1.2.3.4.", "1.2.3.4.5", "1:2:3:4", "1.2.3.4\n\n", "\n1.2.3.4"]:
+        assert _formats.ipv4(value) == _regex(value), value
+
+
+def test_formats_select(monkeypatch: pytest.MonkeyPatch) -> None:
+    def lenient(family: int, value: str) -> bytes:
+        return b"\x00" * 4
+
+    # a platform parser, that disagrees with the regex, is not used
+    monkeypatch.setattr(socket, "inet_pton", lenient)
+    ipv4 = _formats._select(_formats._ipv4, _const.RE_IPV4, _formats.PROBES_IPV4)
+
+    assert ipv4 is not _formats._ipv4
+    assert ipv4("1.2.3.4") and not ipv4("01.2.3.4")
+
+
+def test_formats_string(compile_schema: Callable[[ParasiteType], Any]) -> None:
+    parse = compile_schema(p.string().ipv4()).parse_safe
+
+    assert parse("192.168.0.1").is_ok()
+    assert parse("192.168.0.1\n").is_ok()
+    assert parse("192.168.00.1").unwrap_err().code == "invalid_string"
+
+
+def test_formats_email() -> None:
+    values = [
+        "john@example.com",
+        "john.doe+tag@mail.example.com",
+        "j!#$%&'*+/=?^_`{|}~-@example.com",
+        "john@example.com\n",
+        "John@example.com",
+        "john@@example.com",
+        "john@example..com",
+        "john.@example.com",
+        "john example@example.com",
+        "johnexample.com",
+        "jöhn@example.com",
+        "@example.com",
+        "john@",
+        "",
+    ]
+
+    for value in values:
+        assert _formats.email(value) == (_const.RE_EMAIL.match(value) is not None), value
+
+    # the length limits of RFC 5321 apply on top of the regex
+    assert _formats.email("j" * 64 + "@example.com")
+    assert not _formats.email("j" * 65 + "@example.com")
+    assert _formats.email("john@" + "e" * 245 + ".com")
+    assert not _formats.email("john@" + "e" * 246 + ".com")
+
+
+def test_formats_classifier() -> None:
+    values = [
+        "john@example.com",
+        "c" + "x" * 70 + "@example.com",
+        "https://example.com/(a)",
+        "123e4567-e89b-42d3-a456-426614174000",
+        "cabcdefghij",
+        "abc1",
+        "01ARZ3NDEKTSV4RRFFQ69G5FAV",
+        "192.168.0.1",
+        "192.168.0.1\n",
+        "2001:db8::8a2e:370:7334",
+        "fe80::1",
+        "hello world",
+        "",
+    ]
+
+    def first(names: tuple[str, ...], value: str) -> str | None:
+        for name in names:
+            if _formats.email(value) if name == "email" else _formats.PATTERNS[name].match(value):
+                return name
+        return None
+
+    for names in [
+        tuple(_formats.PATTERNS),
+        *itertools.permutations(["email", "url", "cuid", "cuid2", "ipv4"], 3),
+    ]:
+        classify = _formats.classifier(names)
+        for value in values:
+            assert classify(value) == first(names, value), (names, value)
+
+
+def test_formats_lengths() -> None:
+    parser = pytest.importorskip("re._parser")
+
+    # the lengths match the widths of the regexes, which are huge if unbounded
+    for name, pattern in _formats.PATTERNS.items():
+        ll, ul = parser.parse(pattern.pattern).getwidth()
+        assert _formats.LENGTHS[name] == (ll, ul if ul < 2**32 else None), name
+
+
+def test_formats_bounds() -> None:
+    assert _formats.bounds(("uuid",)) == (36, 37)
+    assert _formats.bounds(("uuid", "ulid", "ipv4")) == (7, 37)
+    assert _formats.bounds(("email",)) == (5, _formats.MAX_EMAIL)
+    assert _formats.bounds(("email", "url")) == (5, _formats.MAX_URL)
+    assert _formats.bounds(("email", "cuid2")) == (1, None)
+    assert _formats.bounds(("email", "cuid2", "uuid"), 100) == (1, 100)
+    assert _formats.bounds(("uuid",), 10) == (36, 37)
+    assert _formats.bounds(()) == (0, None)
+    assert _formats.bounds((), 10) == (0, 10)